@@ -0,0 +1,228 @@
+"""Benchmark for the CDP Mode websocket Listener.
+Replays an event stream (like the one that Chrome sends while pages
+load: Network and Page events, plus command responses) through a
+Listener with a fake websocket, and measures how fast it's consumed:
+    * With handlers for Page.loadEventFired / Page.frameStoppedLoading
+      only. (Other events are skipped without decoding their JSON)
+    * With handlers for every event in the stream. (Everything is parsed)
+(No browser is needed.)
+
+Usage:
+    python cdp_listener_benchmark.py  # (Timing of a synthetic stream)
+    python cdp_listener_benchmark.py recording.jsonl  # (A recorded stream)
+    pytest cdp_listener_benchmark.py  # (Checks what gets parsed)
+A recording has one raw websocket message per line."""
+import asyncio
+import json
+import sys
+import time
+import mycdp as cdp
+from seleniumbase.undetected.cdp_driver import connection
+
+PAGE_LOADS = 50
+REQUESTS_PER_PAGE = 200
+SUBSCRIBED_EVENTS = (cdp.page.LoadEventFired, cdp.page.FrameStoppedLoading)
+
+
+def message(method, params):
+    """Returns a websocket message formatted like the ones from Chrome."""
+    return json.dumps(
+        {"method": method, "params": params, "sessionId": "S1"},
+        separators=(",", ":"),
+    )
+
+
+def make_stream(page_loads, requests_per_page):
+    """Returns a list of websocket messages for the page loads."""
+    messages = []
+    command_id = 1
+    for page in range(page_loads):
+        frame_id = "F%s" % page
+        loader_id = "L%s" % page
+        for name in ("init", "DOMContentLoaded"):
+            messages.append(message(
+                "Page.lifecycleEvent",
+                {
+                    "frameId": frame_id,
+                    "loaderId": loader_id,
+                    "name": name,
+                    "timestamp": 1.5,
+                },
+            ))
+        for i in range(requests_per_page):
+            request_id = "R%s.%s" % (page, i)
+            url = "https://example.com/%s/asset_%s.js" % (page, i)
+            headers = {"Accept": "*/*", "User-Agent": "Mozilla/5.0"}
+            messages.append(message(
+                "Network.requestWillBeSent",
+                {
+                    "requestId": request_id,
+                    "loaderId": loader_id,
+                    "documentURL": "https://example.com/%s" % page,
+                    "request": {
+                        "url": url,
+                        "method": "GET",
+                        "headers": headers,
+                        "initialPriority": "High",
+                        "referrerPolicy": "strict-origin",
+                    },
+                    "timestamp": 2.5,
+                    "wallTime": 1700000000.5,
+                    "initiator": {"type": "parser"},
+                    "redirectHasExtraInfo": False,
+                    "type": "Script",
+                    "frameId": frame_id,
+                },
+            ))
+            messages.append(message(
+                "Network.responseReceived",
+                {
+                    "requestId": request_id,
+                    "loaderId": loader_id,
+                    "timestamp": 2.6,
+                    "type": "Script",
+                    "response": {
+                        "url": url,
+                        "status": 200,
+                        "statusText": "OK",
+                        "headers": {"Content-Type": "text/javascript"},
+                        "mimeType": "text/javascript",
+                        "charset": "utf-8",
+                        "connectionReused": True,
+                        "connectionId": 7,
+                        "encodedDataLength": 300,
+                        "securityState": "secure",
+                    },
+                    "hasExtraInfo": False,
+                    "frameId": frame_id,
+                },
+            ))
+            for _ in range(3):
+                messages.append(message(
+                    "Network.dataReceived",
+                    {
+                        "requestId": request_id,
+                        "timestamp": 2.7,
+                        "dataLength": 4096,
+                        "encodedDataLength": 1024,
+                    },
+                ))
+            messages.append(message(
+                "Network.loadingFinished",
+                {
+                    "requestId": request_id,
+                    "timestamp": 2.8,
+                    "encodedDataLength": 3372,
+                },
+            ))
+            if i % 20 == 0:
+                messages.append(json.dumps({"id": command_id, "result": {}}))
+                command_id += 1
+        messages.append(message("Page.loadEventFired", {"timestamp": 3.5}))
+        messages.append(message(
+            "Page.frameStoppedLoading", {"frameId": frame_id}
+        ))
+    return messages
+
+
+class FakeWebsocket:
+    """Returns the messages from recv(), and then reports a closed socket.
+    (Which ends the listener loop)"""
+
+    def __init__(self, messages):
+        self.messages = iter(messages)
+        self.closed = False
+
+    async def recv(self):
+        try:
+            return next(self.messages)
+        except StopIteration:
+            self.closed = True
+            raise ConnectionError("The replay is over.")
+
+
+def get_event_types(messages):
+    event_types = set()
+    for msg in messages:
+        method = json.loads(msg).get("method")
+        if method in cdp.util._event_parsers:
+            event_types.add(cdp.util._event_parsers[method])
+    return event_types
+
+
+async def replay(messages, event_types):
+    """Replays the messages through a Listener. Returns
+    (seconds, {event type: number of events received})."""
+    conn = connection.Connection()
+    conn.websocket = FakeWebsocket(messages)
+    received = {}
+
+    def handler(event):
+        event_type = type(event)
+        received[event_type] = received.get(event_type, 0) + 1
+
+    for event_type in event_types:
+        conn.add_handler(event_type, handler)
+    start = time.perf_counter()
+    listener = connection.Listener(conn)
+    await listener.task
+    return time.perf_counter() - start, received
+
+
+def test_unsubscribed_events_are_not_decoded():
+    messages = make_stream(2, 10)
+    decoded = []
+    original_json_loads = connection.json_loads
+
+    def counting_json_loads(msg):
+        decoded.append(msg)
+        return original_json_loads(msg)
+
+    connection.json_loads = counting_json_loads
+    try:
+        _, received = asyncio.run(replay(messages, SUBSCRIBED_EVENTS))
+    finally:
+        connection.json_loads = original_json_loads
+    assert received == {
+        cdp.page.LoadEventFired: 2, cdp.page.FrameStoppedLoading: 2
+    }
+    # Only the subscribed events and the command responses are decoded
+    assert len(decoded) == 4 + sum(1 for m in messages if '"id"' in m)
+
+
+def test_subscribed_events_are_parsed():
+    messages = make_stream(2, 10)
+    event_types = get_event_types(messages)
+    _, received = asyncio.run(replay(messages, event_types))
+    assert set(received) == event_types
+    assert sum(received.values()) == sum(
+        1 for m in messages if m.startswith(connection.EVENT_PREFIX)
+    )
+
+
+def benchmark(messages):
+    event_types = get_event_types(messages)
+    few_time, _ = asyncio.run(replay(messages, SUBSCRIBED_EVENTS))
+    all_time, _ = asyncio.run(replay(messages, event_types))
+    print(
+        "%s messages (%s event types):" % (len(messages), len(event_types))
+    )
+    print(
+        "    Page load handlers only: %.3f s (%.0f messages/s)"
+        % (few_time, len(messages) / few_time)
+    )
+    print(
+        "    Handlers for every event: %.3f s (%.0f messages/s)"
+        % (all_time, len(messages) / all_time)
+    )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], mode="r", encoding="utf-8") as f:
+            stream = [line.rstrip("\n") for line in f if line.strip()]
+    else:
+        test_unsubscribed_events_are_not_decoded()
+        test_subscribed_events_are_parsed()
+        stream = make_stream(PAGE_LOADS, REQUESTS_PER_PAGE)
+    benchmark(stream)
@@ -0,0 +1,118 @@
+"""Benchmark for node lookups in CDP Mode: DomMirror.find_node()
+(a dictionary lookup in the mirror's index) vs. cdp_util.filter_recurse()
+(a walk of the whole tree), on a synthetic table with ~28000 nodes.
+(A fake tab returns the document, so no browser is needed.)
+
+Usage:
+    python dom_mirror_benchmark.py  # (Timing)
+    pytest dom_mirror_benchmark.py  # (Checks that both find the same nodes)"""
+import asyncio
+import itertools
+import random
+import time
+import mycdp as cdp
+from seleniumbase.undetected.cdp_driver import cdp_util
+from seleniumbase.undetected.cdp_driver.dom_mirror import DomMirror
+
+ROW_COUNT = 1350  # (With 10 cells per row, and a text node in each cell)
+LOOKUP_COUNT = 200
+
+
+def make_document(row_count):
+    ids = itertools.count(1)
+
+    def node(name, children=None, node_type=1):
+        node_id = next(ids)
+        data = {
+            "nodeId": node_id,
+            "backendNodeId": node_id + 1000000,
+            "nodeType": node_type,
+            "nodeName": name,
+            "localName": name.lower() if node_type == 1 else "",
+            "nodeValue": "",
+        }
+        if children is not None:
+            data["children"] = children
+            data["childNodeCount"] = len(children)
+        return data
+
+    rows = [
+        node("TR", [node("TD", [node("#text", [], 3)]) for _ in range(10)])
+        for _ in range(row_count)
+    ]
+    table = node("TABLE", [node("TBODY", rows)])
+    html = node("HTML", [node("HEAD", []), node("BODY", [table])])
+    return cdp.dom.Node.from_json(node("#document", [html], 9))
+
+
+class FakeTab:
+    def __init__(self, document):
+        self.document = document
+
+    def add_handler(self, *args, **kwargs):
+        pass
+
+    async def send(self, cdp_obj, *args, **kwargs):
+        return self.document
+
+
+def load_mirror(document):
+    """Returns (the DomMirror with the document, seconds to index it)."""
+    mirror = DomMirror(FakeTab(document))
+    start = time.perf_counter()
+    asyncio.run(mirror.get_document())
+    return mirror, time.perf_counter() - start
+
+
+def sample_node_ids(mirror, count, seed=1):
+    cells = [n for n in mirror.nodes.values() if n.node_name == "TD"]
+    return [n.node_id for n in random.Random(seed).sample(cells, count)]
+
+
+def test_find_node_matches_filter_recurse():
+    document = make_document(50)
+    mirror, _ = load_mirror(document)
+    for node_id in sample_node_ids(mirror, 20):
+        found = mirror.find_node(document, node_id=node_id)
+        assert found is cdp_util.filter_recurse(
+            document, lambda n: n.node_id == node_id
+        )
+        assert mirror.find_node(
+            document, backend_node_id=found.backend_node_id
+        ) is found
+    # A tree that isn't the mirror's is walked instead. (Same results)
+    other_document = make_document(50)
+    node_id = sample_node_ids(mirror, 1)[0]
+    found = mirror.find_node(other_document, node_id=node_id)
+    assert found is not mirror.nodes[node_id]
+    assert found.node_id == node_id
+
+
+def benchmark():
+    document = make_document(ROW_COUNT)
+    mirror, index_time = load_mirror(document)
+    node_ids = sample_node_ids(mirror, LOOKUP_COUNT)
+    start = time.perf_counter()
+    for node_id in node_ids:
+        cdp_util.filter_recurse(document, lambda n: n.node_id == node_id)
+    walk_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for node_id in node_ids:
+        mirror.find_node(document, node_id=node_id)
+    lookup_time = time.perf_counter() - start
+    print(
+        "%s nodes (indexed in %.1f ms)"
+        % (len(mirror.nodes), index_time * 1000.0)
+    )
+    print(
+        "filter_recurse() x%s: %.1f ms" % (LOOKUP_COUNT, walk_time * 1000.0)
+    )
+    print(
+        "find_node() x%s: %.3f ms (%.0fx faster)"
+        % (LOOKUP_COUNT, lookup_time * 1000.0, walk_time / lookup_time)
+    )
+
+
+if __name__ == "__main__":
+    test_find_node_matches_filter_recurse()
+    benchmark()
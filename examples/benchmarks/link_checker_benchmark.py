@@ -0,0 +1,143 @@
+"""Benchmark for checking links (Eg. assert_no_404_errors()).
+Starts local HTTP stub servers (one per "host", each response takes
+20 ms), and checks 300 links on them in two ways:
+    * One requests.head() per link, from a pool of 10 threads.
+      (page_utils._get_link_status_code(), which doesn't reuse connections)
+    * link_checker.get_status_codes(), which reuses a keep-alive session
+      per host, interleaves hosts, and caches status codes.
+(No browser or internet connection is needed.)
+
+Usage:
+    python link_checker_benchmark.py  # (Timing)
+    pytest link_checker_benchmark.py  # (Checks the status codes)"""
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from multiprocessing.dummy import Pool
+from seleniumbase.core import link_checker
+from seleniumbase.fixtures import page_utils
+
+HOST_COUNT = 3
+LINKS_PER_HOST = 100
+RESPONSE_TIME = 0.02
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # (Keep-alive connections)
+
+    def log_message(self, *args):
+        pass
+
+    def __respond(self, send_body):
+        self.server.request_count += 1
+        time.sleep(RESPONSE_TIME)
+        status_code = 200
+        if "missing" in self.path:
+            status_code = 404
+        elif "no_head" in self.path and self.command == "HEAD":
+            status_code = 405
+        self.send_response(status_code)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        if send_body:
+            self.wfile.write(b"ok")
+
+    def do_HEAD(self):
+        self.__respond(send_body=False)
+
+    def do_GET(self):
+        self.__respond(send_body=True)
+
+
+@contextmanager
+def stub_servers(count):
+    """Yields count local HTTP servers. (Use get_base_url() for a url)"""
+    servers = []
+    try:
+        for _ in range(count):
+            server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+            server.daemon_threads = True
+            server.request_count = 0
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            servers.append(server)
+        yield servers
+    finally:
+        for server in servers:
+            server.shutdown()
+            server.server_close()
+
+
+def get_base_url(server):
+    return "http://127.0.0.1:%s" % server.server_address[1]
+
+
+def make_links(base_urls, links_per_host):
+    links = [
+        "%s/page_%s" % (base_url, i)
+        for base_url in base_urls
+        for i in range(links_per_host)
+    ]
+    links.append("%s/missing" % base_urls[0])
+    links.append("%s/no_head" % base_urls[-1])
+    return links
+
+
+def check_links_one_by_one(links):
+    def get_status_code(link):
+        return page_utils._get_link_status_code(link, timeout=5)
+
+    pool = Pool(10)
+    try:
+        return dict(zip(links, pool.map(get_status_code, links)))
+    finally:
+        pool.close()
+        pool.join()
+
+
+def test_status_codes():
+    link_checker.clear_cache()
+    with stub_servers(2) as servers:
+        base_urls = [get_base_url(server) for server in servers]
+        links = make_links(base_urls, 5)
+        results = link_checker.get_status_codes(links)
+        assert results["%s/missing" % base_urls[0]] == 404
+        # HEAD gives a 405 there, so the link is checked again with GET
+        assert results["%s/no_head" % base_urls[-1]] == 200
+        assert all(
+            status_code == 200
+            for link, status_code in results.items()
+            if "/page_" in link
+        )
+        # Status codes are cached, so checking again makes no requests
+        request_count = sum(server.request_count for server in servers)
+        assert link_checker.get_status_codes(links) == results
+        assert sum(s.request_count for s in servers) == request_count
+    link_checker.clear_cache()
+
+
+def benchmark():
+    link_checker.clear_cache()
+    with stub_servers(HOST_COUNT) as servers:
+        base_urls = [get_base_url(server) for server in servers]
+        links = make_links(base_urls, LINKS_PER_HOST)
+        start = time.perf_counter()
+        check_links_one_by_one(links)
+        one_by_one_time = time.perf_counter() - start
+        start = time.perf_counter()
+        link_checker.get_status_codes(links)
+        checker_time = time.perf_counter() - start
+        start = time.perf_counter()
+        link_checker.get_status_codes(links)
+        cached_time = time.perf_counter() - start
+    link_checker.clear_cache()
+    print("%s links on %s hosts:" % (len(links), HOST_COUNT))
+    print("    requests.head() x10 threads: %.2f s" % one_by_one_time)
+    print("    link_checker: %.2f s" % checker_time)
+    print("    link_checker (cached): %.2f ms" % (cached_time * 1000.0))
+
+
+if __name__ == "__main__":
+    test_status_codes()
+    benchmark()
@@ -0,0 +1,153 @@
+"""Benchmark (and golden-output check) for the Recorder's code generator.
+Generates SeleniumBase code from synthetic Recorder actions that cover
+every action code and quote variant, and compares the code (and the
+normalized actions, which the Behave codegen uses next) with the golden
+output in recorder_codegen_golden.json.
+
+Usage:
+    python recorder_codegen_benchmark.py  # (Timing of 60000 actions)
+    python recorder_codegen_benchmark.py --update-golden
+    pytest recorder_codegen_benchmark.py  # (Golden output check)"""
+import json
+import os
+import random
+import sys
+import time
+from seleniumbase.core import recorder_helper
+
+GOLDEN_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "recorder_codegen_golden.json"
+)
+GOLDEN_COUNT = 2000
+
+SELECTORS = ['#a', 'div[name="x"]', "a[title='y']", "p[a=\"1\"][b='2']"]
+TEXTS = ["hello", 'say "hi"', "it's", "both \"a\" 'b'", "line1\nline2"]
+URLS = [
+    "https://a.com/x",
+    "https://a.com/%E2%9C%93",
+    'https://a.com/?q="x"',
+    "https://a.com/?q='x'",
+    "https://a.com/?a=\"x\"&b='y'",
+    "https://a.com/%zz",
+]
+ONE_ARG_CODES = [
+    "click", "dbclk", "js_cl", "js_ca", "jq_cl", "jq_ca", "r_clk", "hover",
+    "sw_fr", "s_c_f", "wf_el", "as_el", "as_ep", "asenv", "hi_li", "as_lt",
+    "as_ti", "as_tc", "a_url", "a_u_c", "as_df", "asnet", "da_el", "da_ep",
+    "danet", "s_scr",
+]
+TWO_ARG_CODES = ["h_clk", "ddrop", "s_opt", "set_v", "cho_f"]
+TYPE_CODES = ["input", "js_ty", "jq_ty", "pkeys", "e_mfa"]
+TEXT_CODES = ["as_te", "as_et", "astnv", "aetnv", "da_te", "da_et"]
+FIXED_CODES = [
+    "sw_dc", "sw_pf", "acc_a", "dis_a", "ss_tl", "pdftl", "spstl", "sh_fc",
+    "pr_da", "a_d_m", "d_d_m", "c_l_s", "c_s_s", "d_a_c", "go_bk", "go_fw",
+    "_skip", "mo_dn", "sk_op", "unknown",
+]
+
+
+def make_actions(count, seed=1):
+    """Returns a list of synthetic Recorder actions. (Always the same list
+    for the same count and seed)"""
+    rnd = random.Random(seed)
+    actions = []
+    for i in range(count):
+        kind = rnd.randrange(12)
+        selector = rnd.choice(SELECTORS)
+        text = rnd.choice(TEXTS)
+        url = rnd.choice(URLS)
+        if kind == 0:
+            action = [rnd.choice(["begin", "_url_", "f_url"]), "o", url, i]
+        elif kind == 1:
+            action = [rnd.choice(ONE_ARG_CODES), selector, "", i]
+        elif kind == 2:
+            code = rnd.choice(TWO_ARG_CODES)
+            arg = rnd.choice([text, selector, "C:\\f\\x.txt"])
+            action = [code, selector, arg, i]
+        elif kind == 3:
+            action = [rnd.choice(TYPE_CODES), selector, text, i]
+        elif kind == 4:
+            code = rnd.choice(TEXT_CODES)
+            if rnd.random() < 0.2:
+                selector = rnd.choice(SELECTORS[:3])
+                action = [code, ["['a', 'b']", selector], "", i]
+            else:
+                selector = rnd.choice([selector, "html"])
+                action = [code, [text + "\u00B6", selector], "", i]
+        elif kind == 5:
+            action = [rnd.choice(FIXED_CODES), "", "", i]
+        elif kind == 6:
+            offsets = [rnd.randrange(99), rnd.randrange(99)]
+            action = ["canva", [selector] + offsets, "", i]
+        elif kind == 7:
+            code = rnd.choice(["s_at_", "s_ats"])
+            action = [code, [selector, "attr", "val"], "", i]
+        elif kind == 8:
+            value = rnd.choice(["", "v"])
+            action = ["as_at", [selector, "attr", value], "", i]
+        elif kind == 9:
+            code = rnd.choice(["do_fi", "ss_tf"])
+            target = rnd.choice(URLS[:1] + SELECTORS)
+            dest = rnd.choice(["", "dl", selector])
+            action = [code, [target, dest], "", i]
+        elif kind == 10:
+            code = rnd.choice(["s_c_d", "c_box"])
+            arg = rnd.choice(["", selector])
+            check = rnd.choice(["yes", "no"])
+            action = [code, arg, check, i]
+        else:
+            action = ["sleep", rnd.choice([1, 2.5]), "", i]
+        actions.append(action)
+    return actions
+
+
+def generate(count):
+    """Returns (code, normalized actions) for count synthetic actions."""
+    actions = make_actions(count)
+    code = list(recorder_helper.iter_sbase_code(actions))
+    return code, json.loads(json.dumps(actions))
+
+
+def update_golden():
+    code, actions = generate(GOLDEN_COUNT)
+    with open(GOLDEN_FILE, mode="w", encoding="utf-8") as f:
+        # (One item per line, so that changes are easy to review)
+        f.write('{\n"count": %s,\n"code": [\n' % GOLDEN_COUNT)
+        f.write(",\n".join(json.dumps(line) for line in code))
+        f.write('\n],\n"actions": [\n')
+        f.write(",\n".join(json.dumps(action) for action in actions))
+        f.write("\n]\n}\n")
+    print("Updated %s (%s lines)" % (GOLDEN_FILE, len(code)))
+
+
+def test_golden_code():
+    with open(GOLDEN_FILE, mode="r", encoding="utf-8") as f:
+        golden = json.load(f)
+    code, actions = generate(golden["count"])
+    assert code == golden["code"]
+    assert actions == golden["actions"]
+
+
+def benchmark(count=60000, rounds=5):
+    best = None
+    for _ in range(rounds):
+        actions = make_actions(count)
+        start = time.perf_counter()
+        lines = sum(1 for _ in recorder_helper.iter_sbase_code(actions))
+        duration = time.perf_counter() - start
+        if best is None or duration < best:
+            best = duration
+    print(
+        "%s actions -> %s lines of code: %.1f ms (best of %s)"
+        % (count, lines, best * 1000.0, rounds)
+    )
+
+
+if __name__ == "__main__":
+    if "--update-golden" in sys.argv:
+        update_golden()
+    else:
+        test_golden_code()
+        print("Golden output: OK")
+        benchmark()
+        benchmark(600000, rounds=1)
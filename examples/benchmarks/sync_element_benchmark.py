@@ -0,0 +1,90 @@
+"""Benchmark for find_all() in CDP Mode with 10000 matching elements.
+Each result of sb.cdp.find_all() is wrapped in a SyncElement, which gets
+its sync methods (Eg. element.click()) from the class, so wrapping an
+element doesn't copy anything onto it. (A fake page returns the
+elements, so no browser is needed.)
+
+Usage:
+    python sync_element_benchmark.py  # (Timing and memory)
+    pytest sync_element_benchmark.py  # (Checks that wrapping is cheap)"""
+import asyncio
+import time
+import tracemalloc
+import mycdp as cdp
+from seleniumbase.core.sb_cdp import CDPMethods
+from seleniumbase.core.sb_cdp import SyncElement
+from seleniumbase.undetected.cdp_driver.element import Element
+
+ELEMENT_COUNT = 10000
+
+
+def make_elements(count):
+    elements = []
+    for i in range(count):
+        node = cdp.dom.Node(
+            node_id=cdp.dom.NodeId(i + 1),
+            backend_node_id=cdp.dom.BackendNodeId(i + 1),
+            node_type=1,
+            node_name="DIV",
+            local_name="div",
+            node_value="",
+            attributes=["id", "d%s" % i, "class", "item"],
+        )
+        elements.append(Element(node, None))
+    return elements
+
+
+class FakePage:
+    def __init__(self, elements):
+        self.elements = elements
+
+    async def find_all(self, selector, timeout=None):
+        return self.elements
+
+
+def find_all(elements):
+    """Returns (the results of find_all(), seconds, traced bytes)."""
+    loop = asyncio.new_event_loop()
+    cdp_methods = CDPMethods(loop, FakePage(elements), None)
+    try:
+        tracemalloc.start()
+        start = time.perf_counter()
+        results = cdp_methods.find_all("div.item", timeout=1)
+        duration = time.perf_counter() - start
+        memory = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+        loop.close()
+    return results, duration, memory
+
+
+def test_find_all_wraps_elements():
+    elements = make_elements(100)
+    attrs_before = [dict(element.attrs) for element in elements]
+    results, _, _ = find_all(elements)
+    assert len(results) == len(elements)
+    assert all(isinstance(result, SyncElement) for result in results)
+    # Nothing is added to the elements. (Sync methods come from the class)
+    assert [dict(element.attrs) for element in elements] == attrs_before
+    assert results[0].click.func.__name__ == "__click"
+    assert results[0].attrs["id"] == "d0"
+    assert results[0] == elements[0]
+
+
+def benchmark():
+    elements = make_elements(ELEMENT_COUNT)
+    results, duration, memory = find_all(elements)
+    start = time.perf_counter()
+    for result in results:
+        result.click  # (Binding a sync method)
+    binding = time.perf_counter() - start
+    print(
+        "find_all() -> %s elements: %.1f ms, %.2f MB"
+        % (len(results), duration * 1000.0, memory / 1e6)
+    )
+    print("element.click (x%s): %.1f ms" % (len(results), binding * 1000.0))
+
+
+if __name__ == "__main__":
+    test_find_all_wraps_elements()
+    benchmark()
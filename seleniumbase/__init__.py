@@ -3,24 +3,51 @@ import os
 import pdb
 import sys
 from contextlib import suppress
-from selenium import webdriver
 from seleniumbase.__version__ import __version__
-from seleniumbase.common import decorators  # noqa
-from seleniumbase.common import encryption  # noqa
 from seleniumbase.core import colored_traceback
-from seleniumbase.core import sb_cdp  # noqa
-from seleniumbase.core.browser_launcher import get_driver  # noqa
-from seleniumbase.fixtures import js_utils  # noqa
-from seleniumbase.fixtures import page_actions  # noqa
-from seleniumbase.fixtures import page_utils  # noqa
 from seleniumbase.fixtures import shared_utils
-from seleniumbase.fixtures.base_case import BaseCase  # noqa
-from seleniumbase.masterqa.master_qa import MasterQA  # noqa
-from seleniumbase.plugins.sb_manager import SB  # noqa
-from seleniumbase.plugins.driver_manager import Driver  # noqa
-from seleniumbase.plugins.driver_manager import DriverContext  # noqa
-from seleniumbase.undetected import cdp_driver  # noqa
-from seleniumbase import translate  # noqa
+
+# The public API is imported on first use, so that "import seleniumbase"
+# (Eg. for Driver() or for the "sbase" console scripts) stays fast.
+# {name: (module, attribute)} (If attribute is None, it's the module.)
+_lazy_imports = {
+    "decorators": ("seleniumbase.common.decorators", None),
+    "encryption": ("seleniumbase.common.encryption", None),
+    "sb_cdp": ("seleniumbase.core.sb_cdp", None),
+    "get_driver": ("seleniumbase.core.browser_launcher", "get_driver"),
+    "js_utils": ("seleniumbase.fixtures.js_utils", None),
+    "page_actions": ("seleniumbase.fixtures.page_actions", None),
+    "page_utils": ("seleniumbase.fixtures.page_utils", None),
+    "BaseCase": ("seleniumbase.fixtures.base_case", "BaseCase"),
+    "MasterQA": ("seleniumbase.masterqa.master_qa", "MasterQA"),
+    "SB": ("seleniumbase.plugins.sb_manager", "SB"),
+    "Driver": ("seleniumbase.plugins.driver_manager", "Driver"),
+    "DriverContext": ("seleniumbase.plugins.driver_manager", "DriverContext"),
+    "cdp_driver": ("seleniumbase.undetected.cdp_driver", None),
+    "translate": ("seleniumbase.translate", None),
+}
+# (For "from seleniumbase import *", which resolves these via __getattr__)
+__all__ = list(_lazy_imports) + ["__version__", "version_info"]
+
+
+def __getattr__(name):
+    if name not in _lazy_imports:
+        raise AttributeError(
+            "module %r has no attribute %r" % (__name__, name)
+        )
+    import importlib
+
+    module_name, attribute = _lazy_imports[name]
+    value = importlib.import_module(module_name)
+    if attribute:
+        value = getattr(value, attribute)
+    globals()[name] = value  # (So that __getattr__ isn't called again)
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_imports))
+
 
 with suppress(Exception):
     import colorama
@@ -45,13 +72,11 @@ if sys.version_info[0] < 3 and "pdbp" in locals():
         pdb.DefaultConfig.sticky_by_default = True
 colored_traceback.add_hook()
 os.environ["SE_AVOID_STATS"] = "true"  # Disable Selenium Manager stats
-webdriver.TouchActions = None  # Lifeline for past selenium-wire versions
 if sys.version_info >= (3, 10):
     collections.Callable = collections.abc.Callable  # Lifeline for nosetests
 del collections  # Undo "import collections" / Simplify "dir(seleniumbase)"
 del os  # Undo "import os" / Simplify "dir(seleniumbase)"
 del sys  # Undo "import sys" / Simplify "dir(seleniumbase)"
-del webdriver  # Undo "import webdriver" / Simplify "dir(seleniumbase)"
 
 version_list = [int(i) for i in __version__.split(".") if i.isdigit()]
 version_tuple = tuple(version_list)
@@ -45,6 +45,7 @@ behave -D agent="User Agent String" -D demo
 -D driver-version=VER  (Set the chromedriver or uc_driver version to use.)
 -D sjw  (Skip JS Waits for readyState to be "complete" or Angular to load.)
 -D wfa  (Wait for AngularJS to be done loading after specific web actions.)
+-D edw  (Use event-driven waits for elements instead of polling WebDriver.)
 -D pls=PLS  (Set pageLoadStrategy on Chrome: "normal", "eager", or "none".)
 -D headless  (The default headless mode. Linux uses this mode by default.)
 -D headless1  (Use Chrome's old headless mode. Fast, but has limitations.)
@@ -641,6 +642,10 @@ def get_configured_sb(context):
         if low_key in ["wfa", "wait-for-angularjs", "wait_for_angularjs"]:
             settings.WAIT_FOR_ANGULARJS = True
             continue
+        # Handle: -D edw / event-driven-waits / event_driven_waits
+        if low_key in ["edw", "event-driven-waits", "event_driven_waits"]:
+            settings.EVENT_DRIVEN_WAITS = True
+            continue
         # Handle: -D visual-baseline / visual_baseline
         if low_key in ["visual-baseline", "visual_baseline"]:
             sb.visual_baseline = True
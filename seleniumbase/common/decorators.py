@@ -163,33 +163,26 @@ def retry_on_exception(tries=6, delay=1, backoff=2, max_delay=32):
     return decorated_function_with_retry
 
 
-def rate_limited(max_per_second):
+def rate_limited(max_per_second, burst=1, shared=False, name=None):
     """This decorator limits how often a method can get called in a second.
     If the limit is exceeded, the call will be held in a queue until
     enough time has passed.
-    Useful when trying to avoid overloading a system with rapid calls."""
-    import threading
+    Useful when trying to avoid overloading a system with rapid calls.
+    (Works with "def" and "async def" methods.)
 
-    min_interval = 1.0 / float(max_per_second)
+    max_per_second: Max number of calls per second (on average).
+    burst: Max number of calls at once (after being idle for a while).
+    shared: Share the limit with other processes. (Eg. pytest-xdist)
+    name: Methods with the same name share a limit. (If shared)
+          (The default name is the module and name of the method.)"""
+    from seleniumbase.common.rate_limiter import RateLimiter
 
     def decorate(func):
-        last_time_called = [0.0]
-        rate_lock = threading.Lock()  # To support multi-threading
-
-        def rate_limited_function(*args, **kargs):
-            try:
-                rate_lock.acquire(True)
-                elapsed = None
-                elapsed = time.process_time() - last_time_called[0]
-                wait_time_remaining = min_interval - elapsed
-                if wait_time_remaining > 0:
-                    time.sleep(wait_time_remaining)
-                last_time_called[0] = time.process_time()
-            finally:
-                rate_lock.release()
-            return func(*args, **kargs)
-
-        return rate_limited_function
+        limiter_name = name
+        if shared and not limiter_name:
+            limiter_name = "%s.%s" % (func.__module__, func.__qualname__)
+        limiter = RateLimiter(max_per_second, burst, limiter_name, shared)
+        return limiter(func)
 
     return decorate
 
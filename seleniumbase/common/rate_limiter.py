@@ -0,0 +1,214 @@
+"""Token-bucket rate limiting. (Used by @decorators.rate_limited)
+A bucket holds up to "burst" tokens, and it refills at "rate" tokens
+per second. Each call takes a token. If no token is left, the call
+reserves the next one and sleeps until it's available. (Calls are
+served in the order that they arrived, without polling.)
+With shared=True, the bucket is saved in a small file (protected by a
+file lock) in the temp folder, so that all processes on the machine
+(Eg. pytest-xdist workers) share the same budget.
+Usage:
+    limiter = RateLimiter(2, burst=5, name="example.com", shared=True)
+
+    limiter.acquire()  # (Returns the seconds that it waited)
+    await limiter.acquire_async()
+
+    with limiter:
+        # code ...
+    async with limiter:
+        # code ...
+
+    @limiter
+    def my_function():  # (Also works with "async def")
+        # code ..."""
+import asyncio
+import hashlib
+import inspect
+import json
+import os
+import tempfile
+import threading
+import time
+from functools import wraps
+from urllib.parse import urlparse
+from seleniumbase.config import settings
+from seleniumbase.fixtures import constants
+
+_limiters = {}  # (name, rate, burst, shared) -> RateLimiter
+_limiters_lock = threading.Lock()
+
+
+class RateLimiter:
+    def __init__(self, rate, burst=1, name=None, shared=False):
+        """
+        :param rate: The max number of calls per second (on average).
+        :param burst: The max number of calls that can happen at once
+            (after the limiter was idle for a while).
+        :param name: Limiters with the same name share a budget
+            between processes. (Only used if shared is True.)
+        :param shared: Share the budget with other processes.
+        """
+        rate = float(rate)
+        burst = float(burst)
+        if rate <= 0:
+            raise ValueError('"rate" must be greater than 0.')
+        if burst < 1:
+            raise ValueError('"burst" must be greater than or equal to 1.')
+        if shared and not name:
+            raise ValueError('A shared RateLimiter needs a "name".')
+        self.rate = rate
+        self.burst = burst
+        self.name = name
+        self.shared = shared
+        self._lock = threading.Lock()
+        # [tokens, time of last update] (See __now() for the clock used)
+        self._state = [burst, self.__now()]
+        self._file_lock = None
+        self._state_path = None
+        if shared:
+            import fasteners
+
+            folder = os.path.join(
+                tempfile.gettempdir(), constants.RateLimits.FOLDER
+            )
+            os.makedirs(folder, exist_ok=True)
+            file_name = hashlib.sha1(name.encode("utf-8")).hexdigest()[:16]
+            path = os.path.join(folder, file_name)
+            self._file_lock = fasteners.InterProcessLock(path + ".lock")
+            self._state_path = path + ".json"
+
+    def __now(self):
+        """Monotonic time, unless the state is shared by processes.
+        (A shared state needs the wall-clock time, which is the same for
+        all processes. Otherwise, a jump of the system clock would refill
+        the bucket, and allow a burst of calls.)"""
+        if self.shared:
+            return time.time()
+        return time.monotonic()
+
+    def __read_state(self):
+        if not self.shared:
+            return self._state
+        try:
+            with open(self._state_path, mode="r", encoding="utf-8") as f:
+                tokens, updated = json.load(f)
+            return [float(tokens), float(updated)]
+        except Exception:
+            return [self.burst, 0.0]  # (A new or unreadable bucket is full)
+
+    def __write_state(self, state):
+        if not self.shared:
+            return
+        try:
+            with open(self._state_path, mode="w", encoding="utf-8") as f:
+                json.dump(state, f)
+        except Exception:
+            pass
+
+    def reserve(self, tokens=1):
+        """Takes tokens from the bucket (possibly going into debt).
+        Returns the seconds to wait before the tokens are available."""
+        if tokens > self.burst:
+            raise ValueError(
+                "Can't take %s tokens from a bucket of %s!"
+                % (tokens, self.burst)
+            )
+        with self._lock:
+            if self._file_lock:
+                self._file_lock.acquire()
+            try:
+                now = self.__now()
+                available, updated = self.__read_state()
+                elapsed = max(now - updated, 0)
+                available = min(self.burst, available + elapsed * self.rate)
+                available -= tokens
+                self._state = [available, now]
+                self.__write_state(self._state)
+            finally:
+                if self._file_lock:
+                    self._file_lock.release()
+        if available >= 0:
+            return 0
+        return -available / self.rate
+
+    def acquire(self, tokens=1):
+        """Waits until the tokens are available, and takes them.
+        Returns the number of seconds that it waited."""
+        wait_time = self.reserve(tokens)
+        if wait_time > 0:
+            time.sleep(wait_time)
+        return wait_time
+
+    async def acquire_async(self, tokens=1):
+        """Like acquire(), but waits with asyncio.sleep()."""
+        wait_time = self.reserve(tokens)
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+        return wait_time
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    async def __aenter__(self):
+        await self.acquire_async()
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    def __call__(self, func):
+        """Use the limiter as a decorator. (For sync or async functions)"""
+        if inspect.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_rate_limited_function(*args, **kwargs):
+                await self.acquire_async()
+                return await func(*args, **kwargs)
+
+            return async_rate_limited_function
+
+        @wraps(func)
+        def rate_limited_function(*args, **kwargs):
+            self.acquire()
+            return func(*args, **kwargs)
+
+        return rate_limited_function
+
+
+def get_limiter(name, rate, burst=1, shared=False):
+    """Returns the RateLimiter with these arguments (created once)."""
+    key = (name, float(rate), float(burst), shared)
+    with _limiters_lock:
+        if key not in _limiters:
+            _limiters[key] = RateLimiter(rate, burst, name, shared)
+        return _limiters[key]
+
+
+def get_navigation_limiter(url):
+    """Returns the per-domain limiter for page loads of the url.
+    Returns None if settings.NAVIGATION_RATE_LIMIT is not set,
+    or if the url isn't for a website. (Eg. "data:" or "about:")"""
+    rate = settings.NAVIGATION_RATE_LIMIT
+    if not rate or not url or not url.startswith(("http:", "https:")):
+        return None
+    domain = urlparse(url).hostname
+    if not domain:
+        return None
+    return get_limiter(
+        "navigation:%s" % domain.lower(),
+        rate,
+        settings.NAVIGATION_BURST,
+        shared=settings.SHARE_NAVIGATION_RATE_LIMIT,
+    )
+
+
+def throttle_navigation(url):
+    """Waits if loading the url would exceed NAVIGATION_RATE_LIMIT.
+    Returns the number of seconds that it waited."""
+    limiter = get_navigation_limiter(url)
+    if not limiter:
+        return 0
+    return limiter.acquire()
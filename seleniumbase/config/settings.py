@@ -50,6 +50,12 @@ SCREENSHOT_NAME = "screenshot.png"
 BASIC_INFO_NAME = "basic_test_info.txt"
 PAGE_SOURCE_NAME = "page_source.html"
 
+# Page sources for logs are streamed to disk in chunks (not kept in memory).
+# If True, they're saved with gzip compression. ("page_source.html.gz")
+# If True, consecutive failures on identical pages share one saved file.
+COMPRESS_PAGE_SOURCE = False
+DEDUPLICATE_PAGE_SOURCE = True
+
 # Default names for files and folders saved when using nosetests reports.
 # Usage: "--report". (NOSETESTS only)
 LATEST_REPORT_DIR = "latest_report"
@@ -78,6 +84,23 @@ WAIT_FOR_RSC_ON_CLICKS = False
 WAIT_FOR_ANGULARJS = True
 # Skip all calls to wait_for_ready_state_complete() and wait_for_angularjs().
 SKIP_JS_WAITS = False
+# Wait for elements with an in-page MutationObserver instead of polling
+# WebDriver every 100ms. (Falls back to polling if scripts can't be run.)
+EVENT_DRIVEN_WAITS = False
+
+# Selector conversions (Eg. ":contains()" CSS into XPath) are cached (LRU).
+# SELECTOR_CACHE_SIZE is the max number of conversions kept in memory.
+# If True, the cache is saved in the drivers folder and reused between runs.
+SELECTOR_CACHE_SIZE = 4096
+PERSIST_SELECTOR_CACHE = False
+
+# Limit how often pages from the same domain are opened. (Per second)
+# Applies to self.open(URL) and sb.cdp.open(URL). (0 = No limit)
+# NAVIGATION_BURST is the number of page loads allowed at once.
+# If True, the limit is shared by all processes. (Eg. pytest -n 32)
+NAVIGATION_RATE_LIMIT = 0
+NAVIGATION_BURST = 1
+SHARE_NAVIGATION_RATE_LIMIT = True
 
 # Default time to wait after each browser action performed during Demo Mode.
 # Use Demo Mode when you want others to see what your automation is doing.
@@ -128,6 +151,18 @@ HEADLESS_START_HEIGHT = 1880
 # (If calling "sbase get chromedriver", then won't hide.)
 HIDE_DRIVER_DOWNLOADS = False
 
+# When using "--browser-pool=N", browsers are kept open between tests.
+# A browser gets recycled after this many tests have leased it.
+BROWSER_POOL_MAX_LEASES = 50
+# A browser also gets recycled if using more memory (MB) than this.
+# (0 means no limit. Checking memory usage requires "psutil".)
+BROWSER_POOL_MAX_MEMORY_MB = 0
+
+# If True, CDP Mode runs its event loop forever on a background thread.
+# Sync CDP methods submit their work to that thread, so event handlers
+# keep firing in real time while the test is busy between CDP calls.
+CDP_BACKGROUND_LOOP = False
+
 # #####>>>>>----- MasterQA SETTINGS -----<<<<<#####
 # ##### (Used when importing MasterQA as the parent class)
 
@@ -35,6 +35,7 @@ sbase decrypt
 sbase proxy
 sbase proxy --hostname=127.0.0.1 --port=8899
 sbase download server
+sbase download assets
 sbase grid-hub start
 sbase grid-node start --hub=127.0.0.1
 """
@@ -627,6 +628,13 @@ def show_download_usage():
     print("     Downloads the Selenium Standalone Server.")
     print("     (Server is required for using your own Selenium Grid.)")
     print("")
+    print("  Usage:")
+    print("     seleniumbase download assets")
+    print("     OR:    sbase download assets")
+    print("  Output:")
+    print("     Downloads the JS/CSS libraries that get added to pages.")
+    print("     (jQuery, Messenger, Tours, etc. Then no CDN is needed.)")
+    print("")
 
 
 def show_grid_hub_usage():
@@ -1165,6 +1173,16 @@ def main():
                 download_selenium_server,
             )
             download_selenium_server.main(force_download=True)
+        elif len(command_args) >= 1 and command_args[0].lower() == "assets":
+            from seleniumbase.core import asset_store
+
+            failed = asset_store.download_assets()
+            for link in failed:
+                print("Unable to download: %s" % link)
+            saved = len(asset_store.ALL_ASSETS) - len(failed)
+            print("Saved %s assets to: %s" % (saved, asset_store.ASSETS_DIR))
+            if failed:
+                sys.exit(1)
         else:
             show_basic_usage()
             show_download_usage()
@@ -0,0 +1,175 @@
+"""Local copies of the JS/CSS libraries that SeleniumBase adds to pages.
+(jQuery, Messenger, HTML-Inspector, jQuery-Confirm, and website tours)
+* An asset is downloaded once, and then saved in the
+  "seleniumbase/drivers/assets" folder. After that, no network is needed.
+  (Use "sbase download assets" to get all of them ahead of time.)
+* Assets are injected inline (by content) with a single script.
+  Inline scripts run as soon as they are added to the page,
+  so there's no need to wait for a library to load from a CDN.
+* The page keeps track of the assets that were injected already.
+If an asset can't be found or downloaded, no script is returned,
+and the caller can fall back to adding links to the CDN."""
+import hashlib
+import json
+import os
+import re
+import threading
+import uuid
+from contextlib import suppress
+from urllib.parse import urljoin
+from seleniumbase import drivers
+from seleniumbase.fixtures import constants
+
+DRIVER_DIR = os.path.dirname(os.path.realpath(drivers.__file__))
+ASSETS_DIR = os.path.join(DRIVER_DIR, constants.Assets.STORAGE_FOLDER)
+ALL_ASSETS = (
+    constants.JQuery.MIN_JS,
+    constants.Messenger.MIN_CSS,
+    constants.Messenger.MIN_JS,
+    constants.Messenger.THEME_FLAT_JS,
+    constants.Messenger.THEME_FUTURE_JS,
+    constants.Messenger.THEME_FLAT_CSS,
+    constants.Messenger.THEME_FUTURE_CSS,
+    constants.Messenger.THEME_BLOCK_CSS,
+    constants.Messenger.THEME_AIR_CSS,
+    constants.Messenger.THEME_ICE_CSS,
+    constants.Messenger.SPINNER_CSS,
+    constants.Underscore.MIN_JS,
+    constants.HtmlInspector.MIN_JS,
+    constants.JqueryConfirm.MIN_CSS,
+    constants.JqueryConfirm.MIN_JS,
+    constants.BootstrapTour.MIN_CSS,
+    constants.BootstrapTour.MIN_JS,
+    constants.DriverJS.MIN_CSS,
+    constants.DriverJS.MIN_JS,
+    constants.Hopscotch.MIN_CSS,
+    constants.Hopscotch.MIN_JS,
+    constants.IntroJS.MIN_CSS,
+    constants.IntroJS.MIN_JS,
+    constants.Shepherd.MIN_JS,
+    constants.Shepherd.THEME_ARROWS_CSS,
+    constants.Shepherd.THEME_ARR_FIX_CSS,
+    constants.Shepherd.THEME_DEFAULT_CSS,
+    constants.Shepherd.THEME_DARK_CSS,
+    constants.Shepherd.THEME_SQ_CSS,
+    constants.Shepherd.THEME_SQ_DK_CSS,
+    constants.Tether.MIN_JS,
+)
+CSS_URL_PATTERN = re.compile(r"""url\(\s*(['"]?)([^'")]+)\1\s*\)""")
+INJECT_SCRIPT = """(function(assets) {
+    var injected = window.%s = window.%s || {};
+    var parent = document.head || document.documentElement;
+    for (var i = 0; i < assets.length; i++) {
+        var link = assets[i][0], content = assets[i][1];
+        if (injected[link]) { continue; }
+        if (/\\.css$/.test(link)) {
+            var style_tag = document.createElement("style");
+            style_tag.textContent = content;
+            parent.appendChild(style_tag);
+            injected[link] = true;
+        } else {
+            // The script marks itself as injected only if it ran.
+            // (Eg. A Content Security Policy can block inline scripts.)
+            var script_tag = document.createElement("script");
+            script_tag.textContent = content + "\\n;window.%s[" +
+                JSON.stringify(link) + "] = true;";
+            parent.appendChild(script_tag);
+        }
+    }
+})(%s);"""
+
+_contents = {}  # link -> content (or None if it's not available)
+_lock = threading.Lock()
+
+
+def get_asset_path(link):
+    """Returns the path where the local copy of an asset is saved."""
+    file_name = link.split("?")[0].split("#")[0].rstrip("/").split("/")[-1]
+    url_hash = hashlib.sha1(link.encode("utf-8")).hexdigest()[:10]
+    return os.path.join(ASSETS_DIR, "%s_%s" % (url_hash, file_name))
+
+
+def __download_asset(link, file_path):
+    import requests
+
+    response = requests.get(
+        link, timeout=constants.Assets.DOWNLOAD_TIMEOUT
+    )
+    if response.status_code != 200:
+        return None
+    content = response.content.decode("utf-8")
+    with suppress(Exception):
+        # Write a temp file first so that other processes
+        # never read a partial file.
+        os.makedirs(ASSETS_DIR, exist_ok=True)
+        temp_path = "%s.%s.tmp" % (file_path, uuid.uuid4().hex[:8])
+        with open(temp_path, mode="w", encoding="utf-8", newline="") as f:
+            f.write(content)
+        os.replace(temp_path, file_path)
+    return content
+
+
+def __absolutize_css_urls(css, link):
+    """Inline CSS has the page URL as its base, so relative url(...)
+    values (Eg. fonts and images) need the URL of the stylesheet."""
+
+    def absolutize(match):
+        url = match.group(2).strip()
+        if url.startswith("data:") or url.startswith("#"):
+            return match.group(0)
+        return 'url("%s")' % urljoin(link, url).replace('"', "%22")
+
+    return CSS_URL_PATTERN.sub(absolutize, css)
+
+
+def get_asset(link):
+    """Returns the content of an asset, or None if it's not available.
+    If there's no local copy, downloads it (once per session)."""
+    if link in _contents:
+        return _contents[link]
+    with _lock:
+        if link in _contents:
+            return _contents[link]
+        file_path = get_asset_path(link)
+        content = None
+        with suppress(Exception):
+            with open(file_path, mode="r", encoding="utf-8") as f:
+                content = f.read()
+        if content is None:
+            with suppress(Exception):
+                content = __download_asset(link, file_path)
+        if content is not None and link.endswith(".css"):
+            content = __absolutize_css_urls(content, link)
+        # (If the download failed, don't try again during this session.)
+        _contents[link] = content
+        return content
+
+
+def get_inject_script(links):
+    """Returns a script that injects the assets inline, in order.
+    Returns None if any of the assets isn't available.
+    (Scripts that depend on each other shouldn't be split up.)"""
+    assets = []
+    for link in links:
+        content = get_asset(link)
+        if content is None:
+            return None
+        assets.append([link, content])
+    js_var = constants.Assets.JS_VAR
+    return INJECT_SCRIPT % (js_var, js_var, js_var, json.dumps(assets))
+
+
+def download_assets(links=ALL_ASSETS):
+    """Saves (or updates) local copies of assets.
+    Returns the links that couldn't be downloaded."""
+    failed = []
+    for link in links:
+        content = None
+        with suppress(Exception):
+            content = __download_asset(link, get_asset_path(link))
+        if content is None:
+            failed.append(link)
+            continue
+        with _lock:
+            _contents.pop(link, None)
+    return failed
@@ -37,6 +37,7 @@ from seleniumbase import extensions  # browser extensions storage folder
 from seleniumbase.config import settings
 from seleniumbase.core import detect_b_ver
 from seleniumbase.core import download_helper
+from seleniumbase.core import extension_helper
 from seleniumbase.core import proxy_helper
 from seleniumbase.core import sb_driver
 from seleniumbase.core import sb_cdp
@@ -46,6 +47,7 @@ from seleniumbase.fixtures import page_actions
 from seleniumbase.fixtures import shared_utils
 
 urllib3.disable_warnings()
+webdriver.TouchActions = None  # Lifeline for past selenium-wire versions
 DRIVER_DIR = os.path.dirname(os.path.realpath(drivers.__file__))
 DRIVER_DIR_CFT = os.path.dirname(os.path.realpath(cft_drivers.__file__))
 DRIVER_DIR_CHS = os.path.dirname(os.path.realpath(chs_drivers.__file__))
@@ -103,6 +105,7 @@ elif IS_WINDOWS:
 else:
     # Cannot determine system
     pass  # SeleniumBase will use web drivers from the System PATH by default
+_driver_lookup_memo = {}  # Driver lookups that don't change mid-run
 
 
 def log_d(message):
@@ -358,18 +361,40 @@ def get_latest_chromedriver_version():
 
 
 def chromedriver_on_path():
-    paths = os.environ["PATH"].split(os.pathsep)
+    env_path = os.environ["PATH"]
+    found_path = _driver_lookup_memo.get(("on_path", env_path))
+    if found_path and os.path.exists(found_path):
+        return found_path
+    paths = env_path.split(os.pathsep)
     for path in paths:
         if (
             not IS_WINDOWS
             and os.path.exists(os.path.join(path, "chromedriver"))
         ):
-            return os.path.join(path, "chromedriver")
+            found_path = os.path.join(path, "chromedriver")
+            break
         elif (
             IS_WINDOWS
             and os.path.exists(os.path.join(path, "chromedriver.exe"))
         ):
-            return os.path.join(path, "chromedriver.exe")
+            found_path = os.path.join(path, "chromedriver.exe")
+            break
+    else:
+        return None
+    _driver_lookup_memo[("on_path", env_path)] = found_path
+    return found_path
+
+
+def _get_uc_driver_full_version(local_uc_driver):
+    with suppress(Exception):
+        output = subprocess.check_output(
+            '"%s" --version' % local_uc_driver, shell=True
+        )
+        if IS_WINDOWS:
+            output = output.decode("latin1")
+        else:
+            output = output.decode("utf-8")
+        return output.split(" ")[1]
     return None
 
 
@@ -379,15 +404,12 @@ def get_uc_driver_version(full=False, local_uc_driver=None):
     uc_driver_version = None
     if os.path.exists(local_uc_driver):
         with suppress(Exception):
-            output = subprocess.check_output(
-                '"%s" --version' % local_uc_driver, shell=True
+            full_version = detect_b_ver.get_cached_version(
+                "uc_driver",
+                local_uc_driver,
+                lambda: _get_uc_driver_full_version(local_uc_driver),
             )
-            if IS_WINDOWS:
-                output = output.decode("latin1")
-            else:
-                output = output.decode("utf-8")
-            full_version = output.split(" ")[1]
-            output = output.split(" ")[1].split(".")[0]
+            output = full_version.split(".")[0]
             if int(output) >= 72:
                 if full:
                     uc_driver_version = full_version
@@ -399,6 +421,17 @@ def get_uc_driver_version(full=False, local_uc_driver=None):
 def find_chromedriver_version_to_use(use_version, driver_version):
     # Note: https://chromedriver.chromium.org/downloads stops at 114.
     # Future drivers are part of the Chrome-for-Testing collection.
+    memo_key = ("version_to_use", use_version, driver_version)
+    if memo_key in _driver_lookup_memo:
+        return _driver_lookup_memo[memo_key]
+    use_version = _find_chromedriver_version_to_use(
+        use_version, driver_version
+    )
+    _driver_lookup_memo[memo_key] = use_version
+    return use_version
+
+
+def _find_chromedriver_version_to_use(use_version, driver_version):
     if (
         driver_version
         and str(driver_version).split(".")[0].isdigit()
@@ -551,8 +584,7 @@ def uc_special_open_if_cf(
 def uc_open(driver, url):
     url = shared_utils.fix_url_as_needed(url)
     if __is_cdp_swap_needed(driver):
-        driver.cdp.get(url)
-        time.sleep(0.3)
+        driver.cdp.get(url)  # (It waits for the page to load)
         return
     if (url.startswith("http:") or url.startswith("https:")):
         with driver:
@@ -566,8 +598,7 @@ def uc_open(driver, url):
 def uc_open_with_tab(driver, url):
     url = shared_utils.fix_url_as_needed(url)
     if __is_cdp_swap_needed(driver):
-        driver.cdp.get(url)
-        time.sleep(0.3)
+        driver.cdp.get(url)  # (It waits for the page to load)
         return
     if (url.startswith("http:") or url.startswith("https:")):
         if not hasattr(driver, "cdp_base"):
@@ -599,8 +630,7 @@ def uc_open_with_reconnect(driver, url, reconnect_time=None):
         return
     url = shared_utils.fix_url_as_needed(url)
     if __is_cdp_swap_needed(driver):
-        driver.cdp.get(url)
-        time.sleep(0.3)
+        driver.cdp.get(url)  # (It waits for the page to load)
         return
     if not reconnect_time:
         reconnect_time = constants.UC.RECONNECT_TIME
@@ -636,6 +666,7 @@ def uc_open_with_cdp_mode(driver, url=None, **kwargs):
     """Activate CDP Mode with the URL and kwargs."""
     import asyncio
     from seleniumbase.undetected.cdp_driver import cdp_util
+    from seleniumbase.undetected.cdp_driver import readiness
 
     current_url = None
     try:
@@ -662,13 +693,8 @@ def uc_open_with_cdp_mode(driver, url=None, **kwargs):
         and hasattr(driver.cdp, "loop")
     ):
         # CDP Mode was already initialized
+        # (cdp.open() already waits for the page to load)
         driver.cdp.open(url, **kwargs)
-        if not safe_url:
-            time.sleep(constants.UC.CDP_MODE_OPEN_WAIT)
-            if IS_WINDOWS:
-                time.sleep(constants.UC.EXTRA_WINDOWS_WAIT)
-        else:
-            time.sleep(0.012)
         return
 
     headless = False
@@ -687,7 +713,10 @@ def uc_open_with_cdp_mode(driver, url=None, **kwargs):
     if hasattr(sb_config, "binary_location"):
         binary_location = sb_config.binary_location
 
-    loop = asyncio.new_event_loop()
+    if settings.CDP_BACKGROUND_LOOP:
+        loop = cdp_util.new_background_loop()
+    else:
+        loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
     driver.cdp_base = loop.run_until_complete(
         cdp_util.start(
@@ -748,12 +777,16 @@ def uc_open_with_cdp_mode(driver, url=None, **kwargs):
             shared_utils.make_writable(constants.MultiBrowser.PYAUTOGUILOCK)
         loop.run_until_complete(page.activate())
     loop.run_until_complete(page.wait())
+    # Wait for the page to load, with the old fixed pause as the limit.
+    max_wait = 0.012
     if not safe_url:
-        time.sleep(constants.UC.CDP_MODE_OPEN_WAIT)
+        max_wait = constants.UC.CDP_MODE_OPEN_WAIT
         if IS_WINDOWS:
-            time.sleep(constants.UC.EXTRA_WINDOWS_WAIT)
-    else:
-        time.sleep(0.012)
+            max_wait += constants.UC.EXTRA_WINDOWS_WAIT
+    with suppress(Exception):
+        loop.run_until_complete(
+            readiness.get_readiness(page).wait_for_load(max_wait)
+        )
     cdp = types.SimpleNamespace()
     CDPM = sb_cdp.CDPMethods(loop, page, driver)
     cdp.get = CDPM.get
@@ -783,6 +816,7 @@ def uc_open_with_cdp_mode(driver, url=None, **kwargs):
     cdp.go_back = CDPM.go_back
     cdp.go_forward = CDPM.go_forward
     cdp.get_navigation_history = CDPM.get_navigation_history
+    cdp.get_navigation_timing = CDPM.get_navigation_timing
     cdp.tile_windows = CDPM.tile_windows
     cdp.grant_permissions = CDPM.grant_permissions
     cdp.grant_all_permissions = CDPM.grant_all_permissions
@@ -989,8 +1023,7 @@ def uc_open_with_disconnect(driver, url, timeout=None):
     until after you've called driver.connect()."""
     url = shared_utils.fix_url_as_needed(url)
     if __is_cdp_swap_needed(driver):
-        driver.cdp.get(url)
-        time.sleep(0.3)
+        driver.cdp.get(url)  # (It waits for the page to load)
         return
     if not driver.is_connected():
         driver.connect()
@@ -2157,20 +2190,16 @@ def _add_chrome_proxy_extension(
                 proxy_zip = proxy_helper.PROXY_ZIP_PATH
                 chrome_options.add_extension(proxy_zip)
         else:
-            proxy_dir_lock = fasteners.InterProcessLock(PROXY_DIR_LOCK)
-            with proxy_dir_lock:
-                proxy_helper.create_proxy_ext(
-                    proxy_string,
-                    proxy_user,
-                    proxy_pass,
-                    proxy_scheme,
-                    bypass_list,
-                    zip_it=False,
-                )
-                proxy_dir_path = proxy_helper.PROXY_DIR_PATH
-                chrome_options = add_chrome_ext_dir(
-                    chrome_options, proxy_dir_path
-                )
+            proxy_dir_path = proxy_helper.get_proxy_ext_dir(
+                proxy_string,
+                proxy_user,
+                proxy_pass,
+                proxy_scheme,
+                bypass_list,
+            )
+            chrome_options = add_chrome_ext_dir(
+                chrome_options, proxy_dir_path
+            )
     else:
         # Multi-threaded
         if zip_it:
@@ -2191,24 +2220,16 @@ def _add_chrome_proxy_extension(
                 proxy_zip = proxy_helper.PROXY_ZIP_PATH
                 chrome_options.add_extension(proxy_zip)
         else:
-            proxy_dir_lock = fasteners.InterProcessLock(PROXY_DIR_LOCK)
-            with proxy_dir_lock:
-                with suppress(Exception):
-                    shared_utils.make_writable(PROXY_DIR_LOCK)
-                if multi_proxy:
-                    _set_proxy_filenames()
-                if not os.path.exists(proxy_helper.PROXY_DIR_PATH):
-                    proxy_helper.create_proxy_ext(
-                        proxy_string,
-                        proxy_user,
-                        proxy_pass,
-                        proxy_scheme,
-                        bypass_list,
-                        zip_it=False,
-                    )
-                chrome_options = add_chrome_ext_dir(
-                    chrome_options, proxy_helper.PROXY_DIR_PATH
-                )
+            proxy_dir_path = proxy_helper.get_proxy_ext_dir(
+                proxy_string,
+                proxy_user,
+                proxy_pass,
+                proxy_scheme,
+                bypass_list,
+            )
+            chrome_options = add_chrome_ext_dir(
+                chrome_options, proxy_dir_path
+            )
     return chrome_options
 
 
@@ -2218,19 +2239,6 @@ def is_using_uc(undetectable, browser_name):
     return False
 
 
-def _unzip_to_new_folder(zip_file, folder):
-    proxy_dir_lock = fasteners.InterProcessLock(PROXY_DIR_LOCK)
-    with proxy_dir_lock:
-        with suppress(Exception):
-            shared_utils.make_writable(PROXY_DIR_LOCK)
-        if not os.path.exists(folder):
-            import zipfile
-            zip_ref = zipfile.ZipFile(zip_file, "r")
-            os.makedirs(folder)
-            zip_ref.extractall(folder)
-            zip_ref.close()
-
-
 def add_chrome_ext_dir(chrome_options, dir_path):
     option_exists = False
     for arg in chrome_options.arguments:
@@ -2519,10 +2527,7 @@ def _set_chrome_options(
             abs_path = os.path.realpath(extension_zip_item)
             if os.path.exists(abs_path):
                 try:
-                    abs_path_dir = os.path.join(
-                        DOWNLOADS_FOLDER, abs_path.split(".")[0]
-                    )
-                    _unzip_to_new_folder(abs_path, abs_path_dir)
+                    abs_path_dir = extension_helper.get_unzipped_dir(abs_path)
                     chrome_options = add_chrome_ext_dir(
                         chrome_options, abs_path_dir
                     )
@@ -2571,30 +2576,24 @@ def _set_chrome_options(
     if (settings.DISABLE_CSP_ON_CHROME or disable_csp) and not headless:
         # Headless Chrome does not support extensions, which are required
         # for disabling the Content Security Policy on Chrome.
-        disable_csp_zip = DISABLE_CSP_ZIP_PATH
-        disable_csp_dir = os.path.join(DOWNLOADS_FOLDER, "disable_csp")
-        _unzip_to_new_folder(disable_csp_zip, disable_csp_dir)
+        disable_csp_dir = extension_helper.get_unzipped_dir(
+            DISABLE_CSP_ZIP_PATH
+        )
         chrome_options = add_chrome_ext_dir(
             chrome_options, disable_csp_dir
         )
         sb_config._ext_dirs.append(disable_csp_dir)
     if ad_block_on and not headless:
         # Headless Chrome does not support extensions.
-        ad_block_zip = AD_BLOCK_ZIP_PATH
-        ad_block_dir = os.path.join(DOWNLOADS_FOLDER, "ad_block")
-        _unzip_to_new_folder(ad_block_zip, ad_block_dir)
+        ad_block_dir = extension_helper.get_unzipped_dir(AD_BLOCK_ZIP_PATH)
         chrome_options = add_chrome_ext_dir(chrome_options, ad_block_dir)
         sb_config._ext_dirs.append(ad_block_dir)
     if recorder_ext and not headless:
-        recorder_zip = RECORDER_ZIP_PATH
-        recorder_dir = os.path.join(DOWNLOADS_FOLDER, "recorder")
-        _unzip_to_new_folder(recorder_zip, recorder_dir)
+        recorder_dir = extension_helper.get_unzipped_dir(RECORDER_ZIP_PATH)
         chrome_options = add_chrome_ext_dir(chrome_options, recorder_dir)
         sb_config._ext_dirs.append(recorder_dir)
     if chromium_arg and "sbase" in chromium_arg:
-        sbase_ext_zip = SBASE_EXT_ZIP_PATH
-        sbase_ext_dir = os.path.join(DOWNLOADS_FOLDER, "sbase_ext")
-        _unzip_to_new_folder(sbase_ext_zip, sbase_ext_dir)
+        sbase_ext_dir = extension_helper.get_unzipped_dir(SBASE_EXT_ZIP_PATH)
         chrome_options = add_chrome_ext_dir(chrome_options, sbase_ext_dir)
         sb_config._ext_dirs.append(sbase_ext_dir)
     if proxy_string:
@@ -0,0 +1,299 @@
+"""A pool of warm browsers that tests can lease and give back.
+Launching a browser (and its driver) takes longer than most short tests.
+A pool keeps finished browsers open, resets their state between leases,
+and recycles them after too many leases or too much memory usage.
+
+Usage with pytest:
+    pytest --browser-pool=2
+
+Usage with Driver():
+    from seleniumbase import Driver
+    from seleniumbase.core.browser_pool import BrowserPool
+
+    pool = BrowserPool(2, launcher=lambda: Driver(headless=True))
+    with pool.driver() as driver:
+        driver.get("https://seleniumbase.io/")
+    pool.close()
+"""
+import threading
+from contextlib import contextmanager
+from contextlib import suppress
+from seleniumbase.config import settings
+
+# Clears the storage of the current origin. (Without the CDP)
+CLEAR_STORAGE_JS = """
+    window.localStorage.clear();
+    window.sessionStorage.clear();
+    if (!window.indexedDB || !window.indexedDB.databases) {
+        return null;
+    }
+    return window.indexedDB.databases().then(function(databases) {
+        databases.forEach(function(database) {
+            window.indexedDB.deleteDatabase(database.name);
+        });
+        return null;
+    });
+"""
+
+
+class BrowserPool:
+    def __init__(
+        self, size=1, launcher=None, max_leases=None, max_memory_mb=None
+    ):
+        """size: The number of idle browsers kept open for each key.
+        launcher: A function that returns a new driver (used by lease()).
+        max_leases: Recycle a browser after this many leases.
+        max_memory_mb: Recycle a browser that uses more memory than this.
+            (Requires "psutil". Memory isn't checked without psutil.)"""
+        if max_leases is None:
+            max_leases = settings.BROWSER_POOL_MAX_LEASES
+        if max_memory_mb is None:
+            max_memory_mb = settings.BROWSER_POOL_MAX_MEMORY_MB
+        self.size = max(int(size), 1)
+        self.launcher = launcher
+        self.max_leases = max_leases
+        self.max_memory_mb = max_memory_mb
+        self.lease_counts = {}  # driver -> number of leases so far
+        self.leased = {}  # driver -> key
+        self.idle = {}  # key -> [driver, ...]
+        self.window_rects = {}  # driver -> window rect at launch
+        self.visited_origins = {}  # driver -> origins opened during a lease
+        self.lock = threading.Lock()
+
+    def lease(self, key=None, launcher=None):
+        """Returns a warm browser for the key, or launches a new one."""
+        driver = self.lease_idle(key)
+        if not driver:
+            launcher = launcher or self.launcher
+            if not launcher:
+                raise Exception("The BrowserPool needs a launcher!")
+            driver = launcher()
+            self.add(driver, key)
+        return driver
+
+    def lease_idle(self, key=None):
+        """Returns a warm browser for the key, or None if none are idle."""
+        while True:
+            with self.lock:
+                drivers = self.idle.get(key)
+                if not drivers:
+                    return None
+                driver = drivers.pop()
+            if self.__is_alive(driver):
+                with self.lock:
+                    self.leased[driver] = key
+                    self.lease_counts[driver] += 1
+                return driver
+            self.discard(driver)
+
+    def add(self, driver, key=None):
+        """Adds a newly-launched browser to the pool as a leased one."""
+        window_rect = None
+        with suppress(Exception):
+            window_rect = driver.get_window_rect()
+        with self.lock:
+            self.leased[driver] = key
+            self.lease_counts[driver] = 1
+            self.window_rects[driver] = window_rect
+
+    def is_leased(self, driver):
+        return driver in self.leased
+
+    def track_url(self, driver, url):
+        """Remembers the origin of a url that a leased browser opened,
+        so that reset() also clears the storage of that origin."""
+        origin = self.__get_origin(url)
+        if not origin:
+            return
+        with self.lock:
+            if driver in self.leased:
+                self.visited_origins.setdefault(driver, set()).add(origin)
+
+    def release(self, driver):
+        """Resets a leased browser and makes it idle again.
+        If the browser needs recycling (or there's no room), quits it.
+        Returns True if the browser was kept for the next lease."""
+        with self.lock:
+            if driver not in self.leased:
+                return False
+            key = self.leased.pop(driver)
+            room = len(self.idle.get(key, [])) < self.size
+        if (
+            not room
+            or self.lease_counts[driver] >= self.max_leases
+            or self.__is_over_memory_limit(driver)
+            or not self.reset(driver)
+        ):
+            self.discard(driver)
+            return False
+        with self.lock:
+            self.idle.setdefault(key, []).append(driver)
+        return True
+
+    def reset(self, driver):
+        """Clears the state left behind by the last test:
+        tabs, cookies, storage, permissions, and the window size.
+        Storage is cleared for every origin that the lease visited.
+        Returns False if the browser can't be reset."""
+        try:
+            is_chromium = self.__is_chromium(driver)
+            with self.lock:
+                origins = self.visited_origins.pop(driver, set())
+            handles = driver.window_handles
+            for handle in handles:
+                driver.switch_to.window(handle)
+                origins.update(self.__get_tab_origins(driver, is_chromium))
+            # A new tab has no history and no sessionStorage.
+            driver.switch_to.new_window("tab")
+            new_handle = driver.current_window_handle
+            for handle in handles:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(new_handle)
+            if is_chromium:
+                self.__clear_chromium_storage(driver, origins)
+                with suppress(Exception):
+                    driver.execute_cdp_cmd("Browser.resetPermissions", {})
+            else:
+                self.__clear_storage_with_js(driver, origins)
+            window_rect = self.window_rects.get(driver)
+            if window_rect and driver.get_window_rect() != window_rect:
+                driver.set_window_rect(**window_rect)
+        except Exception:
+            return False
+        return True
+
+    def discard(self, driver):
+        """Quits a browser and removes it from the pool."""
+        with self.lock:
+            self.leased.pop(driver, None)
+            self.lease_counts.pop(driver, None)
+            self.window_rects.pop(driver, None)
+            self.visited_origins.pop(driver, None)
+            for drivers in self.idle.values():
+                if driver in drivers:
+                    drivers.remove(driver)
+        with suppress(Exception):
+            driver.quit()
+
+    def warm_up(self, key=None, launcher=None):
+        """Launches browsers until the key has a full set of idle ones."""
+        launcher = launcher or self.launcher
+        while len(self.idle.get(key, [])) < self.size:
+            driver = launcher()
+            self.add(driver, key)
+            self.release(driver)
+
+    @contextmanager
+    def driver(self, key=None, launcher=None):
+        """Leases a browser for the duration of a "with" block."""
+        driver = self.lease(key, launcher)
+        try:
+            yield driver
+        finally:
+            self.release(driver)
+
+    def close(self):
+        """Quits every browser in the pool (leased or idle)."""
+        with self.lock:
+            drivers = list(self.leased)
+            for idle_drivers in self.idle.values():
+                drivers.extend(idle_drivers)
+        for driver in drivers:
+            self.discard(driver)
+
+    def __get_origin(self, url):
+        """Returns "scheme://host[:port]" for http(s) urls, else None."""
+        if not url or not url.startswith(("http:", "https:")):
+            return None
+        return "/".join(url.split("/")[:3])
+
+    def __get_tab_origins(self, driver, is_chromium):
+        """Returns the origins of the current tab: its url, and also
+        its history and frames on Chromium."""
+        urls = [driver.current_url]
+        if is_chromium:
+            with suppress(Exception):
+                history = driver.execute_cdp_cmd(
+                    "Page.getNavigationHistory", {}
+                )
+                urls.extend(entry["url"] for entry in history["entries"])
+            with suppress(Exception):
+                frame_trees = [
+                    driver.execute_cdp_cmd("Page.getFrameTree", {})[
+                        "frameTree"
+                    ]
+                ]
+                while frame_trees:
+                    frame_tree = frame_trees.pop()
+                    urls.append(frame_tree["frame"]["url"])
+                    frame_trees.extend(frame_tree.get("childFrames", []))
+        origins = set()
+        for url in urls:
+            origin = self.__get_origin(url)
+            if origin:
+                origins.add(origin)
+        return origins
+
+    def __clear_chromium_storage(self, driver, origins):
+        """Clears every cookie of the browser, and the storage
+        (localStorage, IndexedDB, caches, etc.) of each origin."""
+        with suppress(Exception):
+            cookies = driver.execute_cdp_cmd("Storage.getCookies", {})
+            for cookie in cookies["cookies"]:
+                domain = cookie["domain"].lstrip(".")
+                origins.add("https://" + domain)
+                origins.add("http://" + domain)
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        for origin in sorted(origins):
+            driver.execute_cdp_cmd(
+                "Storage.clearDataForOrigin",
+                {"origin": origin, "storageTypes": "all"},
+            )
+
+    def __clear_storage_with_js(self, driver, origins):
+        """Opens each origin to clear its cookies and storage.
+        (For browsers without the CDP)"""
+        for origin in sorted(origins):
+            with suppress(Exception):
+                driver.get(origin)
+                driver.execute_script(CLEAR_STORAGE_JS)
+                driver.delete_all_cookies()
+        if origins:
+            driver.get("about:blank")
+
+    def __is_alive(self, driver):
+        try:
+            return len(driver.window_handles) > 0
+        except Exception:
+            return False
+
+    def __is_chromium(self, driver):
+        with suppress(Exception):
+            browser_name = driver.capabilities["browserName"].lower()
+            return (
+                browser_name in ["chrome", "msedge", "edge", "chromium"]
+                and hasattr(driver, "execute_cdp_cmd")
+            )
+        return False
+
+    def __is_over_memory_limit(self, driver):
+        if not self.max_memory_mb:
+            return False
+        try:
+            import psutil
+        except Exception:
+            return False
+        try:
+            if getattr(driver, "browser_pid", None):
+                process = psutil.Process(driver.browser_pid)
+            else:
+                process = psutil.Process(driver.service.process.pid)
+            processes = [process] + process.children(recursive=True)
+            rss = 0
+            for proc in processes:
+                with suppress(Exception):
+                    rss += proc.memory_info().rss
+            return rss > self.max_memory_mb * 1024 * 1024
+        except Exception:
+            return False
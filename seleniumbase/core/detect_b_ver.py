@@ -1,11 +1,15 @@
 """Detect the browser version before launching tests.
 Eg. detect_b_ver.get_browser_version_from_os("google-chrome")"""
 import datetime
+import fasteners
+import json
 import os
 import platform
 import re
 import subprocess
 import sys
+from seleniumbase import drivers
+from seleniumbase.fixtures import constants
 
 
 class File(object):
@@ -50,6 +54,79 @@ PATTERN = {
     ChromeType.GOOGLE: r"\d+\.\d+\.\d+",
     ChromeType.MSEDGE: r"\d+\.\d+\.\d+",
 }
+DRIVER_DIR = os.path.dirname(os.path.realpath(drivers.__file__))
+VERSION_CACHE_PATH = os.path.join(DRIVER_DIR, constants.VersionCache.FILE_NAME)
+VERSION_CACHE_LOCK = os.path.join(DRIVER_DIR, constants.VersionCache.LOCKFILE)
+_version_memo = {}  # In-process memo on top of the on-disk version cache
+
+
+def get_file_signature(path):
+    """Returns "path|mtime|size" for a file, or None if it's missing.
+    The signature changes whenever the file is updated or replaced."""
+    try:
+        path = os.path.realpath(path)
+        stat = os.stat(path)
+        return "%s|%s|%s" % (path, stat.st_mtime_ns, stat.st_size)
+    except Exception:
+        return None
+
+
+def _read_version_cache():
+    try:
+        with open(VERSION_CACHE_PATH, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+        if isinstance(cache, dict):
+            return cache
+    except Exception:
+        pass
+    return {}
+
+
+def _write_version_cache(cache):
+    try:
+        temp_path = VERSION_CACHE_PATH + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(cache, f, indent=0, sort_keys=True)
+        os.replace(temp_path, VERSION_CACHE_PATH)
+    except Exception:
+        pass  # The cache is optional (Eg. The drivers folder is read-only)
+
+
+def get_cached_version(kind, path, get_version):
+    """Returns get_version() for the binary at the given path.
+    Results are cached by kind + path + mtime + size: first in memory,
+    and then on disk so that parallel processes (Eg. pytest-xdist workers)
+    don't all spawn the same subprocess just to learn the same version.
+    The cache lock is held while get_version() runs, so the first process
+    finds the version, and the others wait and then read it from disk."""
+    signature = get_file_signature(path) if path else None
+    if not signature:
+        return get_version()
+    key = "%s|%s" % (kind, signature)
+    if key in _version_memo:
+        return _version_memo[key]
+    try:
+        version_cache_lock = fasteners.InterProcessLock(VERSION_CACHE_LOCK)
+        version_cache_lock.acquire()
+    except Exception:
+        return get_version()
+    try:
+        cache = _read_version_cache()
+        version = cache.get(key)
+        if not version:
+            version = get_version()
+            if version:
+                path_prefix = "%s|%s|" % (kind, signature.split("|")[0])
+                for old_key in list(cache.keys()):
+                    if old_key.startswith(path_prefix):
+                        del cache[old_key]  # Outdated binary
+                cache[key] = version
+                _write_version_cache(cache)
+    finally:
+        version_cache_lock.release()
+    if version:
+        _version_memo[key] = version
+    return version
 
 
 def os_name():
@@ -471,6 +548,14 @@ def get_binary_location(browser_type, chromium_ok=False):
 
 
 def get_browser_version_from_binary(binary_location):
+    return get_cached_version(
+        "binary",
+        binary_location,
+        lambda: _get_browser_version_from_binary(binary_location),
+    )
+
+
+def _get_browser_version_from_binary(binary_location):
     try:
         if not os.path.exists(binary_location):
             return None
@@ -500,6 +585,19 @@ def get_browser_version_from_binary(binary_location):
 
 def get_browser_version_from_os(browser_type):
     """Return installed browser version."""
+    binary_location = None
+    try:
+        binary_location = get_binary_location(browser_type)
+    except Exception:
+        pass
+    return get_cached_version(
+        "os_%s" % browser_type,
+        binary_location,
+        lambda: _get_browser_version_from_os(browser_type),
+    )
+
+
+def _get_browser_version_from_os(browser_type):
     cmd_mapping = {
         ChromeType.GOOGLE: {
             OSType.LINUX: linux_browser_apps_to_cmd(
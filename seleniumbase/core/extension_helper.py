@@ -0,0 +1,89 @@
+"""Builds Chromium extension folders once, and then reuses them.
+Each folder is named after a hash of its contents, which means that
+a folder that already exists is always complete and up-to-date.
+Folders are built in a temporary location and then renamed into place
+(an atomic operation), so parallel processes don't need a lock to share
+them, and a browser never loads a partially-extracted extension."""
+import hashlib
+import os
+import shutil
+import uuid
+import zipfile
+from contextlib import suppress
+from seleniumbase.fixtures import constants
+from seleniumbase.fixtures import shared_utils
+
+EXTENSIONS_CACHE_DIR = os.path.join(
+    constants.Files.DOWNLOADS_FOLDER, "extensions_cache"
+)
+_zip_hashes = {}  # (path, mtime, size) -> hash of the zip file contents
+
+
+def get_zip_hash(zip_file):
+    """Returns a short hash of a zip file's contents.
+    (Remembered by path + mtime + size so that the file is only read once.)"""
+    zip_file = os.path.realpath(zip_file)
+    stat = os.stat(zip_file)
+    key = (zip_file, stat.st_mtime_ns, stat.st_size)
+    if key not in _zip_hashes:
+        with open(zip_file, "rb") as f:
+            _zip_hashes[key] = hashlib.sha256(f.read()).hexdigest()[:16]
+    return _zip_hashes[key]
+
+
+def get_files_hash(files):
+    """Returns a short hash of a {file_name: text} dictionary."""
+    sha = hashlib.sha256()
+    for file_name in sorted(files.keys()):
+        sha.update(file_name.encode("utf-8") + b"\0")
+        sha.update(files[file_name].encode("utf-8") + b"\0")
+    return sha.hexdigest()[:16]
+
+
+def _build_dir(name, content_hash, write_files):
+    folder = os.path.join(EXTENSIONS_CACHE_DIR, "%s_%s" % (name, content_hash))
+    if os.path.exists(folder):
+        return folder
+    os.makedirs(EXTENSIONS_CACHE_DIR, exist_ok=True)
+    temp_folder = "%s.%s.tmp" % (folder, uuid.uuid4().hex[:8])
+    os.makedirs(temp_folder)
+    try:
+        write_files(temp_folder)
+        with suppress(Exception):
+            shared_utils.make_dir_files_writable(temp_folder)
+        try:
+            os.rename(temp_folder, folder)
+        except OSError:
+            if not os.path.exists(folder):
+                raise
+            # Another process finished building the same folder first
+    finally:
+        if os.path.exists(temp_folder):
+            shutil.rmtree(temp_folder, ignore_errors=True)
+    return folder
+
+
+def get_unzipped_dir(zip_file, name=None):
+    """Returns a cached folder with the contents of an extension zip file.
+    The zip file is only extracted if its contents haven't been seen."""
+    if not name:
+        name = os.path.basename(zip_file).split(".")[0]
+
+    def write_files(folder):
+        with zipfile.ZipFile(zip_file, "r") as zip_ref:
+            zip_ref.extractall(folder)
+
+    return _build_dir(name, get_zip_hash(zip_file), write_files)
+
+
+def get_files_dir(name, files):
+    """Returns a cached folder containing the {file_name: text} files."""
+
+    def write_files(folder):
+        for file_name, text in files.items():
+            with open(
+                os.path.join(folder, file_name), mode="w", encoding="utf-8"
+            ) as f:
+                f.write(text)
+
+    return _build_dir(name, get_files_hash(files), write_files)
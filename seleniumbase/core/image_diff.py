@@ -0,0 +1,243 @@
+"""Pixel comparisons of screenshots. (Used by check_window(pixel_diff=True))
+Screenshots are decoded into NumPy arrays and compared in square tiles.
+* A pixel is different if a color channel differs by more than tolerance.
+* With anti_aliasing=True, a different pixel is still allowed if it
+  matches a neighbor (within 1 pixel) in the other image, both ways.
+  (Text and edges are often smoothed slightly differently.)
+* The file hash and tile hashes of a baseline are cached in a file next
+  to it. If the latest screenshot is an identical file, nothing is decoded.
+  If every tile of the latest screenshot has the same hash, then the
+  baseline doesn't need to be decoded or compared at all.
+NumPy and Pillow get installed on first use if they aren't already."""
+import hashlib
+import json
+import os
+from contextlib import suppress
+from seleniumbase.fixtures import constants
+from seleniumbase.fixtures import shared_utils
+
+
+class ImageDiff:
+    """The result of compare_images().
+    (If the sizes are different, the overlap is compared as one tile.)"""
+
+    def __init__(
+        self, diff_pixels, total_pixels, changed_tiles, total_tiles, size
+    ):
+        self.diff_pixels = diff_pixels
+        self.total_pixels = total_pixels
+        self.changed_tiles = changed_tiles
+        self.total_tiles = total_tiles
+        self.size = size  # (width, height) of the latest screenshot
+        self.size_changed = False
+
+
+def __import_numpy_and_pil():
+    import fasteners
+
+    pip_find_lock = fasteners.InterProcessLock(constants.PipInstall.FINDLOCK)
+    with pip_find_lock:
+        with suppress(Exception):
+            shared_utils.make_writable(constants.PipInstall.FINDLOCK)
+        try:
+            import numpy
+        except Exception:
+            shared_utils.pip_install("numpy")
+            import numpy
+        try:
+            from PIL import Image
+        except Exception:
+            shared_utils.pip_install("Pillow")
+            from PIL import Image
+    return numpy, Image
+
+
+def load_pixels(png_path):
+    """Returns the pixels of an image as a (height, width, 3) uint8 array."""
+    np, Image = __import_numpy_and_pil()
+    with Image.open(png_path) as image:
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        return np.asarray(image)
+
+
+def get_tile_hashes(pixels, tile_size):
+    """Returns the hashes of the tiles of an image, row by row."""
+    height, width = pixels.shape[:2]
+    hashes = []
+    for y in range(0, height, tile_size):
+        tile_row = pixels[y:y + tile_size]
+        for x in range(0, width, tile_size):
+            hashes.append(
+                hashlib.blake2b(
+                    tile_row[:, x:x + tile_size].tobytes(), digest_size=8
+                ).hexdigest()
+            )
+    return hashes
+
+
+def get_file_hash(file_path):
+    with open(file_path, mode="rb") as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+
+def get_tiles_file(baseline_png):
+    return os.path.splitext(baseline_png)[0] + "_tiles.json"
+
+
+def get_baseline_tile_hashes(baseline_png, tile_size):
+    """Returns ((height, width), tile_hashes, file_hash) of a baseline image.
+    The result is cached in a file next to the baseline, and the cache
+    is only used while the baseline has the same size and mtime."""
+    stat = os.stat(baseline_png)
+    key = [stat.st_size, stat.st_mtime_ns, tile_size]
+    tiles_file = get_tiles_file(baseline_png)
+    with suppress(Exception):
+        with open(tiles_file, mode="r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data["key"] == key:
+            return tuple(data["shape"]), data["hashes"], data["file_hash"]
+    pixels = load_pixels(baseline_png)
+    shape = pixels.shape[:2]
+    hashes = get_tile_hashes(pixels, tile_size)
+    file_hash = get_file_hash(baseline_png)
+    with suppress(Exception):
+        with open(tiles_file, mode="w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "key": key,
+                    "shape": shape,
+                    "hashes": hashes,
+                    "file_hash": file_hash,
+                },
+                f,
+            )
+    return shape, hashes, file_hash
+
+
+def __get_neighbor_match(np, pixels, other, bounds, tolerance):
+    """Returns a mask of the pixels (in bounds) that are within tolerance
+    of at least one pixel in the same 3x3 neighborhood of the other image."""
+    y0, y1, x0, x1 = bounds
+    height, width = other.shape[:2]
+    py0, py1 = max(y0 - 1, 0), min(y1 + 1, height)
+    px0, px1 = max(x0 - 1, 0), min(x1 + 1, width)
+    padded = np.pad(
+        other[py0:py1, px0:px1].astype(np.int16),
+        (
+            (1 - (y0 - py0), 1 - (py1 - y1)),
+            (1 - (x0 - px0), 1 - (px1 - x1)),
+            (0, 0),
+        ),
+        mode="edge",
+    )
+    region = pixels[y0:y1, x0:x1].astype(np.int16)
+    tile_height, tile_width = region.shape[:2]
+    closest = None
+    for dy in range(3):
+        for dx in range(3):
+            shifted = padded[dy:dy + tile_height, dx:dx + tile_width]
+            distance = np.abs(shifted - region).max(axis=2)
+            if closest is None:
+                closest = distance
+            else:
+                np.minimum(closest, distance, out=closest)
+    return closest <= tolerance
+
+
+def __save_diff_mask(Image, latest, mask, diff_png):
+    """Saves the latest screenshot (faded) with differences in red."""
+    height, width = mask.shape
+    image = Image.new("RGB", (width, height), (255, 255, 255))
+    faded = Image.fromarray(latest).convert("L").point(lambda v: 192 + v // 4)
+    image.paste(faded.convert("RGB"), (0, 0))
+    image.paste((255, 0, 0), (0, 0), Image.fromarray(mask))
+    image.save(diff_png, compress_level=1)
+
+
+def compare_images(
+    baseline_png,
+    latest_png,
+    diff_png=None,
+    tolerance=constants.VisualBaseline.PIXEL_TOLERANCE,
+    anti_aliasing=True,
+    tile_size=constants.VisualBaseline.TILE_SIZE,
+):
+    """Compares the latest screenshot to the baseline. Returns an ImageDiff.
+    If pixels are different, and diff_png is set, saves a diff mask there.
+    (Pixels outside the overlap of different-sized images are different.)
+    :param tolerance: The max difference (0-255) of a matching color channel.
+    :param anti_aliasing: Allow pixels that match a neighbor in the other
+        image. (Eg. text or edges rendered with different smoothing.)"""
+    np, Image = __import_numpy_and_pil()
+    b_shape, b_hashes, b_file_hash = get_baseline_tile_hashes(
+        baseline_png, tile_size
+    )
+    if get_file_hash(latest_png) == b_file_hash:
+        if diff_png:
+            with suppress(Exception):
+                os.remove(diff_png)
+        tiles_y = -(-b_shape[0] // tile_size)
+        tiles_x = -(-b_shape[1] // tile_size)
+        return ImageDiff(
+            0, b_shape[0] * b_shape[1], 0, tiles_y * tiles_x, b_shape[::-1]
+        )
+    latest = load_pixels(latest_png)
+    l_shape = latest.shape[:2]
+    height = max(b_shape[0], l_shape[0])
+    width = max(b_shape[1], l_shape[1])
+    overlap = (min(b_shape[0], l_shape[0]), min(b_shape[1], l_shape[1]))
+    tiles = [
+        (y, min(y + tile_size, overlap[0]), x, min(x + tile_size, overlap[1]))
+        for y in range(0, overlap[0], tile_size)
+        for x in range(0, overlap[1], tile_size)
+    ]
+    result = ImageDiff(0, height * width, 0, len(tiles), l_shape[::-1])
+    result.size_changed = b_shape != l_shape
+    if result.size_changed:
+        # The tiles don't line up, so compare the overlap all at once
+        tiles = [(0, overlap[0], 0, overlap[1])]
+    else:
+        l_hashes = get_tile_hashes(latest, tile_size)
+        tiles = [
+            tile
+            for tile, b_hash, l_hash in zip(tiles, b_hashes, l_hashes)
+            if b_hash != l_hash
+        ]
+        if not tiles:
+            if diff_png:
+                with suppress(Exception):
+                    os.remove(diff_png)
+            return result
+    baseline = load_pixels(baseline_png)
+    mask = np.zeros((height, width), dtype=bool)
+    mask[overlap[0]:, :] = True
+    mask[:, overlap[1]:] = True
+    for bounds in tiles:
+        y0, y1, x0, x1 = bounds
+        different = (
+            np.abs(
+                baseline[y0:y1, x0:x1].astype(np.int16)
+                - latest[y0:y1, x0:x1].astype(np.int16)
+            ).max(axis=2)
+            > tolerance
+        )
+        if not different.any():
+            continue
+        result.changed_tiles += 1
+        if anti_aliasing:
+            different &= ~(
+                __get_neighbor_match(np, latest, baseline, bounds, tolerance)
+                & __get_neighbor_match(
+                    np, baseline, latest, bounds, tolerance
+                )
+            )
+        mask[y0:y1, x0:x1] = different
+    result.diff_pixels = int(mask.sum())
+    if diff_png:
+        if result.diff_pixels:
+            __save_diff_mask(Image, latest, mask, diff_png)
+        else:
+            with suppress(Exception):
+                os.remove(diff_png)
+    return result
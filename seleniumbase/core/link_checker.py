@@ -0,0 +1,146 @@
+"""Checks the status codes of many links at once.
+Used by assert_no_404_errors() / assert_no_broken_links().
+* Each host gets one requests.Session, so connections are kept alive
+  and reused between links (and between tests).
+* Each host has a limit on concurrent requests, and the links are
+  scheduled round-robin by host so that one big host can't hog
+  all the worker threads.
+* HEAD requests are tried first. If a HEAD request fails or returns
+  a status that some servers only give to HEAD requests (Eg. 404, 405),
+  the link is checked again with a streamed GET request.
+* Status codes are cached (with a TTL) for the rest of the session,
+  so links that appear on every page (headers/footers) get checked once.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from seleniumbase.fixtures import constants
+
+_sessions = {}  # host -> (requests.Session, BoundedSemaphore)
+_status_cache = {}  # (link, verify) -> (status_code, time_checked)
+_lock = threading.Lock()
+
+
+def _get_host(link):
+    return "/".join(link.split("/")[:3]).lower()
+
+
+def _get_session(host):
+    with _lock:
+        if host not in _sessions:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            max_per_host = constants.LinkCheck.MAX_PER_HOST
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=1, pool_maxsize=max_per_host
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            host_limit = threading.BoundedSemaphore(max_per_host)
+            _sessions[host] = (session, host_limit)
+        return _sessions[host]
+
+
+def _request_status_code(session, method, link, timeout, verify):
+    """Returns the status code, or None if the request failed."""
+    try:
+        response = session.request(
+            method,
+            link,
+            allow_redirects=False,
+            timeout=timeout,
+            verify=verify,
+            stream=True,  # Don't download the body of GET requests
+        )
+        response.close()
+        return response.status_code
+    except Exception:
+        return None
+
+
+def get_cached_status_code(link, verify=False):
+    """Returns the cached status code of a link, or None if not cached."""
+    cached = _status_cache.get((link, verify))
+    if cached and time.time() - cached[1] < constants.LinkCheck.CACHE_TTL:
+        return cached[0]
+    return None
+
+
+def get_status_code(link, timeout=5, verify=False):
+    """Returns the status code of a link. (Uses the cache if possible.)
+    If the link can't be reached, returns a 404 (which isn't cached)."""
+    status_code = get_cached_status_code(link, verify)
+    if status_code is not None:
+        return status_code
+    session, host_limit = _get_session(_get_host(link))
+    with host_limit:
+        status_code = _request_status_code(
+            session, "HEAD", link, timeout, verify
+        )
+        if (
+            status_code is None
+            or status_code in constants.LinkCheck.HEAD_FALLBACK_CODES
+        ):
+            get_code = _request_status_code(
+                session, "GET", link, timeout, verify
+            )
+            if get_code is not None:
+                status_code = get_code
+    if status_code is None:
+        return 404
+    _status_cache[(link, verify)] = (status_code, time.time())
+    return status_code
+
+
+def _interleave_by_host(links):
+    """Orders links round-robin by host: [a1, b1, c1, a2, b2, a3, ...]"""
+    by_host = {}
+    for link in links:
+        by_host.setdefault(_get_host(link), []).append(link)
+    ordered = []
+    host_links = list(by_host.values())
+    for i in range(max([len(hl) for hl in host_links] or [0])):
+        for hl in host_links:
+            if i < len(hl):
+                ordered.append(hl[i])
+    return ordered
+
+
+def get_status_codes(links, timeout=5, verify=False, multithreaded=True):
+    """Returns a {link: status_code} dictionary for a list of links."""
+    results = {}
+    unchecked = []
+    for link in links:
+        status_code = get_cached_status_code(link, verify)
+        if status_code is not None:
+            results[link] = status_code
+        elif link not in unchecked:
+            unchecked.append(link)
+    if not unchecked:
+        return results
+    unchecked = _interleave_by_host(unchecked)
+    if not multithreaded or len(unchecked) == 1:
+        for link in unchecked:
+            results[link] = get_status_code(link, timeout, verify)
+        return results
+    max_workers = min(constants.LinkCheck.MAX_WORKERS, len(unchecked))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        status_codes = executor.map(
+            lambda link: get_status_code(link, timeout, verify), unchecked
+        )
+        for link, status_code in zip(unchecked, status_codes):
+            results[link] = status_code
+    return results
+
+
+def clear_cache():
+    """Clears cached status codes and closes the kept-alive sessions."""
+    with _lock:
+        _status_cache.clear()
+        for session, _ in _sessions.values():
+            with suppress(Exception):
+                session.close()
+        _sessions.clear()
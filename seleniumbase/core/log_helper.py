@@ -1,7 +1,11 @@
+import gzip
+import hashlib
 import os
 import shutil
 import sys
+import tempfile
 import time
+import weakref
 from contextlib import suppress
 from seleniumbase import config as sb_config
 from seleniumbase.config import settings
@@ -353,21 +357,170 @@ def log_skipped_test_data(test, test_logpath, driver, browser, reason):
         shared_utils.make_writable(file_path)
 
 
+def get_page_source_name():
+    if settings.COMPRESS_PAGE_SOURCE:
+        return settings.PAGE_SOURCE_NAME + ".gz"
+    return settings.PAGE_SOURCE_NAME
+
+
+def __open_page_source_file(file_path, compressed):
+    if compressed:
+        return gzip.open(file_path, mode="wb", compresslevel=6)
+    return open(file_path, mode="wb")
+
+
+def _remove_file(file_path):
+    with suppress(Exception):
+        os.remove(file_path)
+
+
+class PageSourceCapture:
+    """A page source that was streamed into a temporary file.
+    This is used (instead of a string) for the page source of a failure,
+    so that multi-MB page sources don't stay in memory until tearDown().
+    Use save() to put a copy of it into a log folder."""
+
+    def __init__(self, file_path, digest, compressed):
+        self.file_path = file_path
+        self.digest = digest
+        self.compressed = compressed
+        self.saved_paths = []
+        weakref.finalize(self, _remove_file, file_path)
+
+    def save(self, test_logpath):
+        """Saves the page source into the log folder.
+        If it was already saved elsewhere, a hard link is used if possible.
+        (With DEDUPLICATE_PAGE_SOURCE, consecutive failures on an
+        identical page share one capture, and thus one file on disk.)"""
+        file_path = os.path.join(test_logpath, get_page_source_name())
+        if file_path in self.saved_paths and os.path.exists(file_path):
+            return file_path
+        _remove_file(file_path)
+        for saved_path in self.saved_paths:
+            with suppress(Exception):
+                if os.path.exists(saved_path):
+                    os.link(saved_path, file_path)
+                    break
+        else:
+            shutil.copyfile(self.file_path, file_path)
+            shared_utils.make_writable(file_path)
+        self.saved_paths.append(file_path)
+        return file_path
+
+    def read(self):
+        """Returns the page source as a string."""
+        opener = gzip.open if self.compressed else open
+        with opener(self.file_path, mode="rb") as f:
+            return f.read().decode("utf-8")
+
+
+_last_page_source_capture = None
+
+
+def __iter_page_source_chunks(driver):
+    """Yields the page source in chunks, starting with the base href.
+    With a WebDriver, the page source is read from the page in pieces,
+    so the full string never gets loaded into the Python process."""
+    last_page = get_last_page(driver)
+    if "://" not in last_page:
+        return
+    base_href_html = get_base_href_html(last_page)
+    meta_charset = '<meta charset="utf-8">'
+    if __is_cdp_swap_needed(driver):
+        page_source = driver.cdp.get_page_source()
+        if ' charset="' not in page_source:
+            base_href_html += "\n" + meta_charset
+        yield base_href_html + "\n"
+        yield page_source
+        return
+    js_var = constants.PageSource.JS_VAR
+    chunk_size = constants.PageSource.CHUNK_SIZE
+    try:
+        length, has_charset = driver.execute_script(
+            """var s = new XMLSerializer().serializeToString(document);
+            window.%s = s;
+            return [s.length, s.indexOf(' charset="') >= 0];"""
+            % js_var
+        )
+    except Exception:
+        page_source = driver.page_source
+        if ' charset="' not in page_source:
+            base_href_html += "\n" + meta_charset
+        yield base_href_html + "\n"
+        yield page_source
+        return
+    if not has_charset:
+        base_href_html += "\n" + meta_charset
+    yield base_href_html + "\n"
+    try:
+        start = 0
+        while start < length:
+            # (Don't split a UTF-16 surrogate pair between chunks)
+            chunk, start = driver.execute_script(
+                """var s = window.%s;
+                var end = Math.min(arguments[0] + arguments[1], s.length);
+                var c = s.charCodeAt(end - 1);
+                if (end < s.length && c >= 0xD800 && c <= 0xDBFF) end--;
+                return [s.slice(arguments[0], end), end];"""
+                % js_var,
+                start,
+                chunk_size,
+            )
+            yield chunk
+    finally:
+        with suppress(Exception):
+            driver.execute_script("delete window.%s;" % js_var)
+
+
+def capture_page_source(driver):
+    """Streams the page source (with the base href) into a temporary file.
+    Returns a PageSourceCapture. If the capture is identical to the previous
+    one, (and DEDUPLICATE_PAGE_SOURCE is set), then returns the previous one.
+    Returns PAGE_SOURCE_UNDEFINED if the page source couldn't be captured."""
+    global _last_page_source_capture
+    compressed = settings.COMPRESS_PAGE_SOURCE
+    fd, file_path = tempfile.mkstemp(
+        prefix="sb_page_source_", suffix=".html.gz" if compressed else ".html"
+    )
+    os.close(fd)
+    sha = hashlib.sha256()
+    try:
+        with __open_page_source_file(file_path, compressed) as f:
+            for chunk in __iter_page_source_chunks(driver):
+                data = chunk.encode("utf-8", errors="replace")
+                sha.update(data)
+                f.write(data)
+    except Exception:
+        _remove_file(file_path)
+        return constants.Warnings.PAGE_SOURCE_UNDEFINED
+    digest = sha.hexdigest()
+    last_capture = _last_page_source_capture
+    if (
+        settings.DEDUPLICATE_PAGE_SOURCE
+        and last_capture
+        and last_capture.digest == digest
+        and last_capture.compressed == compressed
+        and os.path.exists(last_capture.file_path)
+    ):
+        _remove_file(file_path)
+        return last_capture
+    capture = PageSourceCapture(file_path, digest, compressed)
+    _last_page_source_capture = capture
+    return capture
+
+
 def log_page_source(test_logpath, driver, source=None):
-    html_file_name = settings.PAGE_SOURCE_NAME
-    if source:
-        page_source = source
-    else:
-        try:
-            page_source = None
-            if __is_cdp_swap_needed(driver):
-                page_source = driver.cdp.get_page_source()
-            else:
-                page_source = driver.page_source
-            page_source = get_html_source_with_base_href(driver, page_source)
-        except Exception:
-            source = constants.Warnings.PAGE_SOURCE_UNDEFINED
-            page_source = constants.Warnings.PAGE_SOURCE_UNDEFINED
+    if not source:
+        source = capture_page_source(driver)
+    if not os.path.exists(test_logpath):
+        with suppress(Exception):
+            os.makedirs(test_logpath)
+    if isinstance(source, PageSourceCapture):
+        with suppress(Exception):
+            source.save(test_logpath)
+            return
+        source = constants.Warnings.PAGE_SOURCE_UNDEFINED
+    page_source = source
     if source == constants.Warnings.PAGE_SOURCE_UNDEFINED:
         page_source = (
             "<h3>Warning: "
@@ -377,14 +530,12 @@ def log_page_source(test_logpath, driver, source=None):
                 "unresponsive, or closed prematurely!</h4>"
             )
         )
-    if not os.path.exists(test_logpath):
-        with suppress(Exception):
-            os.makedirs(test_logpath)
-    html_file_path = os.path.join(test_logpath, html_file_name)
+    html_file_path = os.path.join(test_logpath, get_page_source_name())
     with suppress(Exception):
-        html_file = open(html_file_path, mode="w+", encoding="utf-8")
-        html_file.write(page_source)
-        html_file.close()
+        with __open_page_source_file(
+            html_file_path, settings.COMPRESS_PAGE_SOURCE
+        ) as html_file:
+            html_file.write(page_source.encode("utf-8", errors="replace"))
         shared_utils.make_writable(html_file_path)
 
 
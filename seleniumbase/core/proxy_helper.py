@@ -5,6 +5,7 @@ import zipfile
 from contextlib import suppress
 from seleniumbase.config import proxy_list
 from seleniumbase.config import settings
+from seleniumbase.core import extension_helper
 from seleniumbase.fixtures import constants
 from seleniumbase.fixtures import page_utils
 from seleniumbase.fixtures import shared_utils
@@ -16,20 +17,14 @@ PROXY_DIR_PATH = os.path.join(DOWNLOADS_DIR, "proxy_ext_dir")
 PROXY_DIR_LOCK = os.path.join(DOWNLOADS_DIR, "proxy_dir.lock")
 
 
-def create_proxy_ext(
+def get_proxy_ext_files(
     proxy_string,
     proxy_user,
     proxy_pass,
     proxy_scheme="http",
     bypass_list=None,
-    zip_it=True,
 ):
-    """Implementation of https://stackoverflow.com/a/35293284 for
-    https://stackoverflow.com/questions/12848327/
-    (Run Selenium on a proxy server that requires authentication.)
-    Solution involves creating & adding a Chromium extension at runtime.
-    CHROMIUM-ONLY! *** Only Chrome and Edge browsers are supported. ***
-    """
+    """Returns the {file_name: text} files of the proxy extension."""
     background_js = None
     if not bypass_list:
         bypass_list = ""
@@ -123,6 +118,28 @@ def create_proxy_ext(
         """"minimum_chrome_version":"88.0.0"\n"""
         """}"""
     )
+    return {"background.js": background_js, "manifest.json": manifest_json}
+
+
+def create_proxy_ext(
+    proxy_string,
+    proxy_user,
+    proxy_pass,
+    proxy_scheme="http",
+    bypass_list=None,
+    zip_it=True,
+):
+    """Implementation of https://stackoverflow.com/a/35293284 for
+    https://stackoverflow.com/questions/12848327/
+    (Run Selenium on a proxy server that requires authentication.)
+    Solution involves creating & adding a Chromium extension at runtime.
+    CHROMIUM-ONLY! *** Only Chrome and Edge browsers are supported. ***
+    """
+    ext_files = get_proxy_ext_files(
+        proxy_string, proxy_user, proxy_pass, proxy_scheme, bypass_list
+    )
+    background_js = ext_files["background.js"]
+    manifest_json = ext_files["manifest.json"]
     abs_path = os.path.abspath(".")
     downloads_path = os.path.join(abs_path, DOWNLOADS_DIR)
     if not os.path.exists(downloads_path):
@@ -145,8 +162,6 @@ def create_proxy_ext(
             f.write(manifest_json)
         with suppress(Exception):
             shared_utils.make_writable(manifest_json)
-        proxy_host = proxy_string.split(":")[0]
-        proxy_port = proxy_string.split(":")[1]
         background_file = os.path.join(proxy_ext_dir, "background.js")
         with open(background_file, mode="w") as f:
             f.write(background_js)
@@ -154,6 +169,25 @@ def create_proxy_ext(
             shared_utils.make_writable(background_js)
 
 
+def get_proxy_ext_dir(
+    proxy_string,
+    proxy_user,
+    proxy_pass,
+    proxy_scheme="http",
+    bypass_list=None,
+):
+    """Returns a cached proxy extension folder for this proxy config.
+    Each config gets its own folder (named by a hash of the files),
+    so parallel processes can share folders without locking them.
+    (Also sets PROXY_DIR_PATH to the folder for later installs.)"""
+    global PROXY_DIR_PATH
+    ext_files = get_proxy_ext_files(
+        proxy_string, proxy_user, proxy_pass, proxy_scheme, bypass_list
+    )
+    PROXY_DIR_PATH = extension_helper.get_files_dir("proxy_ext", ext_files)
+    return PROXY_DIR_PATH
+
+
 def remove_proxy_zip_if_present():
     """Remove Chromium extension zip file used for proxy server authentication.
     Used in the implementation of https://stackoverflow.com/a/35293284
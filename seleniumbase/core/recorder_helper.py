@@ -1,592 +1,305 @@
-"""Generating SeleniumBase Python code from the Recorder"""
+"""Generating SeleniumBase Python code from the Recorder
+Each action code (Eg. "click") maps to a precompiled template in a table.
+Quotes are picked once per argument, and code is generated in one pass,
+so iter_sbase_code() can stream code for recordings of any length."""
+import json
+import unicodedata
+from urllib.parse import unquote
 
 
-def generate_sbase_code(srt_actions):
-    sb_actions = []
+def read_new_actions(execute_script, action_log):
+    """Adds the actions that were recorded in the active tab since the last
+    read to its action log (a list). Only new actions are read, so a long
+    recording isn't parsed again each time. If the page replaced actions
+    that were read already, those are read again. Returns the action log.
+    (Missing actions are None, so that the log indexes stay the same.)"""
+    from seleniumbase.js_code.recorder_js import read_actions_js
+
+    result = execute_script(read_actions_js, len(action_log))
+    if not result:
+        return action_log
+    start, new_actions = result
+    del action_log[int(start):]
+    for action in new_actions:
+        action_log.append(json.loads(action) if action else None)
+    return action_log
+
+
+def __quote(text):
+    """Double quotes, or single quotes if the text has double quotes."""
+    if '"' not in text:
+        return '"%s"' % text
+    return "'%s'" % text
+
+
+def __quote_url(text):
+    """Like __quote(), but escapes double quotes if there are both kinds."""
+    if '"' not in text:
+        return '"%s"' % text
+    elif "'" not in text:
+        return "'%s'" % text
+    return '"%s"' % text.replace('"', '\\"')
+
+
+def __quote_any(text):
+    """Like __quote(), but uses triple quotes if there are both kinds."""
+    if '"' not in text:
+        return '"%s"' % text
+    elif "'" not in text:
+        return "'%s'" % text
+    return '"""%s"""' % text
+
+
+# Actions that become a fixed line of code
+FIXED_ACTIONS = {
+    "sw_dc": "self.switch_to_default_content()",
+    "sw_pf": "self.switch_to_parent_frame()",
+    "acc_a": "self.accept_alert()",
+    "dis_a": "self.dismiss_alert()",
+    "ss_tl": "self.save_screenshot_to_logs()",
+    "pdftl": "self.save_as_pdf_to_logs()",
+    "spstl": "self.save_page_source_to_logs()",
+    "sh_fc": "self.show_file_choosers()",
+    "pr_da": "self.process_deferred_asserts()",
+    "a_d_m": "self.activate_demo_mode()",
+    "d_d_m": "self.deactivate_demo_mode()",
+    "c_l_s": "self.clear_local_storage()",
+    "c_s_s": "self.clear_session_storage()",
+    "d_a_c": "self.delete_all_cookies()",
+    "go_bk": "self.go_back()",
+    "go_fw": "self.go_forward()",
+}
+# Actions that become self.METHOD(action[1])
+SELECTOR_ACTIONS = {
+    "click": "click",
+    "dbclk": "double_click",
+    "js_cl": "js_click",
+    "js_ca": "js_click_all",
+    "jq_cl": "jquery_click",
+    "jq_ca": "jquery_click_all",
+    "r_clk": "context_click",
+    "hover": "hover",
+    "sw_fr": "switch_to_frame",
+    "s_c_f": "set_content_to_frame",
+    "hi_li": "highlight",
+    "as_lt": "assert_link_text",
+    "as_ti": "assert_title",
+    "as_tc": "assert_title_contains",
+    "a_url": "assert_url",
+    "a_u_c": "assert_url_contains",
+    "as_df": "assert_downloaded_file",
+    "s_scr": "save_screenshot",
+}
+# Same as above, but the selector can have both kinds of quotes
+ANY_SELECTOR_ACTIONS = {
+    "wf_el": "wait_for_element",
+    "as_el": "assert_element",
+    "as_ep": "assert_element_present",
+    "asenv": "assert_element_not_visible",
+    "asnet": "assert_non_empty_text",
+    "da_el": "deferred_assert_element",
+    "da_ep": "deferred_assert_element_present",
+    "danet": "deferred_assert_non_empty_text",
+}
+# Actions that become self.METHOD(action[1], action[2])
+TWO_ARG_ACTIONS = {
+    "h_clk": "hover_and_click",
+    "ddrop": "drag_and_drop",
+    "s_opt": "select_option_by_text",
+    "set_v": "set_value",
+    "cho_f": "choose_file",
+    "ss_tf": "save_screenshot",
+}
+# Same as above, but action[2] is text that can have newlines
+TEXT_ACTIONS = {
+    "input": "type",
+    "js_ty": "js_type",
+    "jq_ty": "jquery_type",
+    "pkeys": "press_keys",
+    "e_mfa": "enter_mfa_code",
+}
+# Actions that become self.METHOD(text, selector)
+ASSERT_TEXT_ACTIONS = {
+    "as_te": "assert_text",
+    "as_et": "assert_exact_text",
+    "astnv": "assert_text_not_visible",
+    "aetnv": "assert_exact_text_not_visible",
+    "da_te": "deferred_assert_text",
+    "da_et": "deferred_assert_exact_text",
+}
+
+
+def __normalize_url(action):
+    if "%" in action[2]:
+        try:
+            action[2] = unquote(action[2], errors="strict")
+        except Exception:
+            pass
+
+
+def __normalize_file_path(action):
+    action[2] = action[2].replace("\\", "\\\\")
+
+
+def __normalize_screenshot(action):
+    action[2] = action[1][1]
+    action[1] = action[1][0]
+
+
+def __normalize_text(action):
+    try:
+        action[1][0] = unicodedata.normalize("NFKC", action[1][0])
+        action[1][0] = action[1][0].replace("\n", "\\n")
+        action[1][0] = action[1][0].replace("¶", "")
+    except Exception:
+        pass  # (A list of text options)
+
+
+# Changes to actions before code is generated. (These are kept, because
+# the Behave codegen, which runs afterwards, expects them too.)
+NORMALIZERS = {
+    "begin": __normalize_url,
+    "_url_": __normalize_url,
+    "f_url": __normalize_url,
+    "cho_f": __normalize_file_path,
+    "ss_tf": __normalize_screenshot,
+}
+NORMALIZERS.update(dict.fromkeys(ASSERT_TEXT_ACTIONS, __normalize_text))
+
+
+def __fixed_code(line):
+    return lambda action: line
+
+
+def __selector_code(method, quote):
+    template = "self.%s(%%s)" % method
+    return lambda action: template % quote(action[1])
+
+
+def __two_arg_code(method):
+    template = "self.%s(%%s, %%s)" % method
+    return lambda action: template % (
+        __quote(action[1]), __quote(action[2])
+    )
+
+
+def __text_code(method):
+    template = "self.%s(%%s, %%s)" % method
+    return lambda action: template % (
+        __quote(action[1]), __quote(action[2].replace("\n", "\\n"))
+    )
+
+
+def __assert_text_code(method):
+    with_selector = "self.%s(%%s, %%s)" % method
+    without_selector = "self.%s(%%s)" % method
+
+    def assert_text_code(action):
+        text, selector = action[1][0], action[1][1]
+        if isinstance(text, str):
+            text = __quote_any(text)
+        # (Otherwise, it's a list of text options, which isn't quoted)
+        if selector == "html":
+            return without_selector % text
+        return with_selector % (text, __quote_any(selector))
+
+    return assert_text_code
+
+
+def __canvas_code(action):
+    selector, p_x, p_y = action[1][0], action[1][1], action[1][2]
+    return "self.click_with_offset(%s, %s, %s)" % (
+        __quote(selector), p_x, p_y
+    )
+
+
+def __set_content_to_default_code(action):
+    if action[1]:
+        return "self.set_content_to_parent()"
+    return "self.set_content_to_default()"
+
+
+def __set_attribute_code(action):
+    method = "set_attribute"
+    if action[0] == "s_ats":
+        method = "set_attributes"
+    return 'self.%s(%s, "%s", "%s")' % (
+        method, __quote_any(action[1][0]), action[1][1], action[1][2]
+    )
+
+
+def __download_file_code(action):
+    file_url, dest = action[1][0], action[1][1]
+    if not dest:
+        return 'self.download_file("%s")' % file_url
+    return 'self.download_file("%s", "%s")' % (file_url, dest)
+
+
+def __assert_attribute_code(action):
+    selector, attribute, value = action[1][0], action[1][1], action[1][2]
+    if value:
+        return 'self.assert_attribute(%s, "%s", "%s")' % (
+            __quote(selector), attribute, value
+        )
+    return 'self.assert_attribute(%s, "%s")' % (__quote(selector), attribute)
+
+
+def __checkbox_code(action):
+    method = "check_if_unchecked"
+    if action[2] == "no":
+        method = "uncheck_if_checked"
+    return "self.%s(%s)" % (method, __quote(action[1]))
+
+
+def __build_codegen_table():
+    table = {
+        "begin": lambda action: "self.open(%s)" % __quote_url(action[2]),
+        "_url_": lambda action: "self.open(%s)" % __quote_url(action[2]),
+        "f_url": lambda action: (
+            "self.open_if_not_url(%s)" % __quote_url(action[2])
+        ),
+        "canva": __canvas_code,
+        "s_c_d": __set_content_to_default_code,
+        "sleep": lambda action: "self.sleep(%s)" % action[1],
+        "s_at_": __set_attribute_code,
+        "s_ats": __set_attribute_code,
+        "do_fi": __download_file_code,
+        "as_at": __assert_attribute_code,
+        "c_box": __checkbox_code,
+    }
+    for code, line in FIXED_ACTIONS.items():
+        table[code] = __fixed_code(line)
+    for code, method in SELECTOR_ACTIONS.items():
+        table[code] = __selector_code(method, __quote)
+    for code, method in ANY_SELECTOR_ACTIONS.items():
+        table[code] = __selector_code(method, __quote_any)
+    for code, method in TWO_ARG_ACTIONS.items():
+        table[code] = __two_arg_code(method)
+    for code, method in TEXT_ACTIONS.items():
+        table[code] = __text_code(method)
+    for code, method in ASSERT_TEXT_ACTIONS.items():
+        table[code] = __assert_text_code(method)
+    return table
+
+
+CODEGEN_TABLE = __build_codegen_table()
+
+
+def iter_sbase_code(srt_actions):
+    """Yields a line of SeleniumBase code for each action (in one pass).
+    Actions without code (Eg. "_skip") are skipped."""
+    table = CODEGEN_TABLE
+    normalizers = NORMALIZERS
     for action in srt_actions:
-        if action[0] == "begin" or action[0] == "_url_":
-            if "%" in action[2]:
-                try:
-                    from urllib.parse import unquote
-
-                    action[2] = unquote(action[2], errors="strict")
-                except Exception:
-                    pass
-            if '"' not in action[2]:
-                sb_actions.append('self.open("%s")' % action[2])
-            elif "'" not in action[2]:
-                sb_actions.append("self.open('%s')" % action[2])
-            else:
-                sb_actions.append(
-                    'self.open("%s")' % action[2].replace('"', '\\"')
-                )
-        elif action[0] == "f_url":
-            if "%" in action[2]:
-                try:
-                    from urllib.parse import unquote
-
-                    action[2] = unquote(action[2], errors="strict")
-                except Exception:
-                    pass
-            if '"' not in action[2]:
-                sb_actions.append('self.open_if_not_url("%s")' % action[2])
-            elif "'" not in action[2]:
-                sb_actions.append("self.open_if_not_url('%s')" % action[2])
-            else:
-                sb_actions.append(
-                    'self.open_if_not_url("%s")'
-                    % action[2].replace('"', '\\"')
-                )
-        elif action[0] == "click":
-            method = "click"
-            if '"' not in action[1]:
-                sb_actions.append('self.%s("%s")' % (method, action[1]))
-            else:
-                sb_actions.append("self.%s('%s')" % (method, action[1]))
-        elif action[0] == "dbclk":
-            method = "double_click"
-            if '"' not in action[1]:
-                sb_actions.append('self.%s("%s")' % (method, action[1]))
-            else:
-                sb_actions.append("self.%s('%s')" % (method, action[1]))
-        elif action[0] == "js_cl":
-            method = "js_click"
-            if '"' not in action[1]:
-                sb_actions.append('self.%s("%s")' % (method, action[1]))
-            else:
-                sb_actions.append("self.%s('%s')" % (method, action[1]))
-        elif action[0] == "js_ca":
-            method = "js_click_all"
-            if '"' not in action[1]:
-                sb_actions.append('self.%s("%s")' % (method, action[1]))
-            else:
-                sb_actions.append("self.%s('%s')" % (method, action[1]))
-        elif action[0] == "jq_cl":
-            method = "jquery_click"
-            if '"' not in action[1]:
-                sb_actions.append('self.%s("%s")' % (method, action[1]))
-            else:
-                sb_actions.append("self.%s('%s')" % (method, action[1]))
-        elif action[0] == "jq_ca":
-            method = "jquery_click_all"
-            if '"' not in action[1]:
-                sb_actions.append('self.%s("%s")' % (method, action[1]))
-            else:
-                sb_actions.append("self.%s('%s')" % (method, action[1]))
-        elif action[0] == "r_clk":
-            method = "context_click"
-            if '"' not in action[1]:
-                sb_actions.append('self.%s("%s")' % (method, action[1]))
-            else:
-                sb_actions.append("self.%s('%s')" % (method, action[1]))
-        elif action[0] == "canva":
-            method = "click_with_offset"
-            selector = action[1][0]
-            p_x = action[1][1]
-            p_y = action[1][2]
-            if '"' not in selector:
-                sb_actions.append(
-                    'self.%s("%s", %s, %s)' % (method, selector, p_x, p_y)
-                )
-            else:
-                sb_actions.append(
-                    "self.%s('%s', %s, %s)" % (method, selector, p_x, p_y)
-                )
-        elif (
-            action[0] == "input"
-            or action[0] == "js_ty"
-            or action[0] == "jq_ty"
-            or action[0] == "pkeys"
-        ):
-            method = "type"
-            if action[0] == "js_ty":
-                method = "js_type"
-            elif action[0] == "jq_ty":
-                method = "jquery_type"
-            elif action[0] == "pkeys":
-                method = "press_keys"
-            text = action[2].replace("\n", "\\n")
-            if '"' not in action[1] and '"' not in text:
-                sb_actions.append(
-                    'self.%s("%s", "%s")' % (method, action[1], text)
-                )
-            elif '"' not in action[1] and '"' in text:
-                sb_actions.append(
-                    'self.%s("%s", \'%s\')' % (method, action[1], text)
-                )
-            elif '"' in action[1] and '"' not in text:
-                sb_actions.append(
-                    'self.%s(\'%s\', "%s")' % (method, action[1], text)
-                )
-            elif '"' in action[1] and '"' in text:
-                sb_actions.append(
-                    "self.%s('%s', '%s')" % (method, action[1], text)
-                )
-        elif action[0] == "hover":
-            method = "hover"
-            if '"' not in action[1]:
-                sb_actions.append('self.%s("%s")' % (method, action[1]))
-            else:
-                sb_actions.append("self.%s('%s')" % (method, action[1]))
-        elif action[0] == "e_mfa":
-            method = "enter_mfa_code"
-            text = action[2].replace("\n", "\\n")
-            if '"' not in action[1] and '"' not in text:
-                sb_actions.append(
-                    'self.%s("%s", "%s")' % (method, action[1], text)
-                )
-            elif '"' not in action[1] and '"' in text:
-                sb_actions.append(
-                    'self.%s("%s", \'%s\')' % (method, action[1], text)
-                )
-            elif '"' in action[1] and '"' not in text:
-                sb_actions.append(
-                    'self.%s(\'%s\', "%s")' % (method, action[1], text)
-                )
-            elif '"' in action[1] and '"' in text:
-                sb_actions.append(
-                    "self.%s('%s', '%s')" % (method, action[1], text)
-                )
-        elif action[0] == "h_clk":
-            method = "hover_and_click"
-            if '"' not in action[1] and '"' not in action[2]:
-                sb_actions.append(
-                    'self.%s("%s", "%s")' % (method, action[1], action[2])
-                )
-            elif '"' not in action[1] and '"' in action[2]:
-                sb_actions.append(
-                    'self.%s("%s", \'%s\')'
-                    % (method, action[1], action[2])
-                )
-            elif '"' in action[1] and '"' not in action[2]:
-                sb_actions.append(
-                    'self.%s(\'%s\', "%s")'
-                    % (method, action[1], action[2])
-                )
-            elif '"' in action[1] and '"' in action[2]:
-                sb_actions.append(
-                    "self.%s('%s', '%s')" % (method, action[1], action[2])
-                )
-        elif action[0] == "ddrop":
-            method = "drag_and_drop"
-            if '"' not in action[1] and '"' not in action[2]:
-                sb_actions.append(
-                    'self.%s("%s", "%s")' % (method, action[1], action[2])
-                )
-            elif '"' not in action[1] and '"' in action[2]:
-                sb_actions.append(
-                    'self.%s("%s", \'%s\')'
-                    % (method, action[1], action[2])
-                )
-            elif '"' in action[1] and '"' not in action[2]:
-                sb_actions.append(
-                    'self.%s(\'%s\', "%s")'
-                    % (method, action[1], action[2])
-                )
-            elif '"' in action[1] and '"' in action[2]:
-                sb_actions.append(
-                    "self.%s('%s', '%s')" % (method, action[1], action[2])
-                )
-        elif action[0] == "s_opt":
-            method = "select_option_by_text"
-            if '"' not in action[1] and '"' not in action[2]:
-                sb_actions.append(
-                    'self.%s("%s", "%s")' % (method, action[1], action[2])
-                )
-            elif '"' not in action[1] and '"' in action[2]:
-                sb_actions.append(
-                    'self.%s("%s", \'%s\')'
-                    % (method, action[1], action[2])
-                )
-            elif '"' in action[1] and '"' not in action[2]:
-                sb_actions.append(
-                    'self.%s(\'%s\', "%s")'
-                    % (method, action[1], action[2])
-                )
-            elif '"' in action[1] and '"' in action[2]:
-                sb_actions.append(
-                    "self.%s('%s', '%s')" % (method, action[1], action[2])
-                )
-        elif action[0] == "set_v":
-            method = "set_value"
-            if '"' not in action[1] and '"' not in action[2]:
-                sb_actions.append(
-                    'self.%s("%s", "%s")' % (method, action[1], action[2])
-                )
-            elif '"' not in action[1] and '"' in action[2]:
-                sb_actions.append(
-                    'self.%s("%s", \'%s\')'
-                    % (method, action[1], action[2])
-                )
-            elif '"' in action[1] and '"' not in action[2]:
-                sb_actions.append(
-                    'self.%s(\'%s\', "%s")'
-                    % (method, action[1], action[2])
-                )
-            elif '"' in action[1] and '"' in action[2]:
-                sb_actions.append(
-                    "self.%s('%s', '%s')" % (method, action[1], action[2])
-                )
-        elif action[0] == "cho_f":
-            method = "choose_file"
-            action[2] = action[2].replace("\\", "\\\\")
-            if '"' not in action[1] and '"' not in action[2]:
-                sb_actions.append(
-                    'self.%s("%s", "%s")' % (method, action[1], action[2])
-                )
-            elif '"' not in action[1] and '"' in action[2]:
-                sb_actions.append(
-                    'self.%s("%s", \'%s\')'
-                    % (method, action[1], action[2])
-                )
-            elif '"' in action[1] and '"' not in action[2]:
-                sb_actions.append(
-                    'self.%s(\'%s\', "%s")'
-                    % (method, action[1], action[2])
-                )
-            elif '"' in action[1] and '"' in action[2]:
-                sb_actions.append(
-                    "self.%s('%s', '%s')" % (method, action[1], action[2])
-                )
-        elif action[0] == "sw_fr":
-            method = "switch_to_frame"
-            if '"' not in action[1]:
-                sb_actions.append('self.%s("%s")' % (method, action[1]))
-            else:
-                sb_actions.append("self.%s('%s')" % (method, action[1]))
-        elif action[0] == "sw_dc":
-            sb_actions.append("self.switch_to_default_content()")
-        elif action[0] == "sw_pf":
-            sb_actions.append("self.switch_to_parent_frame()")
-        elif action[0] == "s_c_f":
-            method = "set_content_to_frame"
-            if '"' not in action[1]:
-                sb_actions.append('self.%s("%s")' % (method, action[1]))
-            else:
-                sb_actions.append("self.%s('%s')" % (method, action[1]))
-        elif action[0] == "s_c_d":
-            method = "set_content_to_default"
-            nested = action[1]
-            if nested:
-                method = "set_content_to_parent"
-                sb_actions.append("self.%s()" % method)
-            else:
-                sb_actions.append("self.%s()" % method)
-        elif action[0] == "sleep":
-            method = "sleep"
-            sb_actions.append("self.%s(%s)" % (method, action[1]))
-        elif action[0] == "wf_el":
-            method = "wait_for_element"
-            if '"' not in action[1]:
-                sb_actions.append('self.%s("%s")' % (method, action[1]))
-            elif "'" not in action[1]:
-                sb_actions.append("self.%s('%s')" % (method, action[1]))
-            else:
-                sb_actions.append(
-                    'self.%s("""%s""")' % (method, action[1])
-                )
-        elif action[0] == "as_el":
-            method = "assert_element"
-            if '"' not in action[1]:
-                sb_actions.append('self.%s("%s")' % (method, action[1]))
-            elif "'" not in action[1]:
-                sb_actions.append("self.%s('%s')" % (method, action[1]))
-            else:
-                sb_actions.append(
-                    'self.%s("""%s""")' % (method, action[1])
-                )
-        elif action[0] == "as_ep":
-            method = "assert_element_present"
-            if '"' not in action[1]:
-                sb_actions.append('self.%s("%s")' % (method, action[1]))
-            elif "'" not in action[1]:
-                sb_actions.append("self.%s('%s')" % (method, action[1]))
-            else:
-                sb_actions.append(
-                    'self.%s("""%s""")' % (method, action[1])
-                )
-        elif action[0] == "asenv":
-            method = "assert_element_not_visible"
-            if '"' not in action[1]:
-                sb_actions.append('self.%s("%s")' % (method, action[1]))
-            elif "'" not in action[1]:
-                sb_actions.append("self.%s('%s')" % (method, action[1]))
-            else:
-                sb_actions.append(
-                    'self.%s("""%s""")' % (method, action[1])
-                )
-        elif action[0] == "s_at_" or action[0] == "s_ats":
-            method = "set_attribute"
-            if action[0] == "s_ats":
-                method = "set_attributes"
-            if '"' not in action[1][0]:
-                sb_actions.append(
-                    'self.%s("%s", "%s", "%s")'
-                    % (method, action[1][0], action[1][1], action[1][2])
-                )
-            elif "'" not in action[1][0]:
-                sb_actions.append(
-                    "self.%s('%s', \"%s\", \"%s\")"
-                    % (method, action[1][0], action[1][1], action[1][2])
-                )
-            else:
-                sb_actions.append(
-                    'self.%s("""%s""", "%s", "%s")'
-                    % (method, action[1][0], action[1][1], action[1][2])
-                )
-        elif action[0] == "acc_a":
-            sb_actions.append("self.accept_alert()")
-        elif action[0] == "dis_a":
-            sb_actions.append("self.dismiss_alert()")
-        elif action[0] == "hi_li":
-            method = "highlight"
-            if '"' not in action[1]:
-                sb_actions.append('self.%s("%s")' % (method, action[1]))
-            else:
-                sb_actions.append("self.%s('%s')" % (method, action[1]))
-        elif action[0] == "as_lt":
-            method = "assert_link_text"
-            if '"' not in action[1]:
-                sb_actions.append('self.%s("%s")' % (method, action[1]))
-            else:
-                sb_actions.append("self.%s('%s')" % (method, action[1]))
-        elif action[0] == "as_ti":
-            method = "assert_title"
-            if '"' not in action[1]:
-                sb_actions.append('self.%s("%s")' % (method, action[1]))
-            else:
-                sb_actions.append("self.%s('%s')" % (method, action[1]))
-        elif action[0] == "as_tc":
-            method = "assert_title_contains"
-            if '"' not in action[1]:
-                sb_actions.append('self.%s("%s")' % (method, action[1]))
-            else:
-                sb_actions.append("self.%s('%s')" % (method, action[1]))
-        elif action[0] == "a_url":
-            method = "assert_url"
-            if '"' not in action[1]:
-                sb_actions.append('self.%s("%s")' % (method, action[1]))
-            else:
-                sb_actions.append("self.%s('%s')" % (method, action[1]))
-        elif action[0] == "a_u_c":
-            method = "assert_url_contains"
-            if '"' not in action[1]:
-                sb_actions.append('self.%s("%s")' % (method, action[1]))
-            else:
-                sb_actions.append("self.%s('%s')" % (method, action[1]))
-        elif action[0] == "as_df":
-            method = "assert_downloaded_file"
-            if '"' not in action[1]:
-                sb_actions.append('self.%s("%s")' % (method, action[1]))
-            else:
-                sb_actions.append("self.%s('%s')" % (method, action[1]))
-        elif action[0] == "do_fi":
-            method = "download_file"
-            file_url = action[1][0]
-            dest = action[1][1]
-            if not dest:
-                sb_actions.append('self.%s("%s")' % (method, file_url))
-            else:
-                sb_actions.append(
-                    'self.%s("%s", "%s")' % (method, file_url, dest)
-                )
-        elif action[0] == "as_at":
-            method = "assert_attribute"
-            if ('"' not in action[1][0]) and action[1][2]:
-                sb_actions.append(
-                    'self.%s("%s", "%s", "%s")'
-                    % (method, action[1][0], action[1][1], action[1][2])
-                )
-            elif ('"' not in action[1][0]) and not action[1][2]:
-                sb_actions.append(
-                    'self.%s("%s", "%s")'
-                    % (method, action[1][0], action[1][1])
-                )
-            elif ('"' in action[1][0]) and action[1][2]:
-                sb_actions.append(
-                    'self.%s(\'%s\', "%s", "%s")'
-                    % (method, action[1][0], action[1][1], action[1][2])
-                )
-            else:
-                sb_actions.append(
-                    'self.%s(\'%s\', "%s")'
-                    % (method, action[1][0], action[1][1])
-                )
-        elif (
-            action[0] == "as_te"
-            or action[0] == "as_et"
-            or action[0] == "astnv"
-            or action[0] == "aetnv"
-            or action[0] == "da_te"
-            or action[0] == "da_et"
-        ):
-            import unicodedata
-
-            text_list = False
-            try:
-                action[1][0] = unicodedata.normalize("NFKC", action[1][0])
-                action[1][0] = action[1][0].replace("\n", "\\n")
-                action[1][0] = action[1][0].replace("\u00B6", "")
-            except Exception:
-                text_list = True
-
-            method = "assert_text"
-            if action[0] == "as_et":
-                method = "assert_exact_text"
-            elif action[0] == "astnv":
-                method = "assert_text_not_visible"
-            elif action[0] == "aetnv":
-                method = "assert_exact_text_not_visible"
-            elif action[0] == "da_te":
-                method = "deferred_assert_text"
-            elif action[0] == "da_et":
-                method = "deferred_assert_exact_text"
-            if action[1][1] != "html":
-                if text_list and '"' not in action[1][1]:
-                    sb_actions.append(
-                        'self.%s(%s, "%s")'
-                        % (method, action[1][0], action[1][1])
-                    )
-                elif text_list and "'" not in action[1][1]:
-                    sb_actions.append(
-                        "self.%s(%s, '%s')"
-                        % (method, action[1][0], action[1][1])
-                    )
-                elif '"' not in action[1][0] and '"' not in action[1][1]:
-                    sb_actions.append(
-                        'self.%s("%s", "%s")'
-                        % (method, action[1][0], action[1][1])
-                    )
-                elif '"' not in action[1][0] and '"' in action[1][1]:
-                    sb_actions.append(
-                        'self.%s("%s", \'%s\')'
-                        % (method, action[1][0], action[1][1])
-                    )
-                elif '"' in action[1] and '"' not in action[1][1]:
-                    sb_actions.append(
-                        'self.%s(\'%s\', "%s")'
-                        % (method, action[1][0], action[1][1])
-                    )
-                elif '"' in action[1] and '"' in action[1][1]:
-                    sb_actions.append(
-                        "self.%s('%s', '%s')"
-                        % (method, action[1][0], action[1][1])
-                    )
-            else:
-                if text_list:
-                    sb_actions.append(
-                        'self.%s(%s)' % (method, action[1][0])
-                    )
-                elif '"' not in action[1][0]:
-                    sb_actions.append(
-                        'self.%s("%s")' % (method, action[1][0])
-                    )
-                else:
-                    sb_actions.append(
-                        "self.%s('%s')" % (method, action[1][0])
-                    )
-        elif action[0] == "asnet":
-            method = "assert_non_empty_text"
-            if '"' not in action[1]:
-                sb_actions.append('self.%s("%s")' % (method, action[1]))
-            elif "'" not in action[1]:
-                sb_actions.append("self.%s('%s')" % (method, action[1]))
-            else:
-                sb_actions.append(
-                    'self.%s("""%s""")' % (method, action[1])
-                )
-        elif action[0] == "da_el":
-            method = "deferred_assert_element"
-            if '"' not in action[1]:
-                sb_actions.append('self.%s("%s")' % (method, action[1]))
-            elif "'" not in action[1]:
-                sb_actions.append("self.%s('%s')" % (method, action[1]))
-            else:
-                sb_actions.append(
-                    'self.%s("""%s""")' % (method, action[1])
-                )
-        elif action[0] == "da_ep":
-            method = "deferred_assert_element_present"
-            if '"' not in action[1]:
-                sb_actions.append('self.%s("%s")' % (method, action[1]))
-            elif "'" not in action[1]:
-                sb_actions.append("self.%s('%s')" % (method, action[1]))
-            else:
-                sb_actions.append(
-                    'self.%s("""%s""")' % (method, action[1])
-                )
-        elif action[0] == "danet":
-            method = "deferred_assert_non_empty_text"
-            if '"' not in action[1]:
-                sb_actions.append('self.%s("%s")' % (method, action[1]))
-            elif "'" not in action[1]:
-                sb_actions.append("self.%s('%s')" % (method, action[1]))
-            else:
-                sb_actions.append(
-                    'self.%s("""%s""")' % (method, action[1])
-                )
-        elif action[0] == "s_scr":
-            method = "save_screenshot"
-            if '"' not in action[1]:
-                sb_actions.append('self.%s("%s")' % (method, action[1]))
-            else:
-                sb_actions.append("self.%s('%s')" % (method, action[1]))
-        elif action[0] == "ss_tf":
-            method = "save_screenshot"
-            action[2] = action[1][1]
-            action[1] = action[1][0]
-            if '"' not in action[1] and '"' not in action[2]:
-                sb_actions.append(
-                    'self.%s("%s", "%s")' % (method, action[1], action[2])
-                )
-            elif '"' not in action[1] and '"' in action[2]:
-                sb_actions.append(
-                    'self.%s("%s", \'%s\')'
-                    % (method, action[1], action[2])
-                )
-            elif '"' in action[1] and '"' not in action[2]:
-                sb_actions.append(
-                    'self.%s(\'%s\', "%s")'
-                    % (method, action[1], action[2])
-                )
-            elif '"' in action[1] and '"' in action[2]:
-                sb_actions.append(
-                    "self.%s('%s', '%s')" % (method, action[1], action[2])
-                )
-        elif action[0] == "ss_tl":
-            method = "save_screenshot_to_logs"
-            sb_actions.append("self.%s()" % method)
-        elif action[0] == "pdftl":
-            method = "save_as_pdf_to_logs"
-            sb_actions.append("self.%s()" % method)
-        elif action[0] == "spstl":
-            method = "save_page_source_to_logs"
-            sb_actions.append("self.%s()" % method)
-        elif action[0] == "sh_fc":
-            method = "show_file_choosers"
-            sb_actions.append("self.%s()" % method)
-        elif action[0] == "pr_da":
-            sb_actions.append("self.process_deferred_asserts()")
-        elif action[0] == "a_d_m":
-            sb_actions.append("self.activate_demo_mode()")
-        elif action[0] == "d_d_m":
-            sb_actions.append("self.deactivate_demo_mode()")
-        elif action[0] == "c_l_s":
-            sb_actions.append("self.clear_local_storage()")
-        elif action[0] == "c_s_s":
-            sb_actions.append("self.clear_session_storage()")
-        elif action[0] == "d_a_c":
-            sb_actions.append("self.delete_all_cookies()")
-        elif action[0] == "go_bk":
-            sb_actions.append("self.go_back()")
-        elif action[0] == "go_fw":
-            sb_actions.append("self.go_forward()")
-        elif action[0] == "c_box":
-            method = "check_if_unchecked"
-            if action[2] == "no":
-                method = "uncheck_if_checked"
-            if '"' not in action[1]:
-                sb_actions.append('self.%s("%s")' % (method, action[1]))
-            else:
-                sb_actions.append("self.%s('%s')" % (method, action[1]))
-    return sb_actions
+        code = action[0]
+        normalize = normalizers.get(code)
+        if normalize:
+            normalize(action)
+        generate = table.get(code)
+        if generate:
+            yield generate(action)
+
+
+def generate_sbase_code(srt_actions):
+    """Returns the list of SeleniumBase code lines for the actions."""
+    return list(iter_sbase_code(srt_actions))
@@ -1,6 +1,7 @@
 """Add CDP methods to extend the driver"""
 import asyncio
 import fasteners
+import functools
 import mycdp
 import os
 import random
@@ -10,12 +11,14 @@ import time
 from contextlib import suppress
 from filelock import FileLock
 from seleniumbase import config as sb_config
+from seleniumbase.common import rate_limiter
 from seleniumbase.config import settings
 from seleniumbase.fixtures import constants
 from seleniumbase.fixtures import js_utils
 from seleniumbase.fixtures import page_utils
 from seleniumbase.fixtures import shared_utils
 from seleniumbase.undetected.cdp_driver import cdp_util
+from seleniumbase.undetected.cdp_driver import readiness
 from seleniumbase.undetected.cdp_driver import tab as cdp_tab
 
 
@@ -54,64 +57,15 @@ class CDPMethods():
         return selector
 
     def __add_sync_methods(self, element):
-        if not element:
+        if not element or isinstance(element, SyncElement):
             return element
-        element.clear_input = lambda: self.__clear_input(element)
-        element.click = lambda: self.__click(element)
-        element.flash = lambda *args, **kwargs: self.__flash(
-            element, *args, **kwargs
-        )
-        element.focus = lambda: self.__focus(element)
-        element.gui_click = (
-            lambda *args, **kwargs: self.__gui_click(element, *args, **kwargs)
-        )
-        element.highlight_overlay = lambda: self.__highlight_overlay(element)
-        element.mouse_click = lambda: self.__mouse_click(element)
-        element.click_with_offset = (
-            lambda *args, **kwargs: self.__mouse_click_with_offset_async(
-                element, *args, **kwargs
-            )
-        )
-        element.mouse_drag = (
-            lambda destination: self.__mouse_drag(element, destination)
-        )
-        element.mouse_move = lambda: self.__mouse_move(element)
-        element.press_keys = lambda text: self.__press_keys(element, text)
-        element.query_selector = (
-            lambda selector: self.__query_selector(element, selector)
-        )
-        element.querySelector = element.query_selector
-        element.query_selector_all = (
-            lambda selector: self.__query_selector_all(element, selector)
-        )
-        element.querySelectorAll = element.query_selector_all
-        element.remove_from_dom = lambda: self.__remove_from_dom(element)
-        element.save_screenshot = (
-            lambda *args, **kwargs: self.__save_screenshot(
-                element, *args, **kwargs)
-        )
-        element.save_to_dom = lambda: self.__save_to_dom(element)
-        element.scroll_into_view = lambda: self.__scroll_into_view(element)
-        element.select_option = lambda: self.__select_option(element)
-        element.send_file = (
-            lambda *file_paths: self.__send_file(element, *file_paths)
-        )
-        element.send_keys = lambda text: self.__send_keys(element, text)
-        element.set_text = lambda value: self.__set_text(element, value)
-        element.set_value = lambda value: self.__set_value(element, value)
-        element.type = lambda text: self.__type(element, text)
-        element.get_position = lambda: self.__get_position(element)
-        element.get_html = lambda: self.__get_html(element)
-        element.get_js_attributes = lambda: self.__get_js_attributes(element)
-        element.get_attribute = (
-            lambda attribute: self.__get_attribute(element, attribute)
-        )
-        # element.get_parent() should come last
-        element.get_parent = lambda: self.__get_parent(element)
-        return element
+        return SyncElement(element, self)
 
     def get(self, url, **kwargs):
         url = shared_utils.fix_url_as_needed(url)
+        timing = readiness.NavigationTiming(url)
+        rate_limiter.throttle_navigation(url)  # (If NAVIGATION_RATE_LIMIT)
+        timing.mark_step("throttle")
         driver = self.driver
         if hasattr(driver, "cdp_base"):
             driver = driver.cdp_base
@@ -120,23 +74,31 @@ class CDPMethods():
         if hasattr(sb_config, "_cdp_proxy") and sb_config._cdp_proxy:
             load_timeout = 90.0
             wait_timeout = 45.0
+        tab = None
         try:
             task = self.page.get(url, **kwargs)
-            self.loop.run_until_complete(
+            tab = self.loop.run_until_complete(
                 asyncio.wait_for(task, timeout=load_timeout)
             )
         except asyncio.TimeoutError:
             print("Timeout loading %s" % url)
+        timing.mark_step("navigate")
         url_protocol = url.split(":")[0]
         safe_url = True
         if url_protocol not in ["about", "data", "chrome"]:
             safe_url = False
+        # Wait for the page to load, with the old fixed pause as the limit.
+        max_wait = 0.012
         if not safe_url:
-            time.sleep(constants.UC.CDP_MODE_OPEN_WAIT)
+            max_wait = constants.UC.CDP_MODE_OPEN_WAIT
             if shared_utils.is_windows():
-                time.sleep(constants.UC.EXTRA_WINDOWS_WAIT)
-        else:
-            time.sleep(0.012)
+                max_wait += constants.UC.EXTRA_WINDOWS_WAIT
+        page_readiness = readiness.get_readiness(tab or self.page)
+        with suppress(Exception):
+            self.loop.run_until_complete(
+                page_readiness.wait_for_load(max_wait)
+            )
+        timing.mark_step("load")
         self.__slow_mode_pause_if_set()
         try:
             self.loop.run_until_complete(
@@ -146,6 +108,20 @@ class CDPMethods():
             pass
         except Exception:
             pass
+        timing.mark_step("idle")
+        if page_readiness.timing and page_readiness.timing.url == url:
+            timing.add_events(page_readiness.timing)
+        self._navigation_timing = timing
+
+    def get_navigation_timing(self):
+        """Returns the time breakdown of the last cdp.open(url) call:
+        {"url", "steps": {"throttle", "navigate", "load", "idle"},
+         "events": {"navigate_response", "load_event", ...}, "total"}
+        (Events are the times that the browser signals arrived.)"""
+        timing = getattr(self, "_navigation_timing", None)
+        if not timing:
+            return None
+        return timing.as_dict()
 
     def open(self, url, **kwargs):
         self.get(url, **kwargs)
@@ -453,6 +429,14 @@ class CDPMethods():
 
     def __flash(self, element, *args, **kwargs):
         element.scroll_into_view()
+        if (
+            len(args) < 3
+            and "x_offset" not in kwargs
+            and "y_offset" not in kwargs
+        ):
+            x_offset, y_offset = self.__get_scroll_offsets()
+            kwargs["x_offset"] = x_offset
+            kwargs["y_offset"] = y_offset
         if len(args) < 3 and "x_offset" not in kwargs:
             x_offset = self.__get_x_scroll_offset()
             kwargs["x_offset"] = x_offset
@@ -525,6 +509,8 @@ class CDPMethods():
         return result
 
     def __mouse_drag(self, element, destination):
+        if isinstance(destination, SyncElement):
+            destination = destination._element
         return (
             self.loop.run_until_complete(element.mouse_drag_async(destination))
         )
@@ -670,6 +656,16 @@ class CDPMethods():
         )
         return y_scroll_offset or 0
 
+    def __get_scroll_offsets(self):
+        """Returns (x_scroll_offset, y_scroll_offset) in one loop call."""
+        x_scroll_offset, y_scroll_offset = self.loop.run_until_complete(
+            cdp_util.gather(
+                self.page.evaluate("window.pageXOffset"),
+                self.page.evaluate("window.pageYOffset"),
+            )
+        )
+        return (x_scroll_offset or 0, y_scroll_offset or 0)
+
     def tile_windows(self, windows=None, max_columns=0):
         """Tile windows and return the grid of tiled windows."""
         driver = self.driver
@@ -1369,41 +1365,25 @@ class CDPMethods():
 
     def get_window_rect(self):
         coordinates = {}
-        innerWidth = self.loop.run_until_complete(
-            self.page.evaluate("window.innerWidth")
-        )
-        innerHeight = self.loop.run_until_complete(
-            self.page.evaluate("window.innerHeight")
-        )
-        outerWidth = self.loop.run_until_complete(
-            self.page.evaluate("window.outerWidth")
-        )
-        outerHeight = self.loop.run_until_complete(
-            self.page.evaluate("window.outerHeight")
-        )
-        pageXOffset = self.loop.run_until_complete(
-            self.page.evaluate("window.pageXOffset")
-        )
-        pageYOffset = self.loop.run_until_complete(
-            self.page.evaluate("window.pageYOffset")
-        )
-        scrollX = self.loop.run_until_complete(
-            self.page.evaluate("window.scrollX")
-        )
-        scrollY = self.loop.run_until_complete(
-            self.page.evaluate("window.scrollY")
-        )
-        screenLeft = self.loop.run_until_complete(
-            self.page.evaluate("window.screenLeft")
-        )
-        screenTop = self.loop.run_until_complete(
-            self.page.evaluate("window.screenTop")
-        )
-        x = self.loop.run_until_complete(
-            self.page.evaluate("window.screenX")
-        )
-        y = self.loop.run_until_complete(
-            self.page.evaluate("window.screenY")
+        (
+            innerWidth, innerHeight, outerWidth, outerHeight,
+            pageXOffset, pageYOffset, scrollX, scrollY,
+            screenLeft, screenTop, x, y,
+        ) = self.loop.run_until_complete(
+            cdp_util.gather(
+                self.page.evaluate("window.innerWidth"),
+                self.page.evaluate("window.innerHeight"),
+                self.page.evaluate("window.outerWidth"),
+                self.page.evaluate("window.outerHeight"),
+                self.page.evaluate("window.pageXOffset"),
+                self.page.evaluate("window.pageYOffset"),
+                self.page.evaluate("window.scrollX"),
+                self.page.evaluate("window.scrollY"),
+                self.page.evaluate("window.screenLeft"),
+                self.page.evaluate("window.screenTop"),
+                self.page.evaluate("window.screenX"),
+                self.page.evaluate("window.screenY"),
+            )
         )
         coordinates["innerWidth"] = innerWidth
         coordinates["innerHeight"] = innerHeight
@@ -1423,11 +1403,11 @@ class CDPMethods():
 
     def get_window_size(self):
         coordinates = {}
-        outerWidth = self.loop.run_until_complete(
-            self.page.evaluate("window.outerWidth")
-        )
-        outerHeight = self.loop.run_until_complete(
-            self.page.evaluate("window.outerHeight")
+        outerWidth, outerHeight = self.loop.run_until_complete(
+            cdp_util.gather(
+                self.page.evaluate("window.outerWidth"),
+                self.page.evaluate("window.outerHeight"),
+            )
         )
         coordinates["width"] = outerWidth
         coordinates["height"] = outerHeight
@@ -1435,11 +1415,11 @@ class CDPMethods():
 
     def get_window_position(self):
         coordinates = {}
-        x = self.loop.run_until_complete(
-            self.page.evaluate("window.screenX")
-        )
-        y = self.loop.run_until_complete(
-            self.page.evaluate("window.screenY")
+        x, y = self.loop.run_until_complete(
+            cdp_util.gather(
+                self.page.evaluate("window.screenX"),
+                self.page.evaluate("window.screenY"),
+            )
         )
         coordinates["x"] = x if x else 0
         coordinates["y"] = y if y else 0
@@ -3053,8 +3033,17 @@ class Chrome(CDPMethods):
     def __init__(self, url=None, **kwargs):
         if not url:
             url = "about:blank"
-        driver = cdp_util.start_sync(**kwargs)
-        loop = asyncio.new_event_loop()
+        background_loop = kwargs.pop(
+            "background_loop", settings.CDP_BACKGROUND_LOOP
+        )
+        if background_loop:
+            # Run the loop forever on its own thread (see BackgroundLoop)
+            loop = cdp_util.new_background_loop()
+            asyncio.set_event_loop(loop)
+            driver = loop.run_until_complete(cdp_util.start(**kwargs))
+        else:
+            driver = cdp_util.start_sync(**kwargs)
+            loop = asyncio.new_event_loop()
         page = loop.run_until_complete(driver.get(url))
         wait_timeout = 30.0
         if hasattr(sb_config, "_cdp_proxy") and sb_config._cdp_proxy:
@@ -3068,3 +3057,92 @@ class Chrome(CDPMethods):
         except Exception:
             pass
         super().__init__(loop, page, driver)
+
+
+class _SyncMethod:
+    """A sync element method, such as SyncElement.click().
+    On access, binds a CDPMethods helper to the element.
+    (Each descriptor is shared by every SyncElement.)"""
+    __slots__ = ("helper",)
+
+    def __init__(self, name):
+        self.helper = "_CDPMethods__%s" % name
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+        return functools.partial(getattr(obj._cdp, self.helper), obj)
+
+
+class SyncElement:
+    """An Element from CDP Mode, with sync methods. (Eg: element.click())
+    Everything that isn't a sync method is passed through to the Element.
+    Sync methods are resolved on demand from descriptors on the class,
+    so creating one (Eg. for each result of find_all()) is cheap."""
+    __slots__ = ("_element", "_cdp")
+
+    clear_input = _SyncMethod("clear_input")
+    click = _SyncMethod("click")
+    flash = _SyncMethod("flash")
+    focus = _SyncMethod("focus")
+    gui_click = _SyncMethod("gui_click")
+    highlight_overlay = _SyncMethod("highlight_overlay")
+    mouse_click = _SyncMethod("mouse_click")
+    click_with_offset = _SyncMethod("mouse_click_with_offset_async")
+    mouse_drag = _SyncMethod("mouse_drag")
+    mouse_move = _SyncMethod("mouse_move")
+    press_keys = _SyncMethod("press_keys")
+    query_selector = _SyncMethod("query_selector")
+    querySelector = query_selector
+    query_selector_all = _SyncMethod("query_selector_all")
+    querySelectorAll = query_selector_all
+    remove_from_dom = _SyncMethod("remove_from_dom")
+    save_screenshot = _SyncMethod("save_screenshot")
+    save_to_dom = _SyncMethod("save_to_dom")
+    scroll_into_view = _SyncMethod("scroll_into_view")
+    select_option = _SyncMethod("select_option")
+    send_file = _SyncMethod("send_file")
+    send_keys = _SyncMethod("send_keys")
+    set_text = _SyncMethod("set_text")
+    set_value = _SyncMethod("set_value")
+    type = _SyncMethod("type")
+    get_position = _SyncMethod("get_position")
+    get_html = _SyncMethod("get_html")
+    get_js_attributes = _SyncMethod("get_js_attributes")
+    get_attribute = _SyncMethod("get_attribute")
+    get_parent = _SyncMethod("get_parent")
+
+    def __init__(self, element, cdp_methods):
+        object.__setattr__(self, "_element", element)
+        object.__setattr__(self, "_cdp", cdp_methods)
+
+    def __getattr__(self, name):
+        return getattr(self._element, name)
+
+    def __setattr__(self, name, value):
+        setattr(self._element, name, value)
+
+    def __delattr__(self, name):
+        delattr(self._element, name)
+
+    def __getitem__(self, item):
+        return self._element[item]
+
+    def __setitem__(self, key, value):
+        self._element[key] = value
+
+    def __eq__(self, other):
+        if isinstance(other, SyncElement):
+            other = other._element
+        return self._element == other
+
+    __hash__ = None  # (Element isn't hashable either)
+
+    def __call__(self, js_method):
+        return self._element(js_method)
+
+    def __await__(self):
+        return self._element.__await__()
+
+    def __repr__(self):
+        return repr(self._element)
@@ -85,6 +85,10 @@ def set_settings(settings_file):
             settings.BASIC_INFO_NAME = override_settings[key]
         elif key == "PAGE_SOURCE_NAME":
             settings.PAGE_SOURCE_NAME = override_settings[key]
+        elif key == "COMPRESS_PAGE_SOURCE":
+            settings.COMPRESS_PAGE_SOURCE = override_settings[key]
+        elif key == "DEDUPLICATE_PAGE_SOURCE":
+            settings.DEDUPLICATE_PAGE_SOURCE = override_settings[key]
         elif key == "LATEST_REPORT_DIR":
             settings.LATEST_REPORT_DIR = override_settings[key]
         elif key == "REPORT_ARCHIVE_DIR":
@@ -101,6 +105,18 @@ def set_settings(settings_file):
             settings.WAIT_FOR_RSC_ON_CLICKS = override_settings[key]
         elif key == "WAIT_FOR_ANGULARJS":
             settings.WAIT_FOR_ANGULARJS = override_settings[key]
+        elif key == "EVENT_DRIVEN_WAITS":
+            settings.EVENT_DRIVEN_WAITS = override_settings[key]
+        elif key == "SELECTOR_CACHE_SIZE":
+            settings.SELECTOR_CACHE_SIZE = override_settings[key]
+        elif key == "PERSIST_SELECTOR_CACHE":
+            settings.PERSIST_SELECTOR_CACHE = override_settings[key]
+        elif key == "NAVIGATION_RATE_LIMIT":
+            settings.NAVIGATION_RATE_LIMIT = override_settings[key]
+        elif key == "NAVIGATION_BURST":
+            settings.NAVIGATION_BURST = override_settings[key]
+        elif key == "SHARE_NAVIGATION_RATE_LIMIT":
+            settings.SHARE_NAVIGATION_RATE_LIMIT = override_settings[key]
         elif key == "DEFAULT_DEMO_MODE_TIMEOUT":
             settings.DEFAULT_DEMO_MODE_TIMEOUT = override_settings[key]
         elif key == "HIGHLIGHTS":
@@ -129,6 +145,12 @@ def set_settings(settings_file):
             settings.HEADLESS_START_HEIGHT = override_settings[key]
         elif key == "HIDE_DRIVER_DOWNLOADS":
             settings.HIDE_DRIVER_DOWNLOADS = override_settings[key]
+        elif key == "BROWSER_POOL_MAX_LEASES":
+            settings.BROWSER_POOL_MAX_LEASES = override_settings[key]
+        elif key == "BROWSER_POOL_MAX_MEMORY_MB":
+            settings.BROWSER_POOL_MAX_MEMORY_MB = override_settings[key]
+        elif key == "CDP_BACKGROUND_LOOP":
+            settings.CDP_BACKGROUND_LOOP = override_settings[key]
         elif key == "MASTERQA_DEFAULT_VALIDATION_MESSAGE":
             settings.MASTERQA_DEFAULT_VALIDATION_MESSAGE = override_settings[
                 key
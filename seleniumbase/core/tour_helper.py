@@ -4,6 +4,7 @@ import os
 import re
 import textwrap
 import time
+from contextlib import suppress
 from seleniumbase import config as sb_config
 from seleniumbase.config import settings
 from seleniumbase.core import style_sheet
@@ -29,6 +30,11 @@ def activate_bootstrap(driver):
     js_utils.add_css_style(driver, backdrop_style)
     js_utils.wait_for_ready_state_complete(driver)
     js_utils.wait_for_angularjs(driver)
+    js_utils.activate_jquery(driver)
+    if js_utils.inject_assets(driver, [bootstrap_tour_css, bootstrap_tour_js]):
+        with suppress(Exception):
+            driver.execute_script(verify_script)
+            return
     for x in range(4):
         js_utils.activate_jquery(driver)
         js_utils.add_css_link(driver, bootstrap_tour_css)
@@ -71,6 +77,11 @@ def activate_driverjs(driver):
     js_utils.wait_for_ready_state_complete(driver)
     js_utils.wait_for_angularjs(driver)
     js_utils.add_css_style(driver, backdrop_style)
+    js_utils.activate_jquery(driver)
+    if js_utils.inject_assets(driver, [driverjs_css, driverjs_js]):
+        with suppress(Exception):
+            driver.execute_script(verify_script)
+            return
     for x in range(4):
         js_utils.activate_jquery(driver)
         js_utils.add_css_link(driver, driverjs_css)
@@ -115,6 +126,11 @@ def activate_hopscotch(driver):
     js_utils.wait_for_ready_state_complete(driver)
     js_utils.wait_for_angularjs(driver)
     js_utils.add_css_style(driver, backdrop_style)
+    js_utils.activate_jquery(driver)
+    if js_utils.inject_assets(driver, [hopscotch_css, hopscotch_js]):
+        with suppress(Exception):
+            driver.execute_script(verify_script)
+            return
     for x in range(4):
         js_utils.activate_jquery(driver)
         js_utils.add_css_link(driver, hopscotch_css)
@@ -168,6 +184,11 @@ def activate_introjs(driver):
     js_utils.wait_for_ready_state_complete(driver)
     js_utils.wait_for_angularjs(driver)
     js_utils.add_css_style(driver, backdrop_style)
+    js_utils.activate_jquery(driver)
+    if js_utils.inject_assets(driver, [intro_css, intro_js]):
+        with suppress(Exception):
+            driver.execute_script(verify_script)
+            return
     for x in range(4):
         js_utils.activate_jquery(driver)
         js_utils.add_css_link(driver, intro_css)
@@ -218,6 +239,24 @@ def activate_shepherd(driver):
     js_utils.add_css_style(driver, backdrop_style)
     js_utils.wait_for_ready_state_complete(driver)
     js_utils.wait_for_angularjs(driver)
+    if js_utils.inject_assets(
+        driver,
+        [
+            spinner_css,
+            sh_theme_arrows_css,
+            sh_theme_arrows_fix_css,
+            sh_theme_default_css,
+            sh_theme_dark_css,
+            sh_theme_sq_css,
+            sh_theme_sq_dark_css,
+            tether_js,
+            shepherd_js,
+        ],
+    ):
+        with suppress(Exception):
+            driver.execute_script(sh_style)  # Verify Shepherd has loaded
+            driver.execute_script(sh_style)  # Need it twice for ordering
+            return
     for x in range(4):
         js_utils.add_css_link(driver, spinner_css)
         js_utils.add_css_link(driver, sh_theme_arrows_css)
@@ -108,3 +108,66 @@ def get_sbs_html(baseline="baseline.png", diff="baseline_diff.png"):
         + "</body>"
     )
     return the_html
+
+
+def get_fingerprint_script(with_levels=False):
+    """Returns a script that walks the <body> elements once (in document
+    order, like soup.body.find_all()) and returns a rolling hash for each
+    check_window() level. With "with_levels", the level lists are included
+    too. (Those are only needed to set a baseline, or to show a diff.)"""
+    return """
+        var sbVisualFingerprint = function(withLevels) {
+            var states = [
+                [0x811c9dc5, 0x9747b28c],
+                [0x811c9dc5, 0x9747b28c],
+                [0x811c9dc5, 0x9747b28c]
+            ];
+            var levels = [[], [], []];
+            function update(state, text) {
+                var a = state[0], b = state[1];
+                for (var i = 0; i < text.length; i++) {
+                    var c = text.charCodeAt(i);
+                    a = Math.imul(a ^ c, 0x01000193);
+                    b = Math.imul(b ^ c, 0x5bd1e995);
+                    b ^= b >>> 13;
+                }
+                state[0] = a; state[1] = b;
+            }
+            function hex(state) {
+                return ("0000000" + (state[0] >>> 0).toString(16)).slice(-8)
+                    + ("0000000" + (state[1] >>> 0).toString(16)).slice(-8);
+            }
+            var elements = [];
+            if (document.body) {
+                elements = document.body.getElementsByTagName("*");
+            }
+            for (var i = 0; i < elements.length; i++) {
+                var el = elements[i];
+                var tag = el.localName;
+                var names = [];
+                var pairs = [];
+                for (var j = 0; j < el.attributes.length; j++) {
+                    names.push(el.attributes[j].name);
+                }
+                names.sort();
+                for (var j = 0; j < names.length; j++) {
+                    pairs.push([names[j], el.getAttribute(names[j])]);
+                }
+                var records = [[tag], [tag, names], [tag, pairs]];
+                for (var k = 0; k < 3; k++) {
+                    update(states[k], JSON.stringify(records[k]) + "\\n");
+                    if (withLevels) { levels[k].push(records[k]); }
+                }
+            }
+            return {
+                "hashes": {
+                    "1": hex(states[0]), "2": hex(states[1]),
+                    "3": hex(states[2])
+                },
+                "count": elements.length,
+                "levels": withLevels ? levels : null
+            };
+        };
+        return sbVisualFingerprint(%s);""" % (
+        "true" if with_levels else "false"
+    )
@@ -65,6 +65,7 @@ from selenium.webdriver.remote.webelement import WebElement
 from seleniumbase import config as sb_config
 from seleniumbase.__version__ import __version__
 from seleniumbase.common import decorators
+from seleniumbase.common import rate_limiter
 from seleniumbase.common.exceptions import (
     NotConnectedException,
     NotUsingChromeException,
@@ -81,6 +82,7 @@ from seleniumbase.core import session_helper
 from seleniumbase.core import visual_helper
 from seleniumbase.fixtures import constants
 from seleniumbase.fixtures import css_to_xpath
+from seleniumbase.fixtures import deadline
 from seleniumbase.fixtures import js_utils
 from seleniumbase.fixtures import page_actions
 from seleniumbase.fixtures import page_utils
@@ -128,7 +130,6 @@ class BaseCase(unittest.TestCase):
         self.__called_setup = False
         self.__called_teardown = False
         self.__start_time_ms = int(time.time() * 1000.0)
-        self.__requests_timeout = None
         self.__page_source_count = 0
         self.__screenshot_count = 0
         self.__saved_pdf_count = 0
@@ -146,7 +147,7 @@ class BaseCase(unittest.TestCase):
         self.__last_page_source = None
         self.__skip_reason = None
         self.__origins_to_save = []
-        self.__actions_to_save = []
+        self.__action_logs = {}  # (window, origin) -> Recorder actions
         self.__dont_record_open = False
         self.__dont_record_js_click = False
         self.__new_window_on_rec_open = True
@@ -276,6 +277,10 @@ class BaseCase(unittest.TestCase):
             if ("http:") in c_url or ("https:") in c_url or ("file:") in c_url:
                 if self.get_domain_url(url) != self.get_domain_url(c_url):
                     self.open_new_window(switch_to=True)
+        rate_limiter.throttle_navigation(url)  # (If NAVIGATION_RATE_LIMIT)
+        if getattr(sb_config, "_browser_pool", None):
+            # (So that the storage of the url's origin is cleared later)
+            sb_config._browser_pool.track_url(self.driver, url)
         try:
             self.driver.get(url)
         except Exception as e:
@@ -4994,12 +4999,10 @@ class BaseCase(unittest.TestCase):
             time.sleep(seconds)
             shared_utils.check_if_time_limit_exceeded()
         else:
-            start_ms = time.time() * 1000.0
-            stop_ms = start_ms + (seconds * 1000.0)
+            wait_deadline = deadline.Deadline(seconds)
             for x in range(int(seconds * 5)):
-                shared_utils.check_if_time_limit_exceeded()
-                now_ms = time.time() * 1000.0
-                if now_ms >= stop_ms:
+                wait_deadline.check_time_limit()
+                if wait_deadline.expired():
                     break
                 time.sleep(0.2)
         if self.recorder_mode and getattr(sb_config, "record_sleep", None):
@@ -5141,31 +5144,23 @@ class BaseCase(unittest.TestCase):
             if ("http:") in url or ("https:") in url or ("file:") in url:
                 origin = self.get_origin()
                 self.__origins_to_save.append(origin)
-                tab_actions = self.__get_recorded_actions_on_active_tab()
-                for n in range(len(tab_actions)):
-                    if (
-                        n > 2
-                        and tab_actions[n - 2][0] == "sw_fr"
-                        and tab_actions[n - 1][0] == "sk_fo"
-                        and tab_actions[n][0] != "_url_"
-                    ):
-                        origin = tab_actions[n - 2][2]
-                        time_stamp = str(int(tab_actions[n][3]) - 1)
-                        new_action = ["sw_pf", "", origin, time_stamp]
-                        tab_actions.append(new_action)
-                self.__actions_to_save.append(tab_actions)
+                self.__get_recorded_actions_on_active_tab()
 
     def __get_recorded_actions_on_active_tab(self):
+        """Reads the new Recorder actions of the active tab into the
+        action log of the tab + origin. Returns that action log."""
+        from seleniumbase.core import recorder_helper
+
         url = self.driver.current_url
         if url.startswith(("data:", "about:", "chrome:", "edge:")):
             return []
-        self.__origins_to_save.append(self.get_origin())
-        actions = self.get_session_storage_item("recorded_actions")
-        if actions:
-            actions = json.loads(actions)
-            return actions
-        else:
-            return []
+        origin = self.get_origin()
+        self.__origins_to_save.append(origin)
+        key = (self.driver.current_window_handle, origin)
+        action_log = self.__action_logs.setdefault(key, [])
+        return recorder_helper.read_new_actions(
+            self.execute_script, action_log
+        )
 
     def __process_recorded_actions(self):
         """Generates code after the SeleniumBase Recorder runs."""
@@ -5173,13 +5168,17 @@ class BaseCase(unittest.TestCase):
             return
         from seleniumbase.core import recorder_helper
 
-        raw_actions = []  # All raw actions from sessionStorage
+        raw_actions = []  # All raw actions from the action logs
+        unique_actions = []
+        seen_actions = set()  # (For skipping duplicates)
         srt_actions = []
         sb_actions = []
         action_dict = {}
         for window in self.driver.window_handles:
             self.switch_to_window(window)
-            tab_actions = self.__get_recorded_actions_on_active_tab()
+            self.__get_recorded_actions_on_active_tab()
+        for action_log in self.__action_logs.values():
+            tab_actions = [action for action in action_log if action]
             for n in range(len(tab_actions)):
                 if (
                     n > 2
@@ -5191,17 +5190,14 @@ class BaseCase(unittest.TestCase):
                     time_stamp = str(int(tab_actions[n][3]) - 1)
                     new_action = ["sw_pf", "", origin, time_stamp]
                     tab_actions.append(new_action)
-            for action in tab_actions:
-                if action not in raw_actions:
-                    raw_actions.append(action)
-        for tab_actions in self.__actions_to_save:
-            for action in tab_actions:
-                if action not in raw_actions:
-                    raw_actions.append(action)
-        for action in self.__extra_actions:
-            if action not in raw_actions:
-                raw_actions.append(action)
+            raw_actions.extend(tab_actions)
+        raw_actions.extend(self.__extra_actions)
         for action in raw_actions:
+            action_json = json.dumps(action)
+            if action_json not in seen_actions:
+                seen_actions.add(action_json)
+                unique_actions.append(action)
+        for action in unique_actions:
             if int(action[3]) < int(self.__js_start_time):
                 continue
             # Use key for sorting and preventing duplicates
@@ -5724,8 +5720,8 @@ class BaseCase(unittest.TestCase):
                 srt_actions[n][2] = srt_actions[n][1][1]
                 srt_actions[n][1] = srt_actions[n][1][0]
 
-        # Generate the script from processed actions
-        sb_actions = recorder_helper.generate_sbase_code(srt_actions)
+        # Generate the script from processed actions (streamed when used)
+        sb_actions = recorder_helper.iter_sbase_code(srt_actions)
         filename = self.__get_filename()
         classname = self.__class__.__name__
         methodname = self._testMethodName
@@ -5794,16 +5790,17 @@ class BaseCase(unittest.TestCase):
         if not new_file and classname not in " ".join(data):
             data.append("class %s(BaseCase):" % classname)
         data.append("    def %s(self):" % methodname)
-        if len(sb_actions) > 0:
-            if "--uc" in sys.argv:
-                data.append("        self.activate_cdp_mode()")
-            for action in sb_actions:
-                if "--uc" in sys.argv:
-                    action = action.replace(
-                        "self.type(", "self.press_keys("
-                    )
-                data.append("        " + action)
-        else:
+        using_uc = "--uc" in sys.argv
+        has_actions = False
+        for action in sb_actions:
+            if not has_actions:
+                has_actions = True
+                if using_uc:
+                    data.append("        self.activate_cdp_mode()")
+            if using_uc:
+                action = action.replace("self.type(", "self.press_keys(")
+            data.append("        " + action)
+        if not has_actions:
             data.append("        pass")
         data.append("")
         sb_config._recorded_actions[filename] = data
@@ -7201,8 +7198,6 @@ class BaseCase(unittest.TestCase):
         If "verify" is False, will ignore certificate errors.
         For a list of available status codes, see:
         https://en.wikipedia.org/wiki/List_of_HTTP_status_codes """
-        if self.__requests_timeout:
-            timeout = self.__requests_timeout
         if timeout < 1:
             timeout = 1
         return page_utils._get_link_status_code(
@@ -7217,25 +7212,17 @@ class BaseCase(unittest.TestCase):
         bad_link_str = 'Error: "%s" returned a 404!' % link
         self.assertNotEqual(status_code, "404", bad_link_str)
 
-    def __get_link_if_404_error(self, link):
-        status_code = str(self.get_link_status_code(link))
-        if status_code == "404":
-            # Verify again to be sure. (In case of multi-threading overload.)
-            status_code = str(self.get_link_status_code(link))
-            if status_code == "404":
-                return link
-            else:
-                return None
-        else:
-            return None
-
     def assert_no_404_errors(self, multithreaded=True, timeout=None):
         """Assert no 404 errors from page links obtained from:
         "a"->"href", "img"->"src", "link"->"href", and "script"->"src".
         Timeout is on a per-link basis using the "requests" library.
         If timeout is None, uses the one set in get_link_status_code().
         (That timeout value is currently set to 5 seconds per link.)
+        Connections are reused, and status codes are cached, so links
+        that appear on multiple pages are only checked once per session.
         (A 404 error represents a broken link on a web page.)"""
+        from seleniumbase.core import link_checker
+
         all_links = self.get_unique_links()
         links = []
         for link in all_links:
@@ -7254,24 +7241,16 @@ class BaseCase(unittest.TestCase):
                 raise Exception('Expecting a numeric value for "timeout"!')
             if timeout < 0:
                 raise Exception('The "timeout" cannot be a negative number!')
-            self.__requests_timeout = timeout
-        broken_links = []
-        if multithreaded:
-            from multiprocessing.dummy import Pool as ThreadPool
-
-            pool = ThreadPool(10)
-            results = pool.map(self.__get_link_if_404_error, links)
-            pool.close()
-            pool.join()
-            for result in results:
-                if result:
-                    broken_links.append(result)
         else:
-            broken_links = []
-            for link in links:
-                if self.__get_link_if_404_error(link):
-                    broken_links.append(link)
-        self.__requests_timeout = None  # Reset the requests.head() timeout
+            timeout = 5
+        if timeout < 1:
+            timeout = 1
+        status_codes = link_checker.get_status_codes(
+            links, timeout=timeout, multithreaded=multithreaded
+        )
+        broken_links = [
+            link for link in links if str(status_codes[link]) == "404"
+        ]
         if len(broken_links) > 0:
             broken_links = sorted(broken_links)
             bad_links_str = "\n".join(broken_links)
@@ -7932,12 +7911,11 @@ class BaseCase(unittest.TestCase):
             timeout = settings.LARGE_TIMEOUT
         if self.timeout_multiplier and timeout == settings.LARGE_TIMEOUT:
             timeout = self.__get_new_timeout(timeout)
-        start_ms = time.time() * 1000.0
-        stop_ms = start_ms + (timeout * 1000.0)
+        wait_deadline = deadline.Deadline(timeout)
         downloaded_file_path = self.get_path_of_downloaded_file(file, browser)
         found = False
         for x in range(int(timeout)):
-            shared_utils.check_if_time_limit_exceeded()
+            wait_deadline.check_time_limit()
             try:
                 self.assertTrue(
                     os.path.exists(downloaded_file_path),
@@ -7947,8 +7925,7 @@ class BaseCase(unittest.TestCase):
                 found = True
                 break
             except Exception:
-                now_ms = time.time() * 1000.0
-                if now_ms >= stop_ms:
+                if wait_deadline.expired():
                     break
                 time.sleep(1)
         if not found and not os.path.exists(downloaded_file_path):
@@ -7989,14 +7966,13 @@ class BaseCase(unittest.TestCase):
             timeout = settings.LARGE_TIMEOUT
         if self.timeout_multiplier and timeout == settings.LARGE_TIMEOUT:
             timeout = self.__get_new_timeout(timeout)
-        start_ms = time.time() * 1000.0
-        stop_ms = start_ms + (timeout * 1000.0)
+        wait_deadline = deadline.Deadline(timeout)
         found = False
         df = self.get_downloads_folder()
         if browser:
             df = self.get_browser_downloads_folder()
         for x in range(int(timeout)):
-            shared_utils.check_if_time_limit_exceeded()
+            wait_deadline.check_time_limit()
             try:
                 matches = [fn for fn in os.listdir(df) if re.match(regex, fn)]
                 self.assertTrue(
@@ -8007,8 +7983,7 @@ class BaseCase(unittest.TestCase):
                 found = True
                 break
             except Exception:
-                now_ms = time.time() * 1000.0
-                if now_ms >= stop_ms:
+                if wait_deadline.expired():
                     break
                 time.sleep(1)
         if not found:
@@ -9207,14 +9182,18 @@ class BaseCase(unittest.TestCase):
         else:
             recorder_keys = [
                 "recorder_mode",
-                "recorded_actions",
+                "recorded_actions_count",
+                "recorded_actions_low",
                 "recorder_title",
                 "pause_recorder",
                 "recorder_activated",
             ]
             keys = self.get_session_storage_keys()
             for key in keys:
-                if key not in recorder_keys:
+                if (
+                    key not in recorder_keys
+                    and not key.startswith("recorded_action_")
+                ):
                     self.remove_session_storage_item(key)
             time_stamp = self.execute_script("return Date.now();")
             origin = self.get_origin()
@@ -9599,6 +9578,59 @@ class BaseCase(unittest.TestCase):
         self.wait_for_any_of_elements_present(*args, **kwargs)
         return True
 
+    def wait_for_all(self, *args, **kwargs):
+        """Waits for all of the given conditions to be met.
+        Every condition is checked in a single JavaScript call per attempt,
+        so waiting on N conditions costs one round trip instead of N.
+        A condition is either a selector (which must become visible),
+        or a tuple with one of the following formats:
+            ("present", selector)
+            ("visible", selector)
+            ("text", text, selector)  # (selector defaults to "html")
+            ("exact_text", text, selector)
+            ("attribute", selector, attribute, value)  # (value optional)
+            ("absent", selector)
+            ("not_visible", selector)
+        Optional kwargs include: "timeout" (used by all conditions).
+        Raises an exception if any condition was not met by the timeout.
+        Returns True if successful. Default timeout = LARGE_TIMEOUT.
+        Allows flexible inputs (Eg. Multiple args or a list of args)
+        Examples:
+            self.wait_for_all("#header", ("text", "Welcome", "h1"))
+            OR
+            self.wait_for_all(["#header", ("absent", ".spinner")]) """
+        self.__check_scope()
+        conditions, timeout = self.__get_wait_conditions(args, kwargs)
+        page_actions.wait_for_conditions(
+            self.driver,
+            conditions,
+            match_all=True,
+            timeout=timeout,
+        )
+        return True
+
+    def wait_for_any(self, *args, **kwargs):
+        """Waits for at least one of the given conditions to be met.
+        Every condition is checked in a single JavaScript call per attempt.
+        Conditions use the same formats as self.wait_for_all() does.
+        Optional kwargs include: "timeout" (used by all conditions).
+        Raises an exception if no condition was met by the timeout.
+        Returns the index of the first condition that was met.
+        Default timeout = LARGE_TIMEOUT.
+        Examples:
+            self.wait_for_any("#dashboard", ("text", "Error", ".alert"))
+            OR
+            self.wait_for_any(["#dashboard", ("present", "#login")]) """
+        self.__check_scope()
+        conditions, timeout = self.__get_wait_conditions(args, kwargs)
+        met = page_actions.wait_for_conditions(
+            self.driver,
+            conditions,
+            match_all=False,
+            timeout=timeout,
+        )
+        return met.index(True)
+
     def select_all(self, selector, by="css selector", limit=0):
         return self.find_elements(selector, by=by, limit=limit)
 
@@ -10581,10 +10613,9 @@ class BaseCase(unittest.TestCase):
         self.__check_scope()
         if not timeout:
             timeout = settings.SMALL_TIMEOUT
-        start_ms = time.time() * 1000.0
-        stop_ms = start_ms + (timeout * 1000.0)
+        wait_deadline = deadline.Deadline(timeout)
         for x in range(int(timeout * 5)):
-            shared_utils.check_if_time_limit_exceeded()
+            wait_deadline.check_time_limit()
             try:
                 if not self.is_link_text_present(link_text):
                     raise Exception(
@@ -10592,8 +10623,7 @@ class BaseCase(unittest.TestCase):
                     )
                 return
             except Exception:
-                now_ms = time.time() * 1000.0
-                if now_ms >= stop_ms:
+                if wait_deadline.expired():
                     break
                 time.sleep(0.2)
         plural = "s"
@@ -10610,10 +10640,9 @@ class BaseCase(unittest.TestCase):
         self.__check_scope()
         if not timeout:
             timeout = settings.SMALL_TIMEOUT
-        start_ms = time.time() * 1000.0
-        stop_ms = start_ms + (timeout * 1000.0)
+        wait_deadline = deadline.Deadline(timeout)
         for x in range(int(timeout * 5)):
-            shared_utils.check_if_time_limit_exceeded()
+            wait_deadline.check_time_limit()
             try:
                 if not self.is_partial_link_text_present(link_text):
                     raise Exception(
@@ -10621,8 +10650,7 @@ class BaseCase(unittest.TestCase):
                     )
                 return
             except Exception:
-                now_ms = time.time() * 1000.0
-                if now_ms >= stop_ms:
+                if wait_deadline.expired():
                     break
                 time.sleep(0.2)
         plural = "s"
@@ -11184,6 +11212,21 @@ class BaseCase(unittest.TestCase):
             ):
                 self.__create_log_path_as_needed(test_logpath)
                 shutil.copy(latest_png_path, latest_copy_path)
+            if len(baseline_copy_tuple) > 6:
+                diff_mask_path = baseline_copy_tuple[6]
+                diff_mask_copy_path = os.path.join(
+                    test_logpath, baseline_copy_tuple[7]
+                )
+                if len(self.__visual_baseline_copies) == 1:
+                    diff_mask_copy_path = os.path.join(
+                        test_logpath, baseline_copy_tuple[8]
+                    )
+                if (
+                    os.path.exists(diff_mask_path)
+                    and not os.path.exists(diff_mask_copy_path)
+                ):
+                    self.__create_log_path_as_needed(test_logpath)
+                    shutil.copy(diff_mask_path, diff_mask_copy_path)
         if len(self.__visual_baseline_copies) != 1:
             return  # Skip the rest when deferred visual asserts are used
         the_html = visual_helper.get_sbs_html()
@@ -11199,6 +11242,10 @@ class BaseCase(unittest.TestCase):
         baseline=False,
         check_domain=True,
         full_diff=False,
+        pixel_diff=False,
+        tolerance=None,
+        max_diff_pixels=None,
+        anti_aliasing=True,
     ):
         """***  Automated Visual Testing with SeleniumBase  ***
 
@@ -11261,6 +11308,16 @@ class BaseCase(unittest.TestCase):
         include the first differing element in the list comparison.
         Set "full_diff" to True if you want to see the full output.
 
+        If "pixel_diff" is set to True, the latest screenshot is also
+        compared to the baseline screenshot, pixel by pixel, in tiles.
+        A pixel is different if a color channel differs by more than
+        "tolerance" (0-255). With "anti_aliasing", a different pixel is
+        allowed if it matches a neighboring pixel in the other image.
+        The check fails (printing only for Level-0) if more pixels than
+        "max_diff_pixels" are different. A "diff_mask.png" file shows
+        the different pixels in red. (Defaults: constants.VisualBaseline)
+        (Requires NumPy and Pillow, which get installed if missing.)
+
         Automated Visual Testing with self.check_window() is not very
         effective for websites that have dynamic content that changes
         the layout and structure of web pages. For those, you're much
@@ -11270,7 +11327,8 @@ class BaseCase(unittest.TestCase):
             self.check_window(name="testing", level=0)
             self.check_window(name="xkcd_home", level=1)
             self.check_window(name="github_page", level=2)
-            self.check_window(name="wikipedia_page", level=3) """
+            self.check_window(name="wikipedia_page", level=3)
+            self.check_window(name="logo", level=1, pixel_diff=True) """
         self.wait_for_ready_state_complete()
         with suppress(Exception):
             self.wait_for_element_visible(
@@ -11313,6 +11371,14 @@ class BaseCase(unittest.TestCase):
         level_1_file = os.path.join(visual_baseline_path, "tags_level_1.txt")
         level_2_file = os.path.join(visual_baseline_path, "tags_level_2.txt")
         level_3_file = os.path.join(visual_baseline_path, "tags_level_3.txt")
+        fingerprint_file = os.path.join(
+            visual_baseline_path, "fingerprint.json"
+        )
+        diff_mask_path = os.path.join(visual_baseline_path, "diff_mask.png")
+        if tolerance is None:
+            tolerance = constants.VisualBaseline.PIXEL_TOLERANCE
+        if max_diff_pixels is None:
+            max_diff_pixels = constants.VisualBaseline.MAX_DIFF_PIXELS
 
         set_baseline = False
         if baseline or self.visual_baseline:
@@ -11335,16 +11401,17 @@ class BaseCase(unittest.TestCase):
             set_baseline = True
 
         page_url = self.get_current_url()
-        soup = self.get_beautiful_soup()
-        html_tags = soup.body.find_all()
-        level_1 = [[tag.name] for tag in html_tags]
-        level_1 = json.loads(json.dumps(level_1))  # Tuples become lists
-        level_2 = [[tag.name, sorted(tag.attrs.keys())] for tag in html_tags]
-        level_2 = json.loads(json.dumps(level_2))  # Tuples become lists
-        level_3 = [[tag.name, sorted(tag.attrs.items())] for tag in html_tags]
-        level_3 = json.loads(json.dumps(level_3))  # Tuples become lists
+        if os.path.exists(diff_mask_path):
+            # A diff mask is only for the pixel_diff comparison that made it.
+            # (Otherwise an old mask gets copied into the logs of a failure)
+            with suppress(Exception):
+                os.remove(diff_mask_path)
 
         if set_baseline:
+            fingerprint = self.execute_script(
+                visual_helper.get_fingerprint_script(with_levels=True)
+            )
+            level_1, level_2, level_3 = fingerprint["levels"]
             self.save_screenshot(
                 baseline_png, visual_baseline_path, selector="body"
             )
@@ -11360,15 +11427,35 @@ class BaseCase(unittest.TestCase):
             out_file = open(level_3_file, mode="w+", encoding="utf-8")
             out_file.writelines(json.dumps(level_3))
             out_file.close()
+            out_file = open(fingerprint_file, mode="w+", encoding="utf-8")
+            out_file.writelines(
+                json.dumps(
+                    {
+                        "hashes": fingerprint["hashes"],
+                        "count": fingerprint["count"],
+                    }
+                )
+            )
+            out_file.close()
+            if pixel_diff:
+                from seleniumbase.core import image_diff
+
+                # Cache the tile hashes of the new baseline now
+                image_diff.get_baseline_tile_hashes(
+                    baseline_png_path, constants.VisualBaseline.TILE_SIZE
+                )
 
         baseline_path = os.path.join(visual_baseline_path, baseline_png)
         baseline_copy_name = "baseline_%s.png" % name
         b_c_alt_name = "baseline.png"
         latest_copy_name = "baseline_diff_%s.png" % name
         l_c_alt_name = "baseline_diff.png"
+        diff_mask_copy_name = "diff_mask_%s.png" % name
+        d_m_alt_name = "diff_mask.png"
         baseline_copy_tuple = (
             baseline_path, baseline_copy_name, b_c_alt_name,
             latest_png_path, latest_copy_name, l_c_alt_name,
+            diff_mask_path, diff_mask_copy_name, d_m_alt_name,
         )
         self.__visual_baseline_copies.append(baseline_copy_tuple)
 
@@ -11380,15 +11467,59 @@ class BaseCase(unittest.TestCase):
             f = open(page_url_file, "r")
             page_url_data = f.read().strip()
             f.close()
-            f = open(level_1_file, "r")
-            level_1_data = json.loads(f.read())
-            f.close()
-            f = open(level_2_file, "r")
-            level_2_data = json.loads(f.read())
-            f.close()
-            f = open(level_3_file, "r")
-            level_3_data = json.loads(f.read())
-            f.close()
+            if os.path.exists(fingerprint_file):
+                # Compare the hashes of the levels first.
+                # (The level lists are only needed to show differences.)
+                f = open(fingerprint_file, "r")
+                fingerprint_data = json.loads(f.read())
+                f.close()
+                fingerprint = self.execute_script(
+                    visual_helper.get_fingerprint_script()
+                )
+                # Only the levels being checked need to match.
+                # (Level 0 prints the differences of every level)
+                checked_levels = ["1", "2", "3"][:level or 3]
+                if any(
+                    fingerprint["hashes"].get(lvl)
+                    != fingerprint_data["hashes"].get(lvl)
+                    for lvl in checked_levels
+                ):
+                    fingerprint = self.execute_script(
+                        visual_helper.get_fingerprint_script(with_levels=True)
+                    )
+            else:
+                # A baseline from before fingerprints. (Made from the soup)
+                fingerprint = None
+                soup = self.get_beautiful_soup()
+                html_tags = soup.body.find_all()
+                level_1 = [[tag.name] for tag in html_tags]
+                level_1 = json.loads(json.dumps(level_1))
+                level_2 = [
+                    [tag.name, sorted(tag.attrs.keys())] for tag in html_tags
+                ]
+                level_2 = json.loads(json.dumps(level_2))
+                level_3 = [
+                    [tag.name, sorted(tag.attrs.items())] for tag in html_tags
+                ]
+                level_3 = json.loads(json.dumps(level_3))
+            if fingerprint and not fingerprint["levels"]:
+                # The hashes of the checked levels match, so their lists
+                # match too. (Unchecked levels aren't compared at all)
+                level_1 = level_1_data = []
+                level_2 = level_2_data = []
+                level_3 = level_3_data = []
+            else:
+                if fingerprint:
+                    level_1, level_2, level_3 = fingerprint["levels"]
+                f = open(level_1_file, "r")
+                level_1_data = json.loads(f.read())
+                f.close()
+                f = open(level_2_file, "r")
+                level_2_data = json.loads(f.read())
+                f.close()
+                f = open(level_3_file, "r")
+                level_3_data = json.loads(f.read())
+                f.close()
 
             domain_fail = (
                 "\n*\nPage Domain Mismatch Failure: "
@@ -11408,6 +11539,34 @@ class BaseCase(unittest.TestCase):
                 "\n*\n*** Exception: <Level 3> Visual Diff Failure:\n"
                 "* HTML tag attribute values don't match the baseline!"
             )
+            pixel_failure = None
+            if pixel_diff:
+                from seleniumbase.core import image_diff
+
+                diff = image_diff.compare_images(
+                    baseline_png_path,
+                    latest_png_path,
+                    diff_mask_path,
+                    tolerance=tolerance,
+                    anti_aliasing=anti_aliasing,
+                )
+                if diff.diff_pixels > max_diff_pixels:
+                    pixel_failure = (
+                        "\n*\n*** Exception: <Pixel> Visual Diff Failure:\n"
+                        "* %s of %s pixels don't match the baseline! "
+                        "(Max allowed: %s) (Tolerance: %s)"
+                        % (
+                            diff.diff_pixels,
+                            diff.total_pixels,
+                            max_diff_pixels,
+                            tolerance,
+                        )
+                    )
+                    if diff.size_changed:
+                        pixel_failure += (
+                            "\n* Screenshot size changed: %s x %s"
+                            % diff.size
+                        )
 
             page_domain = self.get_domain_url(page_url)
             page_data_domain = self.get_domain_url(page_url_data)
@@ -11429,7 +11588,12 @@ class BaseCase(unittest.TestCase):
                     self.__assert_eq(level_1_data, level_1, level_1_failure)
                 else:
                     self.assertEqual(level_1_data, level_1, level_1_failure)
+            if level != 0 and pixel_failure:
+                raise VisualException(pixel_failure)
             if level == 0:
+                if pixel_failure:
+                    print(pixel_failure)  # Level-0 Dry Run
+                    is_level_0_failure = True
                 try:
                     if check_domain:
                         self.assertEqual(
@@ -11490,6 +11654,11 @@ class BaseCase(unittest.TestCase):
             ):
                 shutil.copy(baseline_path, baseline_copy_path)
                 shutil.copy(latest_png_path, latest_copy_path)
+            if os.path.exists(diff_mask_path):
+                shutil.copy(
+                    diff_mask_path,
+                    os.path.join(test_logpath, diff_mask_copy_name),
+                )
             the_html = visual_helper.get_sbs_html(
                 baseline_copy_name, latest_copy_name
             )
@@ -11502,6 +11671,72 @@ class BaseCase(unittest.TestCase):
 
     ############
 
+    def __get_wait_conditions(self, args, kwargs):
+        """Parses the inputs of wait_for_all() and wait_for_any().
+        Returns a (conditions, timeout) tuple, where each condition is
+        (condition, selector, by, text_or_attribute, value)."""
+        raw_conditions = []
+        timeout = None
+        for kwarg in kwargs:
+            if kwarg == "timeout":
+                timeout = kwargs["timeout"]
+            elif kwarg == "conditions":
+                raw_conditions.extend(kwargs[kwarg])
+            else:
+                raise Exception('Unknown kwarg: "%s"!' % kwarg)
+        if not timeout:
+            timeout = settings.LARGE_TIMEOUT
+        if self.timeout_multiplier and timeout == settings.LARGE_TIMEOUT:
+            timeout = self.__get_new_timeout(timeout)
+        for arg in args:
+            if isinstance(arg, list):
+                raw_conditions.extend(arg)
+            else:
+                raw_conditions.append(arg)
+        if not raw_conditions:
+            raise Exception("The conditions list was empty!")
+        conditions = []
+        for raw_condition in raw_conditions:
+            if isinstance(raw_condition, str):
+                raw_condition = ("visible", raw_condition)
+            if (
+                not isinstance(raw_condition, tuple)
+                or len(raw_condition) < 2
+                or raw_condition[0] not in constants.Conditions.VALID
+            ):
+                raise Exception(
+                    'Invalid condition: "%s"\nValid conditions: %s'
+                    % (str(raw_condition), constants.Conditions.VALID)
+                )
+            kind = raw_condition[0]
+            text_or_attr = None
+            value = None
+            if kind in ["text", "exact_text"]:
+                text_or_attr = str(raw_condition[1])
+                selector = "html"
+                if len(raw_condition) > 2:
+                    selector = raw_condition[2]
+            elif kind == "attribute":
+                if len(raw_condition) < 3:
+                    raise Exception(
+                        'Missing attribute in condition: "%s"'
+                        % str(raw_condition)
+                    )
+                selector = raw_condition[1]
+                text_or_attr = raw_condition[2]
+                if len(raw_condition) > 3:
+                    value = raw_condition[3]
+            else:
+                selector = raw_condition[1]
+            selector, by = self.__recalculate_selector(
+                selector, By.CSS_SELECTOR
+            )
+            if by not in constants.Conditions.VALID_BY:
+                selector = js_utils.convert_to_css_selector(selector, by)
+                by = "css selector"
+            conditions.append((kind, selector, by, text_or_attr, value))
+        return (conditions, timeout)
+
     def __get_new_timeout(self, timeout):
         """When using --timeout_multiplier=#.#"""
         self.__check_scope()
@@ -11773,6 +12008,10 @@ class BaseCase(unittest.TestCase):
         check_domain=True,
         full_diff=False,
         fs=False,
+        pixel_diff=False,
+        tolerance=None,
+        max_diff_pixels=None,
+        anti_aliasing=True,
     ):
         """A non-terminating assertion for the check_window() method.
         Failures will be saved until the process_deferred_asserts()
@@ -11790,6 +12029,10 @@ class BaseCase(unittest.TestCase):
                 baseline=baseline,
                 check_domain=check_domain,
                 full_diff=full_diff,
+                pixel_diff=pixel_diff,
+                tolerance=tolerance,
+                max_diff_pixels=max_diff_pixels,
+                anti_aliasing=anti_aliasing,
             )
             return True
         except Exception:
@@ -11881,6 +12124,10 @@ class BaseCase(unittest.TestCase):
         check_domain=True,
         full_diff=False,
         fs=False,
+        pixel_diff=False,
+        tolerance=None,
+        max_diff_pixels=None,
+        anti_aliasing=True,
     ):
         """Same as self.deferred_check_window()"""
         return self.deferred_check_window(
@@ -11890,6 +12137,10 @@ class BaseCase(unittest.TestCase):
             check_domain=check_domain,
             full_diff=full_diff,
             fs=fs,
+            pixel_diff=pixel_diff,
+            tolerance=tolerance,
+            max_diff_pixels=max_diff_pixels,
+            anti_aliasing=anti_aliasing,
         )
 
     def process_delayed_asserts(self, print_only=False):
@@ -15408,6 +15659,7 @@ class BaseCase(unittest.TestCase):
             self._multithreaded = sb_config._multithreaded
             self._reuse_session = sb_config.reuse_session
             self._crumbs = sb_config.crumbs
+            self._browser_pool = getattr(sb_config, "browser_pool", None)
             self._disable_beforeunload = sb_config._disable_beforeunload
             self.dashboard = sb_config.dashboard
             self._dash_initialized = sb_config._dashboard_initialized
@@ -15552,6 +15804,7 @@ class BaseCase(unittest.TestCase):
 
         # Add _process_dashboard_entry method to sb_config
         sb_config._process_dashboard_entry = self._process_dashboard_entry
+        sb_config._refresh_dashboard = self._refresh_dashboard
 
         # Add _add_pytest_html_extra method to sb_config
         sb_config._add_pytest_html_extra = self._add_pytest_html_extra
@@ -15685,22 +15938,10 @@ class BaseCase(unittest.TestCase):
             self.__activate_virtual_display_as_needed()
 
         # Dashboard pre-processing:
-        if self.dashboard:
-            if self._multithreaded:
-                with self.dash_lock:
-                    with suppress(Exception):
-                        shared_utils.make_writable(
-                            constants.Dashboard.LOCKFILE
-                        )
-                    if not self._dash_initialized:
-                        sb_config._dashboard_initialized = True
-                        self._dash_initialized = True
-                        self.__process_dashboard(False, init=True)
-            else:
-                if not self._dash_initialized:
-                    sb_config._dashboard_initialized = True
-                    self._dash_initialized = True
-                    self.__process_dashboard(False, init=True)
+        if self.dashboard and not self._dash_initialized:
+            sb_config._dashboard_initialized = True
+            self._dash_initialized = True
+            self.__process_dashboard(False, init=True)
 
         # Set the JS start time for Recorder Mode.
         # Use this to skip saving recorded actions from previous tests.
@@ -15757,7 +15998,7 @@ class BaseCase(unittest.TestCase):
                         self.__js_start_time = int(time.time() * 1000.0)
         else:
             # Launch WebDriver for both pytest and pynose
-            self.driver = self.get_new_driver(
+            driver_kwargs = dict(
                 browser=self.browser,
                 headless=self.headless,
                 locale_code=self.locale_code,
@@ -15815,6 +16056,27 @@ class BaseCase(unittest.TestCase):
                 d_height=self.__device_height,
                 d_p_r=self.__device_pixel_ratio,
             )
+            pool = self.__get_browser_pool()
+            pooled_driver = None
+            if pool:
+                pool_key = repr(sorted(driver_kwargs.items()))
+                pooled_driver = pool.lease_idle(pool_key)
+            if pooled_driver:
+                self.driver = pooled_driver
+                self._drivers_list.append(self.driver)
+                self._drivers_browser_map[self.driver] = self.browser
+                if self.start_page and len(self.start_page) >= 4:
+                    start_page = self.start_page
+                    if not page_utils.is_valid_url(start_page):
+                        start_page = "https://" + start_page
+                    if page_utils.is_valid_url(start_page):
+                        self.__dont_record_open = True
+                        self.open(start_page)
+                        self.__dont_record_open = False
+            else:
+                self.driver = self.get_new_driver(**driver_kwargs)
+                if pool:
+                    pool.add(self.driver, pool_key)
             try:
                 if self.driver.timeouts.implicit_wait > 0:
                     self.driver.implicitly_wait(0)
@@ -15850,6 +16112,7 @@ class BaseCase(unittest.TestCase):
         # the time-limit clock starts at the end of the setUp() method.
         sb_config.start_time_ms = int(time.time() * 1000.0)
         self.__start_time_ms = sb_config.start_time_ms
+        deadline.start_test()
 
     def __set_last_page_screenshot(self):
         """self.__last_page_screenshot is only for pytest html report logs.
@@ -15942,16 +16205,10 @@ class BaseCase(unittest.TestCase):
 
     def __set_last_page_source(self):
         if not self.__last_page_source:
-            try:
-                self.__last_page_source = (
-                    log_helper.get_html_source_with_base_href(
-                        self.driver, self.driver.page_source
-                    )
-                )
-            except Exception:
-                self.__last_page_source = (
-                    constants.Warnings.PAGE_SOURCE_UNDEFINED
-                )
+            # (Streamed to a file. See log_helper.PageSourceCapture)
+            self.__last_page_source = log_helper.capture_page_source(
+                self.driver
+            )
             sb_config._last_page_source = self.__last_page_source
 
     def __get_exception_info(self):
@@ -16057,7 +16314,38 @@ class BaseCase(unittest.TestCase):
             delay_driver_quit = True
         return delay_driver_quit
 
+    def __get_browser_pool(self):
+        """Returns the BrowserPool if "--browser-pool=N" applies here."""
+        pool_size = getattr(self, "_browser_pool", None)
+        if (
+            not pool_size
+            or self._reuse_session
+            or self.undetectable
+            or self.recorder_ext
+            or self.user_data_dir
+            or self.servername not in ["localhost", "127.0.0.1"]
+        ):
+            return None
+        if not getattr(sb_config, "_browser_pool", None):
+            import atexit
+            from seleniumbase.core.browser_pool import BrowserPool
+
+            sb_config._browser_pool = BrowserPool(pool_size)
+            atexit.register(sb_config._browser_pool.close)
+        return sb_config._browser_pool
+
+    def __release_pooled_drivers(self):
+        """Gives leased browsers back to the BrowserPool (if used)."""
+        pool = getattr(sb_config, "_browser_pool", None)
+        if not pool or self.__delay_driver_quit():
+            return
+        for driver in list(self._drivers_list):
+            if pool.is_leased(driver):
+                self._drivers_list.remove(driver)
+                pool.release(driver)
+
     def __quit_all_drivers(self):
+        self.__release_pooled_drivers()
         if self._reuse_session and sb_config.shared_driver:
             if len(self._drivers_list) > 0:
                 if self._drivers_list[0] != sb_config.shared_driver:
@@ -16258,12 +16546,12 @@ class BaseCase(unittest.TestCase):
             self.dash_lock = fasteners.InterProcessLock(
                 constants.Dashboard.LOCKFILE
             )
-            with self.dash_lock:
-                with suppress(Exception):
-                    shared_utils.make_writable(constants.Dashboard.LOCKFILE)
-                self.__process_dashboard(has_exception, init)
-        else:
-            self.__process_dashboard(has_exception, init)
+        self.__process_dashboard(has_exception, init)
+
+    def _refresh_dashboard(self):
+        """Renders the Dashboard with the latest results of all processes.
+        (Called at the end of multithreaded runs, while holding the lock.)"""
+        self.__render_dashboard()
 
     def __process_dashboard(self, has_exception, init=False):
         """SeleniumBase Dashboard Processing"""
@@ -16279,24 +16567,7 @@ class BaseCase(unittest.TestCase):
             and not has_exception
         ):
             return  # Handle case where "pytest --pdb" marks failures as Passed
-        if self._multithreaded:
-            existing_res = sb_config._results  # For recording "Skipped" tests
-            abs_path = os.path.abspath(".")
-            dash_json_loc = constants.Dashboard.DASH_JSON
-            dash_jsonpath = os.path.join(abs_path, dash_json_loc)
-            if not init and os.path.exists(dash_jsonpath):
-                with open(dash_jsonpath, "r") as f:
-                    dash_json = f.read().strip()
-                dash_data, d_id, dash_rt, tlp, d_stats = json.loads(dash_json)
-                num_passed, num_failed, num_skipped, num_untested = d_stats
-                sb_config._results = dash_data
-                sb_config._display_id = d_id
-                sb_config._duration = dash_rt  # Dashboard Run Time
-                sb_config._d_t_log_path = tlp  # Test Log Path
-                sb_config.item_count_passed = num_passed
-                sb_config.item_count_failed = num_failed
-                sb_config.item_count_skipped = num_skipped
-                sb_config.item_count_untested = num_untested
+        new_entries = list(sb_config._extra_dash_entries)
         if len(sb_config._extra_dash_entries) > 0:
             # First take care of existing entries from non-SeleniumBase tests
             for test_id in sb_config._extra_dash_entries:
@@ -16319,7 +16590,6 @@ class BaseCase(unittest.TestCase):
         ft_id = self.__get_test_id()  # Full test id with path to log files
         test_id = self.__get_test_id_2()  # The test id used by the DashBoard
         dud = "seleniumbase/plugins/pytest_plugin.py::BaseClass::base_method"
-        dud2 = "pytest_plugin.BaseClass.base_method"
         if hasattr(self, "_using_sb_fixture") and self.__will_be_skipped:
             test_id = sb_config._test_id
         if not init:
@@ -16368,14 +16638,6 @@ class BaseCase(unittest.TestCase):
                 sb_config._results[test_id] = "Skipped"
                 sb_config.item_count_skipped += 1
                 sb_config.item_count_untested -= 1
-            elif (
-                self._multithreaded
-                and test_id in existing_res.keys()
-                and existing_res[test_id] == "Skipped"
-            ):
-                sb_config._results[test_id] = "Skipped"
-                sb_config.item_count_skipped += 1
-                sb_config.item_count_untested -= 1
             elif has_exception:
                 if test_id not in sb_config._results.keys():
                     sb_config._results[test_id] = "Failed"
@@ -16416,12 +16678,122 @@ class BaseCase(unittest.TestCase):
                 sb_config._results[test_id] = "Passed"
                 sb_config.item_count_passed += 1
                 sb_config.item_count_untested -= 1
+            new_entries.append(test_id)
         else:
             pass  # Only initialize the Dashboard on the first processing
-        num_passed = sb_config.item_count_passed
-        num_failed = sb_config.item_count_failed
-        num_skipped = sb_config.item_count_skipped
-        num_untested = sb_config.item_count_untested
+        if not self._multithreaded:
+            self.__render_dashboard()
+            return
+        # Multithreaded: Each process appends its results to its own file.
+        # Rendering merges the files, and is skipped if done very recently.
+        # (The last process to finish renders the final Dashboard.)
+        self.__append_dashboard_records(new_entries)
+        if init:
+            with self.dash_lock:
+                with suppress(Exception):
+                    shared_utils.make_writable(constants.Dashboard.LOCKFILE)
+                self.__render_dashboard()
+            return
+        abs_path = os.path.abspath(".")
+        dash_path = os.path.join(abs_path, "dashboard.html")
+        with suppress(Exception):
+            last_render = os.path.getmtime(dash_path)
+            if time.time() - last_render < constants.Dashboard.RENDER_DELAY:
+                return
+        if self.dash_lock.acquire(blocking=False):
+            try:
+                self.__render_dashboard()
+            finally:
+                self.dash_lock.release()
+
+    def __append_dashboard_records(self, test_ids):
+        """Appends Dashboard results to the file of the current process.
+        Each line is a JSON list: [test_id, result, duration, display_id,
+        log_path]. (Only the current process writes to the file.)"""
+        if not test_ids:
+            return
+        records_dir = os.path.join(
+            os.path.abspath("."), constants.Dashboard.DASH_RECORDS
+        )
+        os.makedirs(records_dir, exist_ok=True)
+        records_file = os.path.join(records_dir, "%s.jsonl" % os.getpid())
+        lines = []
+        for test_id in test_ids:
+            if test_id not in sb_config._results.keys():
+                continue
+            record = [
+                test_id,
+                sb_config._results[test_id],
+                sb_config._duration.get(test_id),
+                sb_config._display_id.get(test_id),
+                sb_config._d_t_log_path.get(test_id),
+            ]
+            lines.append(json.dumps(record) + "\n")
+        with open(records_file, mode="a", encoding="utf-8") as f:
+            f.writelines(lines)
+
+    def __get_dashboard_data(self):
+        """Returns (results, durations, display_ids, log_paths, counts).
+        For multithreaded runs, merges the records of every process."""
+        results = sb_config._results
+        durations = sb_config._duration
+        display_ids = sb_config._display_id
+        log_paths = sb_config._d_t_log_path
+        if not self._multithreaded:
+            counts = (
+                sb_config.item_count_passed,
+                sb_config.item_count_failed,
+                sb_config.item_count_skipped,
+                sb_config.item_count_untested,
+            )
+            return (results, durations, display_ids, log_paths, counts)
+        results = dict(results)
+        durations = dict(durations)
+        display_ids = dict(display_ids)
+        log_paths = dict(log_paths)
+        records_dir = os.path.join(
+            os.path.abspath("."), constants.Dashboard.DASH_RECORDS
+        )
+        records_files = []
+        if os.path.exists(records_dir):
+            records_files = sorted(os.listdir(records_dir))
+        for file_name in records_files:
+            if not file_name.endswith(".jsonl"):
+                continue
+            file_path = os.path.join(records_dir, file_name)
+            with open(file_path, mode="r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        t_id, t_res, t_dur, t_d_id, t_l_path = (
+                            json.loads(line)
+                        )
+                    except Exception:
+                        continue  # A line that is still being written
+                    results[t_id] = t_res
+                    durations[t_id] = t_dur
+                    display_ids[t_id] = t_d_id
+                    log_paths[t_id] = t_l_path
+        dud2 = "pytest_plugin.BaseClass.base_method"
+        results.pop(dud2, None)
+        all_results = list(results.values())
+        num_passed = all_results.count("Passed")
+        num_failed = all_results.count("Failed")
+        num_untested = all_results.count("Untested")
+        num_skipped = (
+            len(all_results) - num_passed - num_failed - num_untested
+        )
+        counts = (num_passed, num_failed, num_skipped, num_untested)
+        return (results, durations, display_ids, log_paths, counts)
+
+    def __render_dashboard(self):
+        """Writes dashboard.html from the latest Dashboard results."""
+        log_dir = self.log_path
+        ft_id = self.__get_test_id()  # Full test id with path to log files
+        dud2 = "pytest_plugin.BaseClass.base_method"
+        results, durations, display_ids, log_paths, counts = (
+            self.__get_dashboard_data()
+        )
+        num_passed, num_failed, num_skipped, num_untested = counts
         self.create_pie_chart(title=constants.Dashboard.TITLE)
         self.add_data_point("Passed", num_passed, color="#84d474")
         self.add_data_point("Untested", num_untested, color="#eaeaea")
@@ -16473,25 +16845,25 @@ class BaseCase(unittest.TestCase):
         the_passed_hl = []  # Passed and has logs
         the_passed_nl = []  # Passed and no logs
         the_untested = []
-        if dud2 in sb_config._results.keys():
-            sb_config._results.pop(dud2)
-        for key in sb_config._results.keys():
-            t_res = sb_config._results[key]
-            t_dur = sb_config._duration[key]
-            t_d_id = sb_config._display_id[key]
-            t_l_path = sb_config._d_t_log_path[key]
+        if dud2 in results.keys():
+            results.pop(dud2)
+        for key in results.keys():
+            t_res = results[key]
+            t_dur = durations[key]
+            t_d_id = display_ids[key]
+            t_l_path = log_paths[key]
             res_low = t_res.lower()
-            if sb_config._results[key] == "Failed":
-                if not sb_config._d_t_log_path[key]:
-                    sb_config._d_t_log_path[key] = os.path.join(log_dir, ft_id)
+            if results[key] == "Failed":
+                if not log_paths[key]:
+                    log_paths[key] = os.path.join(log_dir, ft_id)
                 the_failed.append([res_low, t_res, t_d_id, t_dur, t_l_path])
-            elif sb_config._results[key] == "Skipped":
+            elif results[key] == "Skipped":
                 the_skipped.append([res_low, t_res, t_d_id, t_dur, t_l_path])
-            elif sb_config._results[key] == "Passed" and t_l_path:
+            elif results[key] == "Passed" and t_l_path:
                 the_passed_hl.append([res_low, t_res, t_d_id, t_dur, t_l_path])
-            elif sb_config._results[key] == "Passed" and not t_l_path:
+            elif results[key] == "Passed" and not t_l_path:
                 the_passed_nl.append([res_low, t_res, t_d_id, t_dur, t_l_path])
-            elif sb_config._results[key] == "Untested":
+            elif results[key] == "Untested":
                 the_untested.append([res_low, t_res, t_d_id, t_dur, t_l_path])
         for row in the_failed:
             row = (
@@ -16609,18 +16981,6 @@ class BaseCase(unittest.TestCase):
         out_file.writelines(the_html)
         out_file.close()
         sb_config._dash_html = the_html
-        if self._multithreaded:
-            d_stats = (num_passed, num_failed, num_skipped, num_untested)
-            _results = sb_config._results
-            _display_id = sb_config._display_id
-            _rt = sb_config._duration  # Run Time (RT)
-            _tlp = sb_config._d_t_log_path  # Test Log Path (TLP)
-            dash_json = json.dumps((_results, _display_id, _rt, _tlp, d_stats))
-            dash_json_loc = constants.Dashboard.DASH_JSON
-            dash_jsonpath = os.path.join(abs_path, dash_json_loc)
-            dash_json_file = open(dash_jsonpath, mode="w+", encoding="utf-8")
-            dash_json_file.writelines(dash_json)
-            dash_json_file.close()
 
     def __activate_behave_post_mortem_debug_mode(self):
         """Activate Post Mortem Debug Mode for failing tests that use Behave"""
@@ -17027,15 +17387,7 @@ class BaseCase(unittest.TestCase):
                                 self.__last_page_source,
                             )
                 if self.dashboard:
-                    if self._multithreaded:
-                        with self.dash_lock:
-                            with suppress(Exception):
-                                shared_utils.make_writable(
-                                    constants.Dashboard.LOCKFILE
-                                )
-                            self.__process_dashboard(has_exception)
-                    else:
-                        self.__process_dashboard(has_exception)
+                    self.__process_dashboard(has_exception)
                 if self._final_debug:
                     self.__activate_debug_mode_in_teardown()
                 # (Pytest) Finally close all open browser windows
@@ -112,7 +112,10 @@ class Dashboard:
     # LIVE_JS = "https://seleniumbase.io/cdn/js/live.js#html"
     LIVE_JS = "assets/live.js#html"  # Generated before tests
     LOCKFILE = Files.DOWNLOADS_FOLDER + "/dashboard.lock"
-    DASH_JSON = Files.DOWNLOADS_FOLDER + "/dashboard.json"
+    # Multithreaded runs: Each process appends results to its own file,
+    # and dashboard.html is rendered at most once every RENDER_DELAY secs.
+    DASH_RECORDS = Files.DOWNLOADS_FOLDER + "/dashboard_records"
+    RENDER_DELAY = 3
     DASH_PIE = Files.DOWNLOADS_FOLDER + "/dash_pie.json"
 
     def get_dash_pie_1():
@@ -167,6 +170,44 @@ class MultiBrowser:
     PYAUTOGUILOCK = Files.DOWNLOADS_FOLDER + "/pyautogui.lock"
 
 
+class VersionCache:
+    # Browser and driver versions, keyed by binary path + mtime + size.
+    # (Saved in the drivers folder so that the cache persists between runs.)
+    FILE_NAME = "version_cache.json"
+    LOCKFILE = "version_cache.lock"
+
+
+class RateLimits:
+    # Shared rate limiters save their state here. (In the temp folder)
+    FOLDER = "seleniumbase_rate_limits"
+
+
+class SelectorCache:
+    # Used when PERSIST_SELECTOR_CACHE is True. (Saved in the drivers folder)
+    FILE_NAME = "selector_cache.json"
+
+
+class LinkCheck:
+    # Used by assert_no_404_errors() when checking many links at once.
+    MAX_WORKERS = 16  # Threads checking links at the same time
+    MAX_PER_HOST = 6  # Simultaneous requests to the same host
+    CACHE_TTL = 300  # Seconds to remember the status code of a link
+    HEAD_FALLBACK_CODES = (404, 405, 501)  # Check again with GET
+
+
+class PageSource:
+    # Used when streaming page sources to failure logs.
+    CHUNK_SIZE = 1024 * 1024  # Characters read from the page at a time
+    JS_VAR = "__sbPageSource"  # (Holds the page source while reading it)
+
+
+class Assets:
+    # Used when injecting JS/CSS libraries (jQuery, Messenger, Tours, etc.)
+    STORAGE_FOLDER = "assets"  # (In the "seleniumbase/drivers" folder)
+    DOWNLOAD_TIMEOUT = 5  # Seconds
+    JS_VAR = "__sbAssets"  # (Keeps track of the assets injected on a page)
+
+
 class SavedCookies:
     STORAGE_FOLDER = "saved_cookies"
 
@@ -177,6 +218,10 @@ class Tours:
 
 class VisualBaseline:
     STORAGE_FOLDER = "visual_baseline"
+    # Used by check_window(pixel_diff=True)
+    PIXEL_TOLERANCE = 16  # Max difference (0-255) of a color channel
+    MAX_DIFF_PIXELS = 0  # Different pixels allowed before failing
+    TILE_SIZE = 64  # Pixels compared (and hashed) as a square tile
 
 
 class Values:
@@ -190,6 +235,26 @@ class Scroll:
     Y_OFFSET = 182
 
 
+class Conditions:
+    # For wait_for_all() and wait_for_any()
+    VALID = [
+        "present",
+        "visible",
+        "text",
+        "exact_text",
+        "attribute",
+        "absent",
+        "not_visible",
+    ]
+    VALID_BY = ["css selector", "xpath", "link text", "partial link text"]
+
+
+class EventWaits:
+    # The longest that a single in-page observer script may block for.
+    # Longer waits are split up so that the test time limit is checked.
+    MAX_SCRIPT_MS = 5000  # Milliseconds
+
+
 class Warnings:
     SCREENSHOT_SKIPPED = "Skipping screenshot!"
     SCREENSHOT_UNDEFINED = "Unable to get screenshot!"
@@ -1,5 +1,6 @@
 """Convert CSS selectors into XPath selectors"""
 from cssselect.xpath import GenericTranslator
+from seleniumbase.fixtures.selector_cache import cached_conversion
 
 
 class ConvertibleToCssTranslator(GenericTranslator):
@@ -47,6 +48,7 @@ class ConvertibleToCssTranslator(GenericTranslator):
         return left.join("//", right)
 
 
+@cached_conversion
 def convert_css_to_xpath(css):
     """Convert CSS Selectors to XPath Selectors.
     Example:
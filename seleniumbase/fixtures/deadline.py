@@ -0,0 +1,145 @@
+"""Monotonic deadlines for wait loops.
+A Deadline is created once per wait, and it combines the wait's timeout
+with the test time limit (--time-limit), so that checking it on each
+iteration is just a time.monotonic() call and a comparison.
+(time.monotonic() isn't affected by changes to the system clock.)
+* The test Deadline is created when a test starts. (start_test())
+* check_time_limit() raises TimeLimitExceededException if the test time
+  limit was reached. expired() is True once the wait's timeout was reached.
+* remaining() is the time left until the earlier of the two.
+* Waits that use @timed_wait record their time. get_wait_stats() returns
+  {name: {"calls", "seconds", "timeouts"}} for the current test."""
+import functools
+import math
+import time
+from seleniumbase import config as sb_config
+
+_wait_stats = {}  # name -> [calls, seconds, timeouts]
+
+
+class Deadline:
+    __slots__ = ("timeout", "start", "stop", "time_limit", "limit_stop")
+
+    def __init__(self, timeout=None, ignore_test_time_limit=False):
+        """
+        :param timeout: The seconds that the wait can take. (None: No limit)
+        :param ignore_test_time_limit: Don't include the test time limit.
+        """
+        self.timeout = timeout
+        self.start = time.monotonic()
+        self.stop = math.inf
+        if timeout is not None:
+            self.stop = self.start + timeout
+        self.time_limit = None
+        self.limit_stop = math.inf
+        if not ignore_test_time_limit:
+            test_deadline = get_test_deadline()
+            if test_deadline:
+                self.time_limit = test_deadline.timeout
+                self.limit_stop = test_deadline.stop
+
+    def check_time_limit(self):
+        """Raises TimeLimitExceededException if the test time limit
+        was reached."""
+        if time.monotonic() >= self.limit_stop:
+            raise_time_limit_exceeded(self.time_limit)
+
+    def expired(self):
+        """Returns True if the timeout of the wait was reached."""
+        return time.monotonic() >= self.stop
+
+    def remaining(self):
+        """Returns the seconds left before the timeout of the wait
+        or the test time limit is reached. (Whichever comes first)"""
+        return min(self.stop, self.limit_stop) - time.monotonic()
+
+    def elapsed(self):
+        """Returns the seconds since the Deadline was created."""
+        return time.monotonic() - self.start
+
+
+def start_test():
+    """Creates the test Deadline, and resets the wait stats.
+    (Called when a test starts, right after sb_config.start_time_ms is set)"""
+    _wait_stats.clear()
+    sb_config._test_deadline = None
+    get_test_deadline()
+
+
+def get_test_deadline():
+    """Returns the Deadline of the test time limit, or None if no
+    time limit applies to the current test. (Eg. In Recorder Mode)"""
+    time_limit = getattr(sb_config, "time_limit", None)
+    if not time_limit or getattr(sb_config, "recorder_mode", None):
+        return None
+    start_time_ms = getattr(sb_config, "start_time_ms", None)
+    test_deadline = getattr(sb_config, "_test_deadline", None)
+    if (
+        not test_deadline
+        or test_deadline.timeout != time_limit
+        or sb_config._test_deadline_start_ms != start_time_ms
+    ):
+        # The test started, or the time limit was changed. (set_time_limit)
+        test_deadline = Deadline(time_limit, ignore_test_time_limit=True)
+        if start_time_ms:
+            # (Time that passed since the test started counts too)
+            elapsed = max(time.time() - (start_time_ms / 1000.0), 0)
+            test_deadline.start -= elapsed
+            test_deadline.stop -= elapsed
+        sb_config._test_deadline = test_deadline
+        sb_config._test_deadline_start_ms = start_time_ms
+    return test_deadline
+
+
+def raise_time_limit_exceeded(time_limit):
+    from seleniumbase.common.exceptions import TimeLimitExceededException
+
+    display_time_limit = time_limit
+    plural = "s"
+    if float(int(time_limit)) == float(time_limit):
+        display_time_limit = int(time_limit)
+        if display_time_limit == 1:
+            plural = ""
+    message = (
+        "This test has exceeded the time limit of %s second%s!"
+        % (display_time_limit, plural)
+    )
+    raise TimeLimitExceededException("\n " + message)
+
+
+def timed_wait(func):
+    """Decorator that records the time spent in a wait method."""
+    stats = _wait_stats
+    name = func.__name__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = time.monotonic()
+        timed_out = True
+        try:
+            result = func(*args, **kwargs)
+            timed_out = False
+            return result
+        finally:
+            entry = stats.get(name)
+            if entry is None:
+                entry = stats[name] = [0, 0.0, 0]
+            entry[0] += 1
+            entry[1] += time.monotonic() - start
+            if timed_out:
+                entry[2] += 1
+
+    return wrapper
+
+
+def get_wait_stats():
+    """Returns {name: {"calls", "seconds", "timeouts"}} for each wait
+    since the current test started. ("timeouts" counts raised exceptions)"""
+    return {
+        name: {
+            "calls": calls,
+            "seconds": round(seconds, 4),
+            "timeouts": timeouts,
+        }
+        for name, (calls, seconds, timeouts) in _wait_stats.items()
+    }
@@ -10,6 +10,9 @@ from seleniumbase import config as sb_config
 from seleniumbase.config import settings
 from seleniumbase.fixtures import constants
 from seleniumbase.fixtures import css_to_xpath
+from seleniumbase.fixtures.deadline import Deadline
+from seleniumbase.fixtures.deadline import timed_wait
+from seleniumbase.fixtures.selector_cache import cached_conversion
 from seleniumbase.fixtures import shared_utils
 from seleniumbase.fixtures import xpath_to_css
 
@@ -20,6 +23,7 @@ def execute_script(driver, script, *args, **kwargs):
     return driver.execute_script(script, *args, **kwargs)
 
 
+@timed_wait
 def wait_for_ready_state_complete(driver, timeout=settings.LARGE_TIMEOUT):
     """The DOM (Document Object Model) has a property called "readyState".
     When the value of this becomes "complete", page resources are considered
@@ -33,11 +37,9 @@ def wait_for_ready_state_complete(driver, timeout=settings.LARGE_TIMEOUT):
         return
     if getattr(settings, "SKIP_JS_WAITS", None):
         return
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
+    deadline = Deadline(timeout)
     for x in range(int(timeout * 10)):
-        if sb_config.time_limit and not sb_config.recorder_mode:
-            shared_utils.check_if_time_limit_exceeded()
+        deadline.check_time_limit()
         try:
             ready_state = execute_script(driver, "return document.readyState;")
         except WebDriverException:
@@ -48,8 +50,7 @@ def wait_for_ready_state_complete(driver, timeout=settings.LARGE_TIMEOUT):
             time.sleep(0.002)
             return True
         else:
-            now_ms = time.time() * 1000.0
-            if now_ms >= stop_ms:
+            if deadline.expired():
                 break
             time.sleep(0.1)
     return False  # readyState stayed "interactive" (Not "complete")
@@ -105,6 +106,7 @@ def wait_for_angularjs(driver, timeout=settings.LARGE_TIMEOUT, **kwargs):
         execute_async_script(driver, script, timeout=timeout)
 
 
+@cached_conversion
 def convert_to_css_selector(selector, by=By.CSS_SELECTOR):
     if by == By.CSS_SELECTOR:
         return selector
@@ -205,6 +207,11 @@ def activate_jquery(driver):
         return
     # jQuery is not defined. It will be loaded in the next part.
     jquery_js = constants.JQuery.MIN_JS
+    if inject_assets(driver, [jquery_js]):
+        with suppress(Exception):
+            # An inline script has already run. (No need to wait.)
+            execute_script(driver, "jQuery('html');")
+            return
     add_js_link(driver, jquery_js)
     for x in range(36):
         # jQuery needs a small amount of time to activate.
@@ -748,6 +755,24 @@ def add_js_code(driver, js_code):
     execute_script(driver, add_js_code_script % js_code)
 
 
+def inject_assets(driver, asset_links):
+    """Injects JS/CSS libraries inline (by content) with one script.
+    (Uses local copies. See seleniumbase/core/asset_store.py)
+    Assets that were already injected on the page are skipped.
+    Returns False (and injects nothing) if an asset isn't available,
+    in which case the caller can use add_js_link() / add_css_link()."""
+    from seleniumbase.core import asset_store
+
+    script = asset_store.get_inject_script(asset_links)
+    if not script:
+        return False
+    try:
+        execute_script(driver, script)
+        return True
+    except Exception:
+        return False
+
+
 def add_meta_tag(driver, http_equiv=None, content=None):
     if http_equiv is None:
         http_equiv = "Content-Security-Policy"
@@ -783,8 +808,13 @@ def activate_jquery_confirm(driver):
     jq_confirm_js = constants.JqueryConfirm.MIN_JS
 
     if not is_jquery_activated(driver):
-        add_js_link(driver, jquery_js)
-        wait_for_jquery_active(driver, timeout=1.2)
+        if not inject_assets(driver, [jquery_js]):
+            add_js_link(driver, jquery_js)
+            wait_for_jquery_active(driver, timeout=1.2)
+    if inject_assets(driver, [jq_confirm_css, jq_confirm_js]):
+        with suppress(Exception):
+            execute_script(driver, "jconfirm;")
+            return
     add_css_link(driver, jq_confirm_css)
     add_js_link(driver, jq_confirm_js)
 
@@ -809,10 +839,15 @@ def activate_html_inspector(driver):
     if is_html_inspector_activated(driver):
         return
     if not is_jquery_activated(driver):
-        add_js_link(driver, jquery_js)
-        wait_for_jquery_active(driver, timeout=1.2)
-        wait_for_ready_state_complete(driver)
-        wait_for_angularjs(driver)
+        if not inject_assets(driver, [jquery_js]):
+            add_js_link(driver, jquery_js)
+            wait_for_jquery_active(driver, timeout=1.2)
+            wait_for_ready_state_complete(driver)
+            wait_for_angularjs(driver)
+    if inject_assets(driver, [html_inspector_js]):
+        with suppress(Exception):
+            execute_script(driver, "HTMLInspector;")
+            return
     add_js_link(driver, html_inspector_js)
     wait_for_ready_state_complete(driver)
     wait_for_angularjs(driver)
@@ -854,8 +889,29 @@ def activate_messenger(driver):
     )
 
     if not is_jquery_activated(driver):
-        add_js_link(driver, jquery_js)
-        wait_for_jquery_active(driver, timeout=1.1)
+        if not inject_assets(driver, [jquery_js]):
+            add_js_link(driver, jquery_js)
+            wait_for_jquery_active(driver, timeout=1.1)
+    if inject_assets(
+        driver,
+        [
+            messenger_css,
+            msgr_theme_flat_css,
+            msgr_theme_future_css,
+            msgr_theme_block_css,
+            msgr_theme_air_css,
+            msgr_theme_ice_css,
+            underscore_js,
+            spinner_css,
+            messenger_js,
+            msgr_theme_flat_js,
+            msgr_theme_future_js,
+        ],
+    ):
+        with suppress(Exception):
+            add_css_style(driver, get_messenger_style())
+            execute_script(driver, msg_style)  # Fails if no Messenger
+            return
     add_css_link(driver, messenger_css)
     add_css_link(driver, msgr_theme_flat_css)
     add_css_link(driver, msgr_theme_future_css)
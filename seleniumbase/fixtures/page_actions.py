@@ -34,6 +34,8 @@ from seleniumbase.common.exceptions import LinkTextNotFoundException
 from seleniumbase.common.exceptions import TextNotVisibleException
 from seleniumbase.config import settings
 from seleniumbase.fixtures import constants
+from seleniumbase.fixtures.deadline import Deadline
+from seleniumbase.fixtures.deadline import timed_wait
 from seleniumbase.fixtures import page_utils
 from seleniumbase.fixtures import shared_utils
 
@@ -270,6 +272,7 @@ def timeout_exception(exception, message):
     raise exc(msg)
 
 
+@timed_wait
 def hover_and_click(
     driver,
     hover_selector,
@@ -292,8 +295,7 @@ def hover_and_click(
     js_click - the option to use js_click() instead of click() on the last part
     """
     _reconnect_if_disconnected(driver)
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
+    deadline = Deadline(timeout, ignore_test_time_limit=True)
     element = driver.find_element(by=hover_by, value=hover_selector)
     hover = ActionChains(driver).move_to_element(element)
     for x in range(int(timeout * 10)):
@@ -306,8 +308,7 @@ def hover_and_click(
                 element.click()
             return element
         except Exception:
-            now_ms = time.time() * 1000.0
-            if now_ms >= stop_ms:
+            if deadline.expired():
                 break
             time.sleep(0.1)
     plural = "s"
@@ -321,6 +322,7 @@ def hover_and_click(
     timeout_exception(NoSuchElementException, message)
 
 
+@timed_wait
 def hover_element_and_click(
     driver,
     element,
@@ -332,8 +334,7 @@ def hover_element_and_click(
     Similar to hover_and_click(), but assumes top element is already found.
     """
     _reconnect_if_disconnected(driver)
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
+    deadline = Deadline(timeout, ignore_test_time_limit=True)
     hover = ActionChains(driver).move_to_element(element)
     for x in range(int(timeout * 10)):
         try:
@@ -342,8 +343,7 @@ def hover_element_and_click(
             element.click()
             return element
         except Exception:
-            now_ms = time.time() * 1000.0
-            if now_ms >= stop_ms:
+            if deadline.expired():
                 break
             time.sleep(0.1)
     plural = "s"
@@ -357,6 +357,7 @@ def hover_element_and_click(
     timeout_exception(NoSuchElementException, message)
 
 
+@timed_wait
 def hover_element_and_double_click(
     driver,
     element,
@@ -365,8 +366,7 @@ def hover_element_and_double_click(
     timeout=settings.SMALL_TIMEOUT,
 ):
     _reconnect_if_disconnected(driver)
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
+    deadline = Deadline(timeout, ignore_test_time_limit=True)
     hover = ActionChains(driver).move_to_element(element)
     for x in range(int(timeout * 10)):
         try:
@@ -378,8 +378,7 @@ def hover_element_and_double_click(
             actions.perform()
             return element_2
         except Exception:
-            now_ms = time.time() * 1000.0
-            if now_ms >= stop_ms:
+            if deadline.expired():
                 break
             time.sleep(0.1)
     plural = "s"
@@ -393,6 +392,7 @@ def hover_element_and_double_click(
     timeout_exception(NoSuchElementException, message)
 
 
+@timed_wait
 def wait_for_element_present(
     driver,
     selector,
@@ -418,18 +418,23 @@ def wait_for_element_present(
     """
     _reconnect_if_disconnected(driver)
     element = None
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
+    deadline = Deadline(timeout, ignore_test_time_limit)
     for x in range(int(timeout * 10)):
-        if not ignore_test_time_limit:
-            shared_utils.check_if_time_limit_exceeded()
+        deadline.check_time_limit()
         try:
             element = driver.find_element(by=by, value=selector)
             return element
         except Exception:
-            now_ms = time.time() * 1000.0
-            if now_ms >= stop_ms:
+            if deadline.expired():
                 break
+            if x == 0 and __wait_for_dom_condition(
+                driver,
+                selector,
+                by,
+                deadline,
+                "present",
+            ):
+                continue
             time.sleep(0.1)
     plural = "s"
     if timeout == 1:
@@ -451,6 +456,7 @@ def wait_for_element_present(
         return element
 
 
+@timed_wait
 def wait_for_element_visible(
     driver,
     selector,
@@ -479,11 +485,9 @@ def wait_for_element_visible(
     _reconnect_if_disconnected(driver)
     element = None
     is_present = False
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
+    deadline = Deadline(timeout, ignore_test_time_limit)
     for x in range(int(timeout * 10)):
-        if not ignore_test_time_limit:
-            shared_utils.check_if_time_limit_exceeded()
+        deadline.check_time_limit()
         try:
             element = driver.find_element(by=by, value=selector)
             is_present = True
@@ -493,9 +497,16 @@ def wait_for_element_visible(
                 element = None
                 raise Exception()
         except Exception:
-            now_ms = time.time() * 1000.0
-            if now_ms >= stop_ms:
+            if deadline.expired():
                 break
+            if x == 0 and __wait_for_dom_condition(
+                driver,
+                selector,
+                by,
+                deadline,
+                "visible",
+            ):
+                continue
             time.sleep(0.1)
     plural = "s"
     if timeout == 1:
@@ -533,6 +544,7 @@ def wait_for_element_visible(
         return element
 
 
+@timed_wait
 def wait_for_text_visible(
     driver,
     text,
@@ -563,10 +575,9 @@ def wait_for_text_visible(
     is_present = False
     full_text = None
     text = str(text)
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
+    deadline = Deadline(timeout)
     for x in range(int(timeout * 10)):
-        shared_utils.check_if_time_limit_exceeded()
+        deadline.check_time_limit()
         full_text = None
         try:
             element = driver.find_element(by=by, value=selector)
@@ -609,9 +620,17 @@ def wait_for_text_visible(
                     element = None
                     raise Exception()
         except Exception:
-            now_ms = time.time() * 1000.0
-            if now_ms >= stop_ms:
+            if deadline.expired():
                 break
+            if x == 0 and __wait_for_dom_condition(
+                driver,
+                selector,
+                by,
+                deadline,
+                "text",
+                text=text,
+            ):
+                continue
             time.sleep(0.1)
     plural = "s"
     if timeout == 1:
@@ -644,6 +663,7 @@ def wait_for_text_visible(
         return element
 
 
+@timed_wait
 def wait_for_exact_text_visible(
     driver,
     text,
@@ -674,10 +694,9 @@ def wait_for_exact_text_visible(
     is_present = False
     actual_text = None
     text = str(text)
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
+    deadline = Deadline(timeout)
     for x in range(int(timeout * 10)):
-        shared_utils.check_if_time_limit_exceeded()
+        deadline.check_time_limit()
         actual_text = None
         try:
             element = driver.find_element(by=by, value=selector)
@@ -719,9 +738,17 @@ def wait_for_exact_text_visible(
                     element = None
                     raise Exception()
         except Exception:
-            now_ms = time.time() * 1000.0
-            if now_ms >= stop_ms:
+            if deadline.expired():
                 break
+            if x == 0 and __wait_for_dom_condition(
+                driver,
+                selector,
+                by,
+                deadline,
+                "exact_text",
+                text=text,
+            ):
+                continue
             time.sleep(0.1)
     plural = "s"
     if timeout == 1:
@@ -754,6 +781,7 @@ def wait_for_exact_text_visible(
         return element
 
 
+@timed_wait
 def wait_for_any_of_elements_visible(
     driver,
     selectors,
@@ -784,11 +812,9 @@ def wait_for_any_of_elements_visible(
     _reconnect_if_disconnected(driver)
     element = None
     any_present = False
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
+    deadline = Deadline(timeout, ignore_test_time_limit)
     for x in range(int(timeout * 10)):
-        if not ignore_test_time_limit:
-            shared_utils.check_if_time_limit_exceeded()
+        deadline.check_time_limit()
         try:
             for selector in selectors:
                 by = "css selector"
@@ -804,8 +830,7 @@ def wait_for_any_of_elements_visible(
                     pass
             raise Exception("Nothing found yet!")
         except Exception:
-            now_ms = time.time() * 1000.0
-            if now_ms >= stop_ms:
+            if deadline.expired():
                 break
             time.sleep(0.1)
     plural = "s"
@@ -835,6 +860,7 @@ def wait_for_any_of_elements_visible(
         return element
 
 
+@timed_wait
 def wait_for_any_of_elements_present(
     driver,
     selectors,
@@ -863,11 +889,9 @@ def wait_for_any_of_elements_present(
         raise Exception("`selectors` cannot be an empty list!")
     _reconnect_if_disconnected(driver)
     element = None
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
+    deadline = Deadline(timeout, ignore_test_time_limit)
     for x in range(int(timeout * 10)):
-        if not ignore_test_time_limit:
-            shared_utils.check_if_time_limit_exceeded()
+        deadline.check_time_limit()
         try:
             for selector in selectors:
                 by = "css selector"
@@ -880,8 +904,7 @@ def wait_for_any_of_elements_present(
                     pass
             raise Exception("Nothing found yet!")
         except Exception:
-            now_ms = time.time() * 1000.0
-            if now_ms >= stop_ms:
+            if deadline.expired():
                 break
             time.sleep(0.1)
     plural = "s"
@@ -903,6 +926,147 @@ def wait_for_any_of_elements_present(
         return element
 
 
+def __describe_unmet_condition(condition, status):
+    """Returns an (exception, description) tuple for an unmet condition."""
+    kind, selector, by, text_or_attr, value = condition
+    if status == 0:
+        return (
+            NoSuchElementException,
+            "Element {%s} was not present" % selector,
+        )
+    elif kind == "visible":
+        return (
+            ElementNotVisibleException,
+            "Element {%s} was not visible" % selector,
+        )
+    elif kind == "text":
+        return (
+            TextNotVisibleException,
+            "Expected text substring {%s} for {%s} was not visible"
+            % (text_or_attr, selector),
+        )
+    elif kind == "exact_text":
+        return (
+            TextNotVisibleException,
+            "Expected exact text {%s} for {%s} was not visible"
+            % (text_or_attr, selector),
+        )
+    elif kind == "attribute" and value is None:
+        return (
+            NoSuchAttributeException,
+            "Expected attribute {%s} of element {%s} was not present"
+            % (text_or_attr, selector),
+        )
+    elif kind == "attribute":
+        return (
+            NoSuchAttributeException,
+            "Expected value {%s} for attribute {%s} of element {%s} "
+            "was not present" % (value, text_or_attr, selector),
+        )
+    elif kind == "absent":
+        return (Exception, "Element {%s} was still present" % selector)
+    elif kind == "not_visible":
+        return (Exception, "Element {%s} was still visible" % selector)
+    return (Exception, "Condition {%s} was not met" % str(condition))
+
+
+@timed_wait
+def wait_for_conditions(
+    driver,
+    conditions,
+    match_all=True,
+    timeout=settings.LARGE_TIMEOUT,
+    ignore_test_time_limit=False,
+):
+    """
+    Waits for all (or any) of the given conditions to be met.
+    All the conditions are checked together in one JavaScript call,
+    so waiting on N conditions costs one round trip instead of N.
+    Each condition is a tuple of:
+        (condition, selector, by, text_or_attribute, value)
+    Valid conditions: "present", "visible", "text", "exact_text",
+                      "attribute", "absent", and "not_visible".
+    Valid "by" options: "css selector", "xpath",
+                        "link text", and "partial link text".
+    Raises an exception if the conditions were not met by the timeout.
+    @Params
+    driver - the webdriver object (required)
+    conditions - the list of condition tuples (required)
+    match_all - if True, all must be met. If False, any one can be met.
+    timeout - the time to wait for the conditions in seconds
+    ignore_test_time_limit - ignore test time limit (NOT related to timeout)
+    @Returns
+    A list of booleans (one per condition) showing which ones were met
+    """
+    import json
+    from seleniumbase.js_code.conditions_js import check_conditions
+
+    if not isinstance(conditions, (list, tuple)):
+        raise Exception("`conditions` must be a list or tuple!")
+    if not conditions:
+        raise Exception("`conditions` cannot be an empty list!")
+    conditions = [tuple(condition) for condition in conditions]
+    for condition in conditions:
+        if (
+            len(condition) != 5
+            or condition[0] not in constants.Conditions.VALID
+            or condition[2] not in constants.Conditions.VALID_BY
+        ):
+            raise Exception('Invalid condition: "%s"' % str(condition))
+    script = "var sbCheck = %s;\nreturn sbCheck(%s);" % (
+        check_conditions, json.dumps(conditions)
+    )
+    _reconnect_if_disconnected(driver)
+    statuses = []
+    deadline = Deadline(timeout, ignore_test_time_limit)
+    for x in range(int(timeout * 10)):
+        deadline.check_time_limit()
+        try:
+            if __is_cdp_swap_needed(driver):
+                statuses = driver.cdp.evaluate(script)
+            else:
+                statuses = driver.execute_script(script)
+        except Exception:
+            statuses = []
+        if statuses and len(statuses) == len(conditions):
+            met = [status == 2 for status in statuses]
+            if (match_all and all(met)) or (not match_all and any(met)):
+                return met
+        if deadline.expired():
+            break
+        time.sleep(0.1)
+    plural = "s"
+    if timeout == 1:
+        plural = ""
+    if not statuses or len(statuses) != len(conditions):
+        statuses = [None] * len(conditions)
+    exception = None
+    descriptions = []
+    for condition, status in zip(conditions, statuses):
+        if status == 2:
+            continue
+        exc, description = __describe_unmet_condition(condition, status)
+        if not exception:
+            exception = exc
+        descriptions.append(" - %s" % description)
+    if match_all:
+        message = "%s of %s conditions were not met after %s second%s!" % (
+            len(descriptions),
+            len(conditions),
+            timeout,
+            plural,
+        )
+    else:
+        message = "None of the %s conditions were met after %s second%s!" % (
+            len(conditions),
+            timeout,
+            plural,
+        )
+    message = message + "\n" + "\n".join(descriptions)
+    timeout_exception(exception, message)
+
+
+@timed_wait
 def wait_for_attribute(
     driver,
     selector,
@@ -934,10 +1098,9 @@ def wait_for_attribute(
     element_present = False
     attribute_present = False
     found_value = None
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
+    deadline = Deadline(timeout)
     for x in range(int(timeout * 10)):
-        shared_utils.check_if_time_limit_exceeded()
+        deadline.check_time_limit()
         try:
             element = driver.find_element(by=by, value=selector)
             element_present = True
@@ -958,8 +1121,7 @@ def wait_for_attribute(
             else:
                 return element
         except Exception:
-            now_ms = time.time() * 1000.0
-            if now_ms >= stop_ms:
+            if deadline.expired():
                 break
             time.sleep(0.1)
     plural = "s"
@@ -992,6 +1154,7 @@ def wait_for_attribute(
         return element
 
 
+@timed_wait
 def wait_for_element_clickable(
     driver,
     selector,
@@ -1020,10 +1183,9 @@ def wait_for_element_clickable(
     element = None
     is_present = False
     is_visible = False
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
+    deadline = Deadline(timeout)
     for x in range(int(timeout * 10)):
-        shared_utils.check_if_time_limit_exceeded()
+        deadline.check_time_limit()
         try:
             element = driver.find_element(by=by, value=selector)
             is_present = True
@@ -1038,9 +1200,16 @@ def wait_for_element_clickable(
                 element = None
                 raise Exception()
         except Exception:
-            now_ms = time.time() * 1000.0
-            if now_ms >= stop_ms:
+            if deadline.expired():
                 break
+            if x == 0 and __wait_for_dom_condition(
+                driver,
+                selector,
+                by,
+                deadline,
+                "visible",
+            ):
+                continue
             time.sleep(0.1)
     plural = "s"
     if timeout == 1:
@@ -1093,6 +1262,7 @@ def wait_for_element_clickable(
         return element
 
 
+@timed_wait
 def wait_for_element_absent(
     driver,
     selector,
@@ -1120,14 +1290,12 @@ def wait_for_element_absent(
         driver.cdp.wait_for_element_absent(selector)
         return True
     _reconnect_if_disconnected(driver)
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
+    deadline = Deadline(timeout)
     for x in range(int(timeout * 10)):
-        shared_utils.check_if_time_limit_exceeded()
+        deadline.check_time_limit()
         try:
             driver.find_element(by=by, value=selector)
-            now_ms = time.time() * 1000.0
-            if now_ms >= stop_ms:
+            if deadline.expired():
                 break
             time.sleep(0.1)
         except Exception:
@@ -1149,6 +1317,7 @@ def wait_for_element_absent(
     timeout_exception(Exception, message)
 
 
+@timed_wait
 def wait_for_element_not_visible(
     driver,
     selector,
@@ -1176,15 +1345,13 @@ def wait_for_element_not_visible(
         driver.cdp.wait_for_element_not_visible(selector)
         return True
     _reconnect_if_disconnected(driver)
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
+    deadline = Deadline(timeout)
     for x in range(int(timeout * 10)):
-        shared_utils.check_if_time_limit_exceeded()
+        deadline.check_time_limit()
         try:
             element = driver.find_element(by=by, value=selector)
             if element.is_displayed():
-                now_ms = time.time() * 1000.0
-                if now_ms >= stop_ms:
+                if deadline.expired():
                     break
                 time.sleep(0.1)
             else:
@@ -1208,6 +1375,7 @@ def wait_for_element_not_visible(
     timeout_exception(Exception, message)
 
 
+@timed_wait
 def wait_for_text_not_visible(
     driver,
     text,
@@ -1230,14 +1398,12 @@ def wait_for_text_not_visible(
     """
     _reconnect_if_disconnected(driver)
     text = str(text)
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
+    deadline = Deadline(timeout)
     for x in range(int(timeout * 10)):
-        shared_utils.check_if_time_limit_exceeded()
+        deadline.check_time_limit()
         if not is_text_visible(driver, text, selector, by=by):
             return True
-        now_ms = time.time() * 1000.0
-        if now_ms >= stop_ms:
+        if deadline.expired():
             break
         time.sleep(0.1)
     plural = "s"
@@ -1252,6 +1418,7 @@ def wait_for_text_not_visible(
     timeout_exception(Exception, message)
 
 
+@timed_wait
 def wait_for_exact_text_not_visible(
     driver,
     text,
@@ -1274,14 +1441,12 @@ def wait_for_exact_text_not_visible(
     """
     _reconnect_if_disconnected(driver)
     text = str(text)
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
+    deadline = Deadline(timeout)
     for x in range(int(timeout * 10)):
-        shared_utils.check_if_time_limit_exceeded()
+        deadline.check_time_limit()
         if not is_exact_text_visible(driver, text, selector, by=by):
             return True
-        now_ms = time.time() * 1000.0
-        if now_ms >= stop_ms:
+        if deadline.expired():
             break
         time.sleep(0.1)
     plural = "s"
@@ -1298,6 +1463,7 @@ def wait_for_exact_text_not_visible(
     timeout_exception(Exception, message)
 
 
+@timed_wait
 def wait_for_non_empty_text_visible(
     driver, selector, by="css selector", timeout=settings.LARGE_TIMEOUT,
 ):
@@ -1316,12 +1482,11 @@ def wait_for_non_empty_text_visible(
     The web element object that has text
     """
     _reconnect_if_disconnected(driver)
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
+    deadline = Deadline(timeout)
     element = None
     visible = None
     for x in range(int(timeout * 10)):
-        shared_utils.check_if_time_limit_exceeded()
+        deadline.check_time_limit()
         try:
             element = None
             visible = False
@@ -1341,8 +1506,7 @@ def wait_for_non_empty_text_visible(
                 return element
         except Exception:
             element = None
-        now_ms = time.time() * 1000.0
-        if now_ms >= stop_ms:
+        if deadline.expired():
             break
         time.sleep(0.1)
     plural = "s"
@@ -1373,6 +1537,7 @@ def wait_for_non_empty_text_visible(
         timeout_exception(TextNotVisibleException, message)
 
 
+@timed_wait
 def wait_for_attribute_not_present(
     driver,
     selector,
@@ -1394,16 +1559,14 @@ def wait_for_attribute_not_present(
     by - the type of selector being used (Default: "css selector")
     timeout - the time to wait for the element attribute in seconds
     """
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
+    deadline = Deadline(timeout)
     for x in range(int(timeout * 10)):
-        shared_utils.check_if_time_limit_exceeded()
+        deadline.check_time_limit()
         if not is_attribute_present(
             driver, selector, attribute, value=value, by=by
         ):
             return True
-        now_ms = time.time() * 1000.0
-        if now_ms >= stop_ms:
+        if deadline.expired():
             break
         time.sleep(0.1)
     plural = "s"
@@ -1563,6 +1726,7 @@ def wait_for_and_dismiss_alert(driver, timeout=settings.LARGE_TIMEOUT):
     return alert_text
 
 
+@timed_wait
 def wait_for_and_switch_to_alert(driver, timeout=settings.LARGE_TIMEOUT):
     """
     Wait for a browser alert to appear, and switch to it. This should be usable
@@ -1573,24 +1737,23 @@ def wait_for_and_switch_to_alert(driver, timeout=settings.LARGE_TIMEOUT):
     timeout - the time to wait for the alert in seconds
     """
     _reconnect_if_disconnected(driver)
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
+    deadline = Deadline(timeout)
     for x in range(int(timeout * 10)):
-        shared_utils.check_if_time_limit_exceeded()
+        deadline.check_time_limit()
         try:
             alert = driver.switch_to.alert
             # Raises exception if no alert present
             dummy_variable = alert.text  # noqa
             return alert
         except NoAlertPresentException:
-            now_ms = time.time() * 1000.0
-            if now_ms >= stop_ms:
+            if deadline.expired():
                 break
             time.sleep(0.1)
     message = "Alert was not present after %s seconds!" % timeout
     timeout_exception(Exception, message)
 
 
+@timed_wait
 def switch_to_frame(
     driver, frame, timeout=settings.SMALL_TIMEOUT, invisible=False
 ):
@@ -1604,10 +1767,9 @@ def switch_to_frame(
     invisible - if True, the iframe can be invisible
     """
     _reconnect_if_disconnected(driver)
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
+    deadline = Deadline(timeout)
     for x in range(int(timeout * 10)):
-        shared_utils.check_if_time_limit_exceeded()
+        deadline.check_time_limit()
         try:
             driver.switch_to.frame(frame)
             return True
@@ -1626,8 +1788,7 @@ def switch_to_frame(
                         element = driver.find_element(by=by, value=frame)
                         driver.switch_to.frame(element)
                         return True
-            now_ms = time.time() * 1000.0
-            if now_ms >= stop_ms:
+            if deadline.expired():
                 break
             time.sleep(0.1)
     plural = "s"
@@ -1655,6 +1816,7 @@ def __switch_to_window(driver, window_handle, uc_lock=True):
     return True
 
 
+@timed_wait
 def switch_to_window(
     driver,
     window,
@@ -1673,8 +1835,7 @@ def switch_to_window(
     _reconnect_if_disconnected(driver)
     if window == -1:
         window = len(driver.window_handles) - 1
-    start_ms = time.time() * 1000.0
-    stop_ms = start_ms + (timeout * 1000.0)
+    deadline = Deadline(timeout)
     if isinstance(window, int):
         if shared_utils.is_safari(driver):
             # Reversed window_handles on Safari
@@ -1682,14 +1843,13 @@ def switch_to_window(
             if window < 0:
                 window = 0
         for x in range(int(timeout * 10)):
-            shared_utils.check_if_time_limit_exceeded()
+            deadline.check_time_limit()
             try:
                 window_handle = driver.window_handles[window]
                 __switch_to_window(driver, window_handle, uc_lock=uc_lock)
                 return True
             except IndexError:
-                now_ms = time.time() * 1000.0
-                if now_ms >= stop_ms:
+                if deadline.expired():
                     break
                 time.sleep(0.1)
         plural = "s"
@@ -1704,13 +1864,12 @@ def switch_to_window(
     else:
         window_handle = window
         for x in range(int(timeout * 10)):
-            shared_utils.check_if_time_limit_exceeded()
+            deadline.check_time_limit()
             try:
                 __switch_to_window(driver, window_handle, uc_lock=uc_lock)
                 return True
             except NoSuchWindowException:
-                now_ms = time.time() * 1000.0
-                if now_ms >= stop_ms:
+                if deadline.expired():
                     break
                 time.sleep(0.1)
         plural = "s"
@@ -1724,6 +1883,70 @@ def switch_to_window(
         timeout_exception(Exception, message)
 
 
+############
+
+# Event-driven waits (settings.EVENT_DRIVEN_WAITS)
+
+def __wait_for_dom_condition(
+    driver,
+    selector,
+    by,
+    deadline,
+    condition,
+    text=None,
+):
+    """Blocks until the condition is probably met in the page,
+    or until the deadline is reached, without polling over WebDriver.
+    An in-page MutationObserver resolves the async script the moment
+    the condition becomes true. The caller re-verifies the result with
+    its regular WebDriver checks, so this only replaces the sleeps.
+    Returns True if the page reported the condition as met.
+    Returns False on timeout or if script injection isn't possible,
+    in which case the caller falls back to its polling loop."""
+    from seleniumbase.js_code.observer_js import wait_for_condition
+
+    if (
+        not getattr(settings, "EVENT_DRIVEN_WAITS", None)
+        or by not in ("css selector", "xpath")
+        or not hasattr(driver, "execute_async_script")
+        or __is_cdp_swap_needed(driver)
+    ):
+        return False
+    max_chunk_ms = constants.EventWaits.MAX_SCRIPT_MS
+    try:
+        if shared_utils.is_safari(driver):
+            return False
+        script_timeout = driver.timeouts.script
+        driver.set_script_timeout((max_chunk_ms / 1000.0) + 1)
+    except Exception:
+        return False
+    try:
+        while True:
+            deadline.check_time_limit()  # (Raises if the time limit is hit)
+            chunk_ms = min(deadline.remaining() * 1000.0, max_chunk_ms)
+            if chunk_ms <= 0:
+                return False
+            try:
+                result = driver.execute_async_script(
+                    wait_for_condition,
+                    selector,
+                    by,
+                    condition,
+                    text,
+                    int(chunk_ms),
+                )
+            except Exception:
+                return False
+            if result:
+                return True
+            elif result is None:
+                return False
+    finally:
+        # Restore the async script timeout. (For the user's own scripts)
+        with suppress(Exception):
+            driver.set_script_timeout(script_timeout)
+
+
 ############
 
 # Special methods for use with UC Mode
@@ -6,6 +6,7 @@ import requests
 from selenium.webdriver.common.by import By
 from seleniumbase.fixtures import constants
 from seleniumbase.fixtures import css_to_xpath
+from seleniumbase.fixtures.selector_cache import cached_conversion
 
 
 def get_domain_url(url):
@@ -60,6 +61,7 @@ def is_name_selector(selector):
     return selector.startswith(("name=", "&"))
 
 
+@cached_conversion
 def recalculate_selector(selector, by, xp_ok=True):
     """Use autodetection to return the correct selector with "by" updated.
     If "xp_ok" is False, don't call convert_css_to_xpath(), which is
@@ -0,0 +1,142 @@
+"""A bounded LRU cache for selector conversions.
+Used by page_utils.recalculate_selector(), css_to_xpath.convert_css_to_xpath(),
+xpath_to_css.convert_xpath_to_css(), and js_utils.convert_to_css_selector().
+The same selectors get converted again and again during a test run,
+and a conversion only depends on its arguments, so it's only done once.
+* Results are keyed by function name + arguments. The least recently used
+  results are dropped after settings.SELECTOR_CACHE_SIZE entries.
+* Conversions that raise an exception aren't cached.
+* get_stats() returns the hits/misses of each function. (For profiling)
+* If settings.PERSIST_SELECTOR_CACHE is True, the cache is saved in the
+  drivers folder at exit, and loaded again on first use.
+  (Saved caches are only used with the same version of SeleniumBase.)"""
+import atexit
+import functools
+import json
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from contextlib import suppress
+from seleniumbase.config import settings
+from seleniumbase.fixtures import constants
+
+_cache = OrderedDict()  # (name, args, kwargs) -> result
+_stats = {}  # name -> [hits, misses]
+_lock = threading.Lock()
+_persistence = {"loaded": False, "changed": False}
+
+
+def get_cache_path():
+    from seleniumbase import drivers
+
+    driver_dir = os.path.dirname(os.path.realpath(drivers.__file__))
+    return os.path.join(driver_dir, constants.SelectorCache.FILE_NAME)
+
+
+def __get_version():
+    from seleniumbase.__version__ import __version__
+
+    return __version__
+
+
+def __load():
+    """Loads the saved cache (once) if PERSIST_SELECTOR_CACHE is True."""
+    _persistence["loaded"] = True
+    if not settings.PERSIST_SELECTOR_CACHE:
+        return
+    atexit.register(save)
+    with suppress(Exception):
+        with open(get_cache_path(), mode="r", encoding="utf-8") as f:
+            data = json.load(f)
+        if data["version"] != __get_version():
+            return
+        for name, args, kwargs, result in data["entries"]:
+            if isinstance(result, list):
+                result = tuple(result)
+            key = (name, tuple(args), tuple(tuple(kw) for kw in kwargs))
+            _cache.setdefault(key, result)
+
+
+def save():
+    """Saves the cache in the drivers folder. (If anything was added)"""
+    with _lock:
+        if not _persistence["changed"]:
+            return
+        entries = [
+            [name, list(args), [list(kw) for kw in kwargs], result]
+            for (name, args, kwargs), result in _cache.items()
+        ]
+        _persistence["changed"] = False
+    with suppress(Exception):
+        # The cache is optional (Eg. The drivers folder is read-only)
+        cache_path = get_cache_path()
+        temp_path = "%s.%s.tmp" % (cache_path, uuid.uuid4().hex[:8])
+        with open(temp_path, mode="w", encoding="utf-8") as f:
+            json.dump(
+                {"version": __get_version(), "entries": entries},
+                f,
+                ensure_ascii=False,
+            )
+        os.replace(temp_path, cache_path)
+
+
+def cached_conversion(func):
+    """Decorator for caching the results of a selector conversion."""
+    name = func.__name__
+    stats = _stats.setdefault(name, [0, 0])
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = (name, args, tuple(kwargs.items()) if kwargs else ())
+        # Cache hits don't take the lock. (If another thread removes the
+        # result in the meantime, it's a KeyError, which is a cache miss.)
+        try:
+            result = _cache[key]
+            _cache.move_to_end(key)
+            stats[0] += 1
+            return result
+        except KeyError:
+            pass
+        except TypeError:
+            return func(*args, **kwargs)  # (Unhashable arguments)
+        if not _persistence["loaded"]:
+            with _lock:
+                if not _persistence["loaded"]:
+                    __load()
+            if key in _cache:
+                return wrapper(*args, **kwargs)
+        result = func(*args, **kwargs)
+        with _lock:
+            stats[1] += 1
+            _cache[key] = result
+            _persistence["changed"] = True
+            while len(_cache) > max(settings.SELECTOR_CACHE_SIZE, 1):
+                _cache.popitem(last=False)
+        return result
+
+    return wrapper
+
+
+def get_stats():
+    """Returns {name: {"hits", "misses", "hit_rate"}} for each function,
+    along with the number of cached conversions as "size"."""
+    with _lock:
+        stats = {"size": len(_cache)}
+        for name, (hits, misses) in _stats.items():
+            total = hits + misses
+            stats[name] = {
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": round(hits / total, 4) if total else 0.0,
+            }
+        return stats
+
+
+def clear():
+    """Clears the cache and the hit/miss counters."""
+    with _lock:
+        _cache.clear()
+        for stats in _stats.values():
+            stats[0] = 0
+            stats[1] = 0
@@ -6,9 +6,9 @@ import platform
 import sys
 import time
 from contextlib import suppress
-from seleniumbase import config as sb_config
 from seleniumbase.config import settings
 from seleniumbase.fixtures import constants
+from seleniumbase.fixtures import deadline
 
 
 def pip_install(package, version=None):
@@ -289,29 +289,16 @@ def _format_message(message):
     return message
 
 
-def __time_limit_exceeded(message):
-    from seleniumbase.common.exceptions import TimeLimitExceededException
-
-    raise TimeLimitExceededException(message)
-
-
 def check_if_time_limit_exceeded():
-    if (
-        getattr(sb_config, "time_limit", None)
-        and not sb_config.recorder_mode
-    ):
-        time_limit = sb_config.time_limit
-        now_ms = int(time.time() * 1000)
-        if now_ms > sb_config.start_time_ms + sb_config.time_limit_ms:
-            display_time_limit = time_limit
-            plural = "s"
-            if float(int(time_limit)) == float(time_limit):
-                display_time_limit = int(time_limit)
-                if display_time_limit == 1:
-                    plural = ""
-            message = (
-                "This test has exceeded the time limit of %s second%s!"
-                % (display_time_limit, plural)
-            )
-            message = _format_message(message)
-            __time_limit_exceeded(message)
+    test_deadline = deadline.get_test_deadline()
+    if test_deadline and test_deadline.expired():
+        deadline.raise_time_limit_exceeded(test_deadline.timeout)
+
+
+def get_time_limit_remaining_ms():
+    """Returns the milliseconds left before the test time limit is reached.
+    Returns None if no time limit applies to the current test."""
+    test_deadline = deadline.get_test_deadline()
+    if test_deadline:
+        return test_deadline.remaining() * 1000.0
+    return None
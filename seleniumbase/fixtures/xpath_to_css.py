@@ -1,5 +1,6 @@
 """Convert XPath selectors into CSS selectors"""
 import re
+from seleniumbase.fixtures.selector_cache import cached_conversion
 
 _sub_regexes = {
     "tag": r"([a-zA-Z][-a-zA-Z0-9]{0,40}|\*)",
@@ -140,6 +141,7 @@ def _get_raw_css_from_xpath(xpath, original):
         return css
 
 
+@cached_conversion
 def convert_xpath_to_css(xpath):
     original = xpath
     xpath = xpath.replace(" = '", "='")
@@ -0,0 +1,79 @@
+###############################################################################
+# conditions_js - Check a batch of element conditions with one script call.
+###############################################################################
+
+# A JavaScript function that takes a list of conditions, where each one is
+# [condition, selector, by, text_or_attribute, value], and returns a list
+# with one status code per condition:
+#     0 = The element was not found.
+#     1 = The element was found, but the condition was not met.
+#     2 = The condition was met.
+# (For "absent" and "not_visible", a missing element means the condition
+#  was met, so the status is 2 instead of 0.)
+
+check_conditions = r"""function(conds) {
+    function sbFind(selector, by) {
+        if (by === "xpath") {
+            return document.evaluate(
+                selector, document, null,
+                XPathResult.FIRST_ORDERED_NODE_TYPE, null
+            ).singleNodeValue;
+        }
+        if (by === "link text" || by === "partial link text") {
+            var links = document.querySelectorAll("a");
+            for (var i = 0; i < links.length; i++) {
+                var t = (links[i].innerText || "").trim();
+                if (by === "link text" && t === selector) return links[i];
+                if (by !== "link text" && t.indexOf(selector) !== -1) {
+                    return links[i];
+                }
+            }
+            return null;
+        }
+        return document.querySelector(selector);
+    }
+    function sbIsVisible(el) {
+        if (!el.getClientRects || !el.getClientRects().length) return false;
+        if (el.checkVisibility) {
+            return el.checkVisibility(
+                {opacityProperty: true, visibilityProperty: true}
+            );
+        }
+        var style = window.getComputedStyle(el);
+        return style.visibility !== "hidden" && style.opacity !== "0";
+    }
+    function sbGetText(el) {
+        var tag = el.tagName ? el.tagName.toLowerCase() : "";
+        if (tag === "input" || tag === "textarea") return el.value || "";
+        return el.innerText || el.textContent || "";
+    }
+    function sbStatus(cond) {
+        var kind = cond[0], el = null;
+        try {
+            el = sbFind(cond[1], cond[2]);
+        } catch (e) {
+            el = null;
+        }
+        if (kind === "absent") return el ? 1 : 2;
+        if (kind === "not_visible") return (el && sbIsVisible(el)) ? 1 : 2;
+        if (!el) return 0;
+        if (kind === "present") return 2;
+        if (kind === "attribute") {
+            var found = el.getAttribute(cond[3]);
+            if (found === null) return 1;
+            if (cond[4] === null || String(cond[4]) === found) return 2;
+            return 1;
+        }
+        if (!sbIsVisible(el)) return 1;
+        if (kind === "visible") return 2;
+        var text = sbGetText(el);
+        if (kind === "text") return text.indexOf(cond[3]) !== -1 ? 2 : 1;
+        if (kind === "exact_text") {
+            return text.trim() === String(cond[3]).trim() ? 2 : 1;
+        }
+        return 1;
+    }
+    var statuses = [];
+    for (var i = 0; i < conds.length; i++) statuses.push(sbStatus(conds[i]));
+    return statuses;
+}"""
@@ -0,0 +1,80 @@
+###############################################################################
+# observer_js - Wait for element conditions in the page with MutationObserver.
+###############################################################################
+
+# Used with execute_async_script(). Arguments:
+#     [0] selector, [1] by ("css selector" or "xpath"),
+#     [2] condition ("present", "visible", "text", or "exact_text"),
+#     [3] text (for the text conditions), [4] timeout (in milliseconds).
+# Calls back with true when the condition is met, false after the timeout,
+# or null if the selector could not be evaluated in the page.
+# The MutationObserver catches DOM changes as they happen. The short
+# in-page interval catches changes that don't mutate the DOM, such as
+# stylesheets loading or CSS animations finishing. Neither one costs
+# a WebDriver round trip, so the Python side only hears back once.
+
+wait_for_condition = r"""
+var selector = arguments[0], by = arguments[1], condition = arguments[2],
+    text = arguments[3], timeout = arguments[4],
+    done = arguments[arguments.length - 1];
+var finished = false, observer = null, interval = null, timer = null;
+function sbFind() {
+    if (by === "xpath") {
+        return document.evaluate(
+            selector, document, null,
+            XPathResult.FIRST_ORDERED_NODE_TYPE, null
+        ).singleNodeValue;
+    }
+    return document.querySelector(selector);
+}
+function sbIsVisible(el) {
+    if (!el.getClientRects || !el.getClientRects().length) return false;
+    if (el.checkVisibility) {
+        return el.checkVisibility(
+            {opacityProperty: true, visibilityProperty: true}
+        );
+    }
+    var style = window.getComputedStyle(el);
+    return style.visibility !== "hidden" && style.opacity !== "0";
+}
+function sbGetText(el) {
+    var tag = el.tagName ? el.tagName.toLowerCase() : "";
+    if (tag === "input" || tag === "textarea") return el.value || "";
+    return el.innerText || el.textContent || "";
+}
+function sbIsMet() {
+    var el = sbFind();
+    if (!el) return false;
+    if (condition === "present") return true;
+    if (!sbIsVisible(el)) return false;
+    if (condition === "visible") return true;
+    if (condition === "text") return sbGetText(el).indexOf(text) !== -1;
+    return sbGetText(el).trim() === text.trim();
+}
+function sbFinish(result) {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    if (interval) clearInterval(interval);
+    if (timer) clearTimeout(timer);
+    done(result);
+}
+function sbCheck() {
+    if (finished) return;
+    try {
+        if (sbIsMet()) sbFinish(true);
+    } catch (e) {
+        sbFinish(null);
+    }
+}
+sbCheck();
+if (!finished) {
+    observer = new MutationObserver(sbCheck);
+    observer.observe(document.documentElement || document, {
+        childList: true, subtree: true,
+        attributes: true, characterData: true
+    });
+    interval = setInterval(sbCheck, 50);
+    timer = setTimeout(function() { sbFinish(false); }, timeout);
+}
+"""
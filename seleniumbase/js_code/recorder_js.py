@@ -1,5 +1,9 @@
 ###############################################################################
 # recorder_js - Save browser actions to sessionStorage with good CSS selectors.
+# Actions are saved as an append-only log: "recorded_action_<N>" for each one,
+# and "recorded_actions_count". Only new (or replaced) actions are written.
+# If saved actions were replaced, "recorded_actions_low" has the first index,
+# so that Python (which only reads new actions) reads them again.
 ###############################################################################
 
 recorder_js = r"""
@@ -269,9 +273,32 @@ function useHref(tag_name, el) {
     return (tag_name === 'a' && el.hasAttribute('href') &&
             el.getAttribute('href').length > 0 && el.origin != 'null');
 };
+function trackRecordedActions() {
+    document.recorded_synced = 0;
+    document.recorded_actions.pop = function() {
+        document.recorded_synced = Math.min(
+            document.recorded_synced, this.length - 1);
+        return Array.prototype.pop.call(this);
+    };
+};
 function saveRecordedActions() {
-    json_rec_act = JSON.stringify(document.recorded_actions);
-    sessionStorage.setItem('recorded_actions', json_rec_act);
+    var ra = document.recorded_actions;
+    var first = document.recorded_base + document.recorded_synced;
+    var count = document.recorded_base + ra.length;
+    var saved_count = parseInt(
+        sessionStorage.getItem('recorded_actions_count') || '0', 10);
+    for (var i = document.recorded_synced; i < ra.length; i++) {
+        sessionStorage.setItem(
+            'recorded_action_' + (document.recorded_base + i),
+            JSON.stringify(ra[i]));
+    }
+    if (first < saved_count) {
+        var low = sessionStorage.getItem('recorded_actions_low');
+        if (low === null || first < parseInt(low, 10))
+            sessionStorage.setItem('recorded_actions_low', first);
+    }
+    sessionStorage.setItem('recorded_actions_count', count);
+    document.recorded_synced = ra.length;
 };
 function new_tab_on_new_origin() {
     var AllAnchorTags = document.getElementsByTagName('a');
@@ -318,6 +345,8 @@ for (var i = 0; i < AwayForms.length; i++) {
 }
 var reset_recorder_state = function() {
     document.recorded_actions = [];
+    document.recorded_base = 0;
+    trackRecordedActions();
     sessionStorage.setItem('pause_recorder', 'no');
     sessionStorage.setItem('recorder_mode', '1');
     sessionStorage.setItem('recorder_title', document.title);
@@ -326,8 +355,20 @@ var reset_recorder_state = function() {
     w_orig = window.location.origin;
     w_href = window.location.href;
     if (sessionStorage.getItem('recorder_activated') === 'yes') {
-        ss_ra = JSON.parse(sessionStorage.getItem('recorded_actions'));
-        document.recorded_actions = ss_ra;
+        // Only the last action is needed. (The others were saved already)
+        ss_count = parseInt(
+            sessionStorage.getItem('recorded_actions_count') || '0', 10);
+        ss_last = null;
+        if (ss_count > 0)
+            ss_last = sessionStorage.getItem(
+                'recorded_action_' + (ss_count - 1));
+        if (ss_last !== null) {
+            document.recorded_actions.push(JSON.parse(ss_last));
+            document.recorded_base = ss_count - 1;
+            document.recorded_synced = 1;
+        }
+        else
+            document.recorded_base = ss_count;
         document.recorded_actions.push(['_url_', w_orig, w_href, d_now]);
     }
     else {
@@ -798,3 +839,21 @@ document.body.addEventListener('keyup', function (event) {
 });
 set_border('#F43344');
 """
+
+# Returns [start, actions]: the recorded actions from index "start" onwards,
+# as JSON strings. ("start" is moved back if saved actions were replaced.)
+read_actions_js = r"""
+var ss = window.sessionStorage;
+var start = arguments[0];
+var count = parseInt(ss.getItem('recorded_actions_count') || '0', 10);
+var low = ss.getItem('recorded_actions_low');
+if (low !== null) {
+    start = Math.min(start, parseInt(low, 10));
+    ss.removeItem('recorded_actions_low');
+}
+start = Math.min(start, count);
+var actions = [];
+for (var i = start; i < count; i++)
+    actions.push(ss.getItem('recorded_action_' + i));
+return [start, actions];
+"""
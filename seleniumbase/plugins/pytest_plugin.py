@@ -70,6 +70,7 @@ def pytest_addoption(parser):
     --driver-version=VER  (Set the chromedriver or uc_driver version to use.)
     --sjw  (Skip JS Waits for readyState to be "complete" or Angular to load.)
     --wfa  (Wait for AngularJS to be done loading after specific web actions.)
+    --edw  (Use event-driven waits for elements instead of polling WebDriver.)
     --pls=PLS  (Set pageLoadStrategy on Chrome: "normal", "eager", or "none".)
     --headless  (The default headless mode. Linux uses this mode by default.)
     --headless1  (Use Chrome's old headless mode. Fast, but has limitations.)
@@ -121,6 +122,7 @@ def pytest_addoption(parser):
     --rs | --reuse-session  (Reuse browser session for all tests.)
     --rcs | --reuse-class-session  (Reuse session for tests in class.)
     --crumbs  (Delete all cookies between tests reusing a session.)
+    --browser-pool=N  (Keep N warm browsers per worker to reuse after reset.)
     --disable-beforeunload  (Disable the "beforeunload" event on Chrome.)
     --window-position=X,Y  (Set the browser's starting window position.)
     --window-size=WIDTH,HEIGHT  (Set the browser's starting window size.)
@@ -429,6 +431,17 @@ def pytest_addoption(parser):
                 was changed to no longer wait for AngularJS to
                 finish loading as an extra JavaScript call.)""",
     )
+    parser.addoption(
+        "--edw",
+        "--event_driven_waits",
+        "--event-driven-waits",
+        action="store_true",
+        dest="event_driven_waits",
+        default=False,
+        help="""Wait for elements with an in-page MutationObserver
+                script instead of polling WebDriver every 100ms.
+                (Falls back to polling if scripts can't be run.)""",
+    )
     parser.addoption(
         "--with-db_reporting",
         "--with-db-reporting",
@@ -1298,6 +1311,19 @@ def pytest_addoption(parser):
         help="""The option to reuse the selenium browser window
                 session for all tests within the same class.""",
     )
+    parser.addoption(
+        "--browser_pool",
+        "--browser-pool",
+        action="store",
+        dest="browser_pool",
+        default=None,
+        help="""The option to keep up to N warm browsers open per
+                worker. Instead of quitting the browser after a test,
+                the browser is reset (tabs, cookies, storage, and
+                permissions) so that the next test can lease it.
+                Browsers get recycled after too many leases.
+                (See BROWSER_POOL_MAX_LEASES in settings.py.)""",
+    )
     parser.addoption(
         "--crumbs",
         action="store_true",
@@ -1826,6 +1852,8 @@ def pytest_configure(config):
         settings.SKIP_JS_WAITS = True
     if config.getoption("wait_for_angularjs"):
         settings.WAIT_FOR_ANGULARJS = True
+    if config.getoption("event_driven_waits"):
+        settings.EVENT_DRIVEN_WAITS = True
     sb_config.all_scripts = config.getoption("all_scripts")
     sb_config._time_limit = config.getoption("time_limit")
     sb_config.time_limit = config.getoption("time_limit")
@@ -1890,6 +1918,13 @@ def pytest_configure(config):
         sb_config.reuse_session = True
     sb_config.shared_driver = None  # The default driver for session reuse
     sb_config.crumbs = config.getoption("crumbs")
+    sb_config.browser_pool = config.getoption("browser_pool")
+    if sb_config.browser_pool:
+        try:
+            sb_config.browser_pool = int(sb_config.browser_pool)
+        except Exception:
+            raise Exception('"--browser-pool=N" must be an integer!')
+    sb_config._browser_pool = None  # The BrowserPool (created when used)
     sb_config._disable_beforeunload = config.getoption("_disable_beforeunload")
     sb_config.window_position = config.getoption("window_position")
     sb_config.window_size = config.getoption("window_size")
@@ -2330,6 +2365,10 @@ def _perform_pytest_unconfigure_(config):
     duration = time.time() - start_time
     if not getattr(sb_config, "multi_proxy", None):
         proxy_helper.remove_proxy_zip_if_present()
+    if getattr(sb_config, "_browser_pool", None):
+        # Close the warm browsers that were kept for reuse
+        sb_config._browser_pool.close()
+        sb_config._browser_pool = None
     if getattr(sb_config, "reuse_session", None):
         # Close the shared browser session
         if sb_config.shared_driver:
@@ -2686,6 +2725,10 @@ def pytest_unconfigure(config):
                 sb_config._only_unittest = False
                 dashboard_path = os.path.join(abs_path, "dashboard.html")
                 with dash_lock:
+                    if hasattr(sb_config, "_refresh_dashboard"):
+                        # Include the results of processes that are done
+                        with suppress(Exception):
+                            sb_config._refresh_dashboard()
                     if (
                         sb_config._dash_html
                         and config.getoption("htmlpath") == "dashboard.html"
@@ -81,6 +81,7 @@ def SB(
     driver_version=None,  # Set the chromedriver or uc_driver version to use.
     skip_js_waits=None,  # Skip JS Waits (readyState=="complete" and Angular).
     wait_for_angularjs=None,  # Wait for AngularJS to load after some actions.
+    event_driven_waits=None,  # Wait for elements with in-page observers.
     use_wire=None,  # Use selenium-wire's webdriver over selenium webdriver.
     external_pdf=None,  # Set Chrome "plugins.always_open_pdf_externally":True.
     window_position=None,  # Set the browser's starting window position: "X,Y"
@@ -121,6 +122,7 @@ def SB(
     pls=None,  # Shortcut / Duplicate of "page_load_strategy".
     sjw=None,  # Shortcut / Duplicate of "skip_js_waits".
     wfa=None,  # Shortcut / Duplicate of "wait_for_angularjs".
+    edw=None,  # Shortcut / Duplicate of "event_driven_waits".
     cft=None,  # Use "Chrome for Testing"
     chs=None,  # Use "Chrome-Headless-Shell"
     use_chromium=None,  # Use base "Chromium"
@@ -136,6 +138,7 @@ def SB(
     highlights=None,  # Number of highlight animations for Demo Mode actions.
     interval=None,  # SECONDS (Autoplay interval for SB Slides & Tour steps.)
     time_limit=None,  # SECONDS (Safely fail tests that exceed the time limit.)
+    browser_pool=None,  # Keep N warm browsers open for reuse by later SB().
 ) -> Generator[BaseCase, Any, None]:
     """
     * SeleniumBase as a Python Context Manager *
@@ -206,6 +209,7 @@ def SB(
     driver_version (str):  Set the chromedriver or uc_driver version to use.
     skip_js_waits (bool):  Skip JS Waits (readyState=="complete" and Angular).
     wait_for_angularjs (bool):  Wait for AngularJS to load after some actions.
+    event_driven_waits (bool):  Wait for elements with in-page observers.
     use_wire (bool):  Use selenium-wire's webdriver over selenium webdriver.
     external_pdf (bool):  Set Chrome "plugins.always_open_pdf_externally":True.
     window_position (x,y):  Set the browser's starting window position: "X,Y"
@@ -246,6 +250,7 @@ def SB(
     pls (str):  Shortcut / Duplicate of "page_load_strategy".
     sjw (bool):  Shortcut / Duplicate of "skip_js_waits".
     wfa (bool):  Shortcut / Duplicate of "wait_for_angularjs".
+    edw (bool):  Shortcut / Duplicate of "event_driven_waits".
     save_screenshot (bool):  Save a screenshot at the end of each test.
     no_screenshot (bool):  No screenshots saved unless tests directly ask it.
     page_load_strategy (str):  Set Chrome PLS to "normal", "eager", or "none".
@@ -258,6 +263,7 @@ def SB(
     highlights (int):  Number of highlight animations for Demo Mode actions.
     interval (float):  SECONDS (Autoplay interval for SB Slides & Tour steps.)
     time_limit (float):  SECONDS (Safely fail tests that exceed the time limit)
+    browser_pool (int):  Keep N warm browsers open for reuse by later SB().
     """
     import colorama
     import gc
@@ -984,6 +990,17 @@ def SB(
             settings.WAIT_FOR_ANGULARJS = True
     elif wait_for_angularjs:
         settings.WAIT_FOR_ANGULARJS = wait_for_angularjs
+    if edw is not None and event_driven_waits is None:
+        event_driven_waits = edw
+    if event_driven_waits is None:
+        if (
+            "--edw" in sys_argv
+            or "--event_driven_waits" in sys_argv
+            or "--event-driven-waits" in sys_argv
+        ):
+            settings.EVENT_DRIVEN_WAITS = True
+    elif event_driven_waits:
+        settings.EVENT_DRIVEN_WAITS = event_driven_waits
     if save_screenshot is None:
         if (
             "--screenshot" in sys_argv
@@ -1131,6 +1148,19 @@ def SB(
             time_limit = float(time_limit)
         except Exception:
             raise Exception('"time_limit" must be numeric!')
+    if browser_pool is None:
+        for arg in sys_argv:
+            if (
+                arg.startswith("--browser-pool=")
+                or arg.startswith("--browser_pool=")
+            ):
+                browser_pool = arg.split("=", 1)[1]
+                break
+    if browser_pool:
+        try:
+            browser_pool = int(browser_pool)
+        except Exception:
+            raise Exception('"browser_pool" must be an integer!')
 
     sb_config.with_testing_base = with_testing_base
     sb_config.browser = browser
@@ -1190,6 +1220,7 @@ def SB(
     sb_config._multithreaded = False
     sb_config.reuse_session = False
     sb_config.crumbs = False
+    sb_config.browser_pool = browser_pool
     sb_config.final_debug = False
     sb_config.visual_baseline = False
     sb_config.window_position = window_position
@@ -1305,6 +1336,7 @@ def SB(
     sb._multithreaded = sb_config._multithreaded
     sb._reuse_session = sb_config.reuse_session
     sb._crumbs = sb_config.crumbs
+    sb._browser_pool = sb_config.browser_pool
     sb._final_debug = sb_config.final_debug
     sb.visual_baseline = sb_config.visual_baseline
     sb.window_position = sb_config.window_position
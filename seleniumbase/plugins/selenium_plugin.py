@@ -51,6 +51,7 @@ class SeleniumBrowser(Plugin):
     --driver-version=VER  (Set the chromedriver or uc_driver version to use.)
     --sjw  (Skip JS Waits for readyState to be "complete" or Angular to load.)
     --wfa  (Wait for AngularJS to be done loading after specific web actions.)
+    --edw  (Use event-driven waits for elements instead of polling WebDriver.)
     --pls=PLS  (Set pageLoadStrategy on Chrome: "normal", "eager", or "none".)
     --headless  (The default headless mode. Linux uses this mode by default.)
     --headless1  (Use Chrome's old headless mode. Fast, but has limitations.)
@@ -253,6 +254,17 @@ class SeleniumBrowser(Plugin):
                     was changed to no longer wait for AngularJS to
                     finish loading as an extra JavaScript call.)""",
         )
+        parser.addoption(
+            "--edw",
+            "--event_driven_waits",
+            "--event-driven-waits",
+            action="store_true",
+            dest="event_driven_waits",
+            default=False,
+            help="""Wait for elements with an in-page MutationObserver
+                    script instead of polling WebDriver every 100ms.
+                    (Falls back to polling if scripts can't be run.)""",
+        )
         parser.addoption(
             "--protocol",
             action="store",
@@ -1340,6 +1352,8 @@ class SeleniumBrowser(Plugin):
             settings.SKIP_JS_WAITS = True
         if self.options.wait_for_angularjs:
             settings.WAIT_FOR_ANGULARJS = True
+        if self.options.event_driven_waits:
+            settings.EVENT_DRIVEN_WAITS = True
         test.test.protocol = self.options.protocol
         test.test.servername = self.options.servername
         test.test.port = self.options.port
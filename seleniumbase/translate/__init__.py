@@ -1,9 +1,28 @@
-from seleniumbase.translate import chinese  # noqa
-from seleniumbase.translate import dutch  # noqa
-from seleniumbase.translate import french  # noqa
-from seleniumbase.translate import italian  # noqa
-from seleniumbase.translate import japanese  # noqa
-from seleniumbase.translate import korean  # noqa
-from seleniumbase.translate import portuguese  # noqa
-from seleniumbase.translate import russian  # noqa
-from seleniumbase.translate import spanish  # noqa
+# The language modules are imported on first use.
+# (Each one imports BaseCase, so importing all of them is slow.)
+_languages = (
+    "chinese",
+    "dutch",
+    "french",
+    "italian",
+    "japanese",
+    "korean",
+    "portuguese",
+    "russian",
+    "spanish",
+)
+__all__ = list(_languages)  # (For "from seleniumbase.translate import *")
+
+
+def __getattr__(name):
+    if name not in _languages:
+        raise AttributeError(
+            "module %r has no attribute %r" % (__name__, name)
+        )
+    import importlib
+
+    return importlib.import_module("%s.%s" % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_languages))
@@ -621,6 +621,13 @@ class Chrome(selenium.webdriver.chrome.webdriver.WebDriver):
                     )
                     break
                 time.sleep(0.1)
+        if (
+            getattr(self, "cdp", None)
+            and hasattr(getattr(self.cdp, "loop", None), "stop_thread")
+        ):
+            logger.debug("Stopping the CDP event loop thread")
+            with suppress(Exception):
+                self.cdp.loop.stop_thread()
         # Dereference Patcher so that it can start cleaning up as well.
         # This must come last, otherwise it will throw "in use" errors.
         self.patcher = None
@@ -23,6 +23,7 @@ from seleniumbase.fixtures import shared_utils
 from typing import List, Optional, Set, Tuple, Union
 import mycdp as cdp
 from . import cdp_util as util
+from . import readiness
 from . import tab
 from ._contradict import ContraDict
 from .config import PathLike, Config, is_posix
@@ -492,10 +493,11 @@ class Browser:
                 self.main_tab._last_auth = username_and_password
                 await self.set_auth(proxy_user, proxy_pass, self.tabs[0])
                 time.sleep(0.25)
-        await connection.sleep(0.15)
-        frame_id, loader_id, *_ = await connection.send(
-            cdp.page.navigate(url)
-        )
+        # Let the settings take effect. (The old 0.15s pause is the limit)
+        await connection.update_target()
+        await readiness.wait_for_idle(connection, 0.15)
+        frame_id, loader_id, *_ = await readiness.navigate(connection, url)
+        page_readiness = readiness.get_readiness(connection)
         major_browser_version = None
         try:
             major_browser_version = (
@@ -524,15 +526,14 @@ class Browser:
             await connection.send(
                 cdp.page.add_script_to_evaluate_on_new_document(recorder_code)
             )
-            await connection.sleep(0.25)
-            await self.wait(0.05)
+            await page_readiness.wait_for_load(0.3)
             await connection.send(cdp.runtime.evaluate(recorder_js))
         # Update the frame_id on the tab
         connection.frame_id = frame_id
         connection.browser = self
-        # Give settings time to take effect
-        await connection.sleep(0.25)
-        await self.wait(0.05)
+        # Wait for the page to load. (The old 0.3s pause is the limit)
+        await page_readiness.wait_for_load(0.3)
+        await connection.update_target()
         return connection
 
     async def start(self=None) -> Browser:
@@ -605,16 +606,19 @@ class Browser:
             self._process_pid = self._process.pid
         self._http = HTTPApi((self.config.host, self.config.port))
         get_registered_instances().add(self)
-        await asyncio.sleep(0.25)
-        for _ in range(5):
+        # Poll until the DevTools endpoint answers, rather than sleeping.
+        # (The old fixed pauses, 0.25s + 5 x 0.5s, are the upper bound.)
+        deadline = time.monotonic() + 2.75
+        while True:
             try:
                 self.info = ContraDict(
                     await self._http.get("version"), silent=True
                 )
             except (Exception,):
-                if _ == 4:
+                if time.monotonic() >= deadline:
                     logger.debug("Could not start", exc_info=True)
-                await self.sleep(0.5)
+                    break
+                await asyncio.sleep(0.05)
             else:
                 break
         if not self.info:
@@ -859,9 +863,25 @@ class Browser:
         with suppress(Exception):
             connection_id = self.connection.websocket.id.hex
         close_success = False
+        background_loop = None
         try:
-            if self.connection:
-                asyncio.get_event_loop().create_task(self.connection.aclose())
+            loop = asyncio.get_event_loop()
+            if (
+                isinstance(loop, util.BackgroundLoop)
+                and loop.is_thread_alive()
+                and not loop.in_loop_thread()
+            ):
+                background_loop = loop
+            if self.connection and background_loop:
+                with suppress(Exception):
+                    asyncio.run_coroutine_threadsafe(
+                        self.connection.aclose(), background_loop
+                    ).result(timeout=2)
+                logger.debug(
+                    "Closed connection using run_coroutine_threadsafe()"
+                )
+            elif self.connection:
+                loop.create_task(self.connection.aclose())
                 logger.debug(
                     "Closed connection using get_event_loop().create_task()"
                 )
@@ -918,6 +938,8 @@ class Browser:
                         raise
             self._process = None
             self._process_pid = None
+        if background_loop:
+            background_loop.stop_thread()
         if (
             hasattr(sb_config, "_xvfb_users")
             and isinstance(sb_config._xvfb_users, int)
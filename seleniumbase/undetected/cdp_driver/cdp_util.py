@@ -5,6 +5,7 @@ import fasteners
 import logging
 import os
 import sys
+import threading
 import time
 import types
 import typing
@@ -14,6 +15,7 @@ from seleniumbase import extensions
 from seleniumbase.config import settings
 from seleniumbase.core import detect_b_ver
 from seleniumbase.core import download_helper
+from seleniumbase.core import extension_helper
 from seleniumbase.core import proxy_helper
 from seleniumbase.fixtures import constants
 from seleniumbase.fixtures import shared_utils
@@ -179,19 +181,6 @@ def __activate_virtual_display_as_needed(
                 __activate_standard_virtual_display()
 
 
-def __set_proxy_filenames():
-    DOWNLOADS_DIR = constants.Files.DOWNLOADS_FOLDER
-    for num in range(1000):
-        PROXY_DIR_PATH = os.path.join(DOWNLOADS_DIR, "proxy_ext_dir_%s" % num)
-        if os.path.exists(PROXY_DIR_PATH):
-            continue
-        proxy_helper.PROXY_DIR_PATH = PROXY_DIR_PATH
-        return
-    # Exceeded upper bound. Use Defaults:
-    PROXY_DIR_PATH = os.path.join(DOWNLOADS_DIR, "proxy_ext_dir")
-    proxy_helper.PROXY_DIR_PATH = PROXY_DIR_PATH
-
-
 def __add_chrome_ext_dir(extension_dir, dir_path):
     # Add dir_path to the existing extension_dir
     option_exists = False
@@ -205,19 +194,6 @@ def __add_chrome_ext_dir(extension_dir, dir_path):
     return extension_dir
 
 
-def __unzip_to_new_folder(zip_file, folder):
-    proxy_dir_lock = fasteners.InterProcessLock(PROXY_DIR_LOCK)
-    with proxy_dir_lock:
-        with suppress(Exception):
-            shared_utils.make_writable(PROXY_DIR_LOCK)
-        if not os.path.exists(folder):
-            import zipfile
-            zip_ref = zipfile.ZipFile(zip_file, "r")
-            os.makedirs(folder)
-            zip_ref.extractall(folder)
-            zip_ref.close()
-
-
 def __add_chrome_proxy_extension(
     extension_dir,
     proxy_string,
@@ -229,49 +205,17 @@ def __add_chrome_proxy_extension(
 ):
     """Implementation of https://stackoverflow.com/a/35293284/7058266
     for https://stackoverflow.com/q/12848327/7058266
-    (Run Selenium on a proxy server that requires authentication.)"""
-    args = " ".join(sys.argv)
-    bypass_list = proxy_bypass_list
-    if (
-        not ("-n" in sys.argv or " -n=" in args or args == "-c")
-        and not multi_proxy
-    ):
-        # Single-threaded
-        proxy_dir_lock = fasteners.InterProcessLock(PROXY_DIR_LOCK)
-        with proxy_dir_lock:
-            proxy_helper.create_proxy_ext(
-                proxy_string,
-                proxy_user,
-                proxy_pass,
-                proxy_scheme,
-                bypass_list,
-                zip_it=False,
-            )
-            proxy_dir_path = proxy_helper.PROXY_DIR_PATH
-            extension_dir = __add_chrome_ext_dir(
-                extension_dir, proxy_dir_path
-            )
-    else:
-        # Multi-threaded
-        proxy_dir_lock = fasteners.InterProcessLock(PROXY_DIR_LOCK)
-        with proxy_dir_lock:
-            with suppress(Exception):
-                shared_utils.make_writable(PROXY_DIR_LOCK)
-            if multi_proxy:
-                __set_proxy_filenames()
-            if not os.path.exists(proxy_helper.PROXY_DIR_PATH):
-                proxy_helper.create_proxy_ext(
-                    proxy_string,
-                    proxy_user,
-                    proxy_pass,
-                    proxy_scheme,
-                    bypass_list,
-                    zip_it=False,
-                )
-            extension_dir = __add_chrome_ext_dir(
-                extension_dir, proxy_helper.PROXY_DIR_PATH
-            )
-    return extension_dir
+    (Run Selenium on a proxy server that requires authentication.)
+    Each proxy config gets its own cached extension folder, so this works
+    the same way whether or not tests are running in parallel."""
+    proxy_dir_path = proxy_helper.get_proxy_ext_dir(
+        proxy_string,
+        proxy_user,
+        proxy_pass,
+        proxy_scheme,
+        proxy_bypass_list,
+    )
+    return __add_chrome_ext_dir(extension_dir, proxy_dir_path)
 
 
 async def start(
@@ -591,8 +535,7 @@ async def start(
         incognito = False
         guest = False
         ad_block_zip = AD_BLOCK_ZIP_PATH
-        ad_block_dir = os.path.join(DOWNLOADS_FOLDER, "ad_block")
-        __unzip_to_new_folder(ad_block_zip, ad_block_dir)
+        ad_block_dir = extension_helper.get_unzipped_dir(ad_block_zip)
         extension_dir = __add_chrome_ext_dir(extension_dir, ad_block_dir)
     if disable_csp:
         sb_config.disable_csp = True
@@ -925,6 +868,78 @@ def loop():
     return loop
 
 
+if sys.platform == "win32":
+    _BaseEventLoop = asyncio.ProactorEventLoop
+else:
+    _BaseEventLoop = asyncio.SelectorEventLoop
+
+
+class BackgroundLoop(_BaseEventLoop):
+    """An event loop that can run forever on its own daemon thread.
+    Once start_thread() is called, run_until_complete() submits work
+    to that thread with asyncio.run_coroutine_threadsafe() and blocks
+    until the result is ready. The loop never stops between calls,
+    so the CDP Listener keeps draining websocket events (and firing
+    event handlers) while the calling code is busy doing other things.
+    Any number of Python threads can call run_until_complete() at once.
+    Before start_thread() is called, this works like a regular loop."""
+
+    def __init__(self):
+        super().__init__()
+        self._thread = None
+
+    def start_thread(self):
+        if self.is_thread_alive():
+            return self
+        self._thread = threading.Thread(
+            target=self.run_forever, name="cdp-event-loop", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop_thread(self, timeout=2):
+        if not self.is_thread_alive():
+            return
+        self.call_soon_threadsafe(self.stop)
+        if threading.current_thread() is not self._thread:
+            self._thread.join(timeout=timeout)
+
+    def is_thread_alive(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def in_loop_thread(self):
+        return threading.current_thread() is self._thread
+
+    def run_until_complete(self, future):
+        if not self.is_thread_alive() or self.in_loop_thread():
+            return super().run_until_complete(future)
+        if not asyncio.iscoroutine(future):
+            future = _await(future)
+        concurrent_future = asyncio.run_coroutine_threadsafe(future, self)
+        try:
+            return concurrent_future.result()
+        except BaseException:
+            concurrent_future.cancel()
+            raise
+
+
+async def _await(awaitable):
+    return await awaitable
+
+
+async def gather(*awaitables):
+    """Same as asyncio.gather(), but the tasks are created when awaited.
+    (Use this with run_until_complete() so that the tasks are created
+    by the thread running the loop, which might be a BackgroundLoop.)"""
+    return await asyncio.gather(*awaitables)
+
+
+def new_background_loop():
+    """Returns a new BackgroundLoop that is already running forever
+    on a daemon thread. Call stop_thread() on it when finished."""
+    return BackgroundLoop().start_thread()
+
+
 def cdp_get_module(domain: Union[str, types.ModuleType]):
     """
     Get cdp module by given string.
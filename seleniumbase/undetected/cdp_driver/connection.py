@@ -27,6 +27,12 @@ import mycdp.runtime
 import mycdp.target
 import mycdp.util
 
+try:
+    # An optional faster JSON decoder for websocket messages.
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 T = TypeVar("T")
 GLOBAL_DELAY = 0.005
 MAX_SIZE: int = 2**28
@@ -34,6 +40,33 @@ PING_TIMEOUT: int = 1800  # 30 minutes
 TargetType = Union[cdp.target.TargetInfo, cdp.target.TargetID]
 logging.getLogger("asyncio").setLevel(logging.CRITICAL)
 logger = logging.getLogger("uc.connection")
+# CDP events are sent as '{"method":"Domain.eventName","params":...}',
+# so the event name can be read without decoding the whole message.
+EVENT_PREFIX = '{"method":"'
+
+
+def get_callback_kind(callback):
+    """
+    Returns an (is_coroutine, takes_connection) tuple for a handler.
+    takes_connection is None if the signature couldn't be determined,
+    in which case both calling conventions are tried when dispatching.
+    """
+    is_coroutine = (
+        inspect.iscoroutinefunction(callback)
+        or inspect.iscoroutine(callback)
+    )
+    takes_connection = None
+    try:
+        signature = inspect.signature(callback)
+        try:
+            signature.bind(None, None)
+            takes_connection = True
+        except TypeError:
+            signature.bind(None)
+            takes_connection = False
+    except (TypeError, ValueError):
+        pass
+    return (is_coroutine, takes_connection)
 
 
 class ProtocolException(Exception):
@@ -195,6 +228,7 @@ class Connection(metaclass=CantTouchThis):
         self.websocket = None
         self.mapper = {}
         self.handlers = collections.defaultdict(list)
+        self.handler_kinds = {}
         self.recv_task = None
         self.enabled_domains = []
         self._last_result = []
@@ -255,8 +289,18 @@ class Connection(metaclass=CantTouchThis):
                 if inspect.isbuiltin(obj):
                     continue
                 self.handlers[obj].append(handler)
+            self._cache_handler_kind(handler)
             return
         self.handlers[event_type_or_domain].append(handler)
+        self._cache_handler_kind(handler)
+
+    def _cache_handler_kind(self, handler):
+        """Inspect the handler once, rather than on every event."""
+        try:
+            if handler not in self.handler_kinds:
+                self.handler_kinds[handler] = get_callback_kind(handler)
+        except TypeError:
+            pass  # Unhashable handler. It will be inspected per event.
 
     async def aopen(self, **kw):
         """
@@ -436,12 +480,7 @@ class Connection(metaclass=CantTouchThis):
         if not self.listener or not self.listener.running:
             self.listener = Listener(self)
         try:
-            tx = Transaction(cdp_obj)
-            tx.connection = self
-            if not self.mapper:
-                self.__count__ = itertools.count(0)
-            tx.id = next(self.__count__)
-            self.mapper.update({tx.id: tx})
+            tx = self._new_transaction(cdp_obj)
             if not _is_update:
                 await self._register_handlers()
             await self.websocket.send(tx.message)
@@ -453,6 +492,74 @@ class Connection(metaclass=CantTouchThis):
         except Exception:
             await self.aclose()
 
+    async def send_many(self, *cdp_objs):
+        """
+        Send several protocol commands back to back, without waiting
+        for the response of one command before writing the next one.
+        The browser still processes the commands in the order given,
+        so only use this for commands that don't depend on the results
+        of the earlier ones. Returns a list of the results in order.
+        As with send(), a command that fails has None as its result.
+        :param cdp_objs: The generator objects created by cdp methods
+        """
+        await self.aopen()
+        if not self.websocket or self.websocket.state is State.CLOSED:
+            return [None] * len(cdp_objs)
+        if self.browser:
+            browser = self.browser
+            if browser.config:
+                if browser.config.expert:
+                    await self._prepare_expert()
+                if browser.config.headless:
+                    await self._prepare_headless()
+        if not self.listener or not self.listener.running:
+            self.listener = Listener(self)
+        txs = []
+        try:
+            for cdp_obj in cdp_objs:
+                tx = self._new_transaction(cdp_obj)
+                txs.append(tx)
+                await self.websocket.send(tx.message)
+        except Exception:
+            for tx in txs:
+                self.mapper.pop(tx.id, None)
+            await self.aclose()
+            return [None] * len(cdp_objs)
+        results = await asyncio.gather(*txs, return_exceptions=True)
+        if any(isinstance(result, BaseException) for result in results):
+            for tx, result in zip(txs, results):
+                if isinstance(result, ProtocolException):
+                    logger.debug(
+                        "%s\ncommand:%s\nparams:%s",
+                        result.message, tx.method, tx.params
+                    )
+            await self.aclose()
+        return [
+            None if isinstance(result, BaseException) else result
+            for result in results
+        ]
+
+    def batch(self):
+        """
+        Collect commands in an "async with" block, and then send them
+        all together with send_many() when the block exits.
+        Example:
+            async with tab.batch() as batch:
+                batch.add(cdp.dom.enable())
+                batch.add(cdp.overlay.enable())
+            print(batch.results)
+        """
+        return CommandBatch(self)
+
+    def _new_transaction(self, cdp_obj):
+        tx = Transaction(cdp_obj)
+        tx.connection = self
+        if not self.mapper:
+            self.__count__ = itertools.count(0)
+        tx.id = next(self.__count__)
+        self.mapper.update({tx.id: tx})
+        return tx
+
     async def _register_handlers(self):
         """
         Ensure that for current (event) handlers, the corresponding
@@ -531,6 +638,27 @@ class Connection(metaclass=CantTouchThis):
             pass
 
 
+class CommandBatch:
+    """Commands collected by Connection.batch() for send_many()."""
+
+    def __init__(self, connection: Connection):
+        self.connection = connection
+        self.commands = []
+        self.results = []
+
+    def add(self, cdp_obj):
+        """Add a command. Returns its index in the results list."""
+        self.commands.append(cdp_obj)
+        return len(self.commands) - 1
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None and self.commands:
+            self.results = await self.connection.send_many(*self.commands)
+
+
 class Listener:
     def __init__(self, connection: Connection):
         self.connection = connection
@@ -592,7 +720,23 @@ class Listener:
                 # then break this loop.
                 break
             self.idle.clear()  # Not "idle" anymore.
-            message = json.loads(msg)
+            if isinstance(msg, str) and msg.startswith(EVENT_PREFIX):
+                # Skip decoding events that nothing is subscribed to.
+                method_end = msg.find('"', len(EVENT_PREFIX))
+                event_type = cdp.util._event_parsers.get(
+                    msg[len(EVENT_PREFIX):method_end]
+                )
+                if not self.connection.handlers.get(event_type):
+                    continue
+            try:
+                message = json_loads(msg)
+            except Exception as e:
+                logger.info(
+                    "%s: %s during parsing of json from message : %s"
+                    % (type(e).__name__, e.args, msg),
+                    exc_info=True,
+                )
+                continue
             if "id" in message:
                 if message["id"] in self.connection.mapper:
                     tx = self.connection.mapper.pop(message["id"])
@@ -608,13 +752,12 @@ class Listener:
                         continue
             else:
                 # Probably an event
+                event_type = cdp.util._event_parsers.get(message.get("method"))
+                callbacks = self.connection.handlers.get(event_type)
+                if not callbacks:
+                    continue
                 try:
-                    event = cdp.util.parse_json_event(message)
-                    # event_tx = EventTransaction(event)
-                    # if not self.connection.mapper:
-                    #     self.connection.__count__ = itertools.count(0)
-                    # event_tx.id = next(self.connection.__count__)
-                    # self.connection.mapper[event_tx.id] = event_tx
+                    event = event_type.from_json(message["params"])
                 except Exception as e:
                     logger.info(
                         "%s: %s during parsing of json from event : %s"
@@ -622,48 +765,49 @@ class Listener:
                         exc_info=True,
                     )
                     continue
-                except KeyError as e:
-                    logger.info("KeyError: %s" % e, exc_info=True)
-                    continue
                 try:
-                    if type(event) in self.connection.handlers:
-                        callbacks = self.connection.handlers[type(event)]
-                    else:
-                        continue
-                    if not len(callbacks):
-                        continue
-                    for callback in callbacks:
-                        try:
-                            if (
-                                inspect.iscoroutinefunction(callback)
-                                or inspect.iscoroutine(callback)
-                            ):
-                                try:
-                                    asyncio.create_task(
-                                        callback(event, self.connection)
-                                    )
-                                except TypeError:
-                                    asyncio.create_task(callback(event))
-                            else:
-                                try:
-                                    callback(event, self.connection)
-                                except TypeError:
-                                    callback(event)
-                        except Exception as e:
-                            logger.warning(
-                                "Exception in callback %s for event %s => %s",
-                                callback,
-                                event.__class__.__name__,
-                                e,
-                                exc_info=True,
-                            )
-                            raise
+                    self.dispatch(event, callbacks)
                 except asyncio.CancelledError:
                     break
                 except Exception:
                     raise
                 continue
 
+    def dispatch(self, event, callbacks):
+        """Calls each handler with the event (and the connection if wanted).
+        Async handlers are scheduled as tasks on the running event loop."""
+        handler_kinds = self.connection.handler_kinds
+        for callback in list(callbacks):
+            try:
+                kind = handler_kinds.get(callback)
+            except TypeError:
+                kind = None  # Unhashable handler
+            if kind is None:
+                kind = get_callback_kind(callback)
+                self.connection._cache_handler_kind(callback)
+            is_coroutine, takes_connection = kind
+            try:
+                if takes_connection is None:
+                    try:
+                        result = callback(event, self.connection)
+                    except TypeError:
+                        result = callback(event)
+                elif takes_connection:
+                    result = callback(event, self.connection)
+                else:
+                    result = callback(event)
+                if is_coroutine:
+                    asyncio.create_task(result)
+            except Exception as e:
+                logger.warning(
+                    "Exception in callback %s for event %s => %s",
+                    callback,
+                    event.__class__.__name__,
+                    e,
+                    exc_info=True,
+                )
+                raise
+
     def __repr__(self):
         s_idle = "[idle]" if self.idle.is_set() else "[busy]"
         s_cache_length = f"[cache size: {len(self.history)}]"
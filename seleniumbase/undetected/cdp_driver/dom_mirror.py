@@ -0,0 +1,347 @@
+"""
+A copy of a tab's DOM tree that stays current through DOM events.
+Fetching the document with DOM.getDocument(depth=-1, pierce=True)
+moves the entire DOM (including shadow roots and iframes) as JSON,
+which can be megabytes on large pages. The DomMirror fetches it once,
+and then applies DOM.setChildNodes, DOM.childNodeInserted/Removed,
+DOM.attributeModified (etc) events to it. The document is fetched again
+after DOM.documentUpdated, or after anything else sends DOM.getDocument
+or DOM.disable, because those reset the node ids of the DOM domain.
+"""
+from __future__ import annotations
+import asyncio
+import logging
+import typing
+import mycdp as cdp
+import mycdp.dom
+from . import cdp_util as util
+
+logger = logging.getLogger(__name__)
+if typing.TYPE_CHECKING:
+    from .tab import Tab
+
+# Commands that discard the node ids known to the client
+RESET_METHODS = ("DOM.getDocument", "DOM.disable")
+FRAME_OWNERS = ("IFRAME", "FRAME")
+
+
+def iter_subtree(node: cdp.dom.Node):
+    """Yields the node and every node below it (without recursion),
+    including shadow roots, iframe documents, and pseudo elements."""
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        yield node
+        for attr in ("children", "shadow_roots", "pseudo_elements"):
+            nodes = getattr(node, attr, None)
+            if nodes:
+                stack.extend(nodes)
+        for attr in ("content_document", "template_content"):
+            sub_node = getattr(node, attr, None)
+            if sub_node:
+                stack.append(sub_node)
+
+
+class DomMirror:
+    def __init__(self, tab: Tab):
+        self.tab = tab
+        self.document = None
+        self.nodes = {}  # node_id -> cdp.dom.Node
+        self.backend_nodes = {}  # backend_node_id -> cdp.dom.Node
+        self.incomplete = set()  # node_ids with children not mirrored yet
+        self.fetch_count = 0
+        self._fetch_tx = None
+        self._fetching = False
+        self._pending_events = []
+        self._lock = None
+        self._handlers_added = False
+
+    def invalidate(self):
+        """Forgets the document. (The next get_document() fetches it.)"""
+        self.document = None
+        self.nodes = {}
+        self.backend_nodes = {}
+        self.incomplete = set()
+
+    async def get_document(self, complete=False) -> cdp.dom.Node:
+        """
+        Returns the mirrored document, fetching it only if needed.
+        :param complete: Also fetch any subtrees that the browser
+            hasn't sent yet. (Only needed for walking the whole tree.
+            CSS Selector and text searches are done by the browser.)
+        """
+        if self.document is not None and not (complete and self.incomplete):
+            return self.document
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if complete and self.document is not None:
+                await self.__request_incomplete_nodes()
+            if self.document is None:
+                return await self.__fetch_document()
+            return self.document
+
+    def find_node(self, tree, node_id=None, backend_node_id=None):
+        """
+        Returns the node with the node_id (or backend_node_id) in the tree.
+        If the tree belongs to the mirror, this is a dictionary lookup.
+        Otherwise (Eg. a tree from before the last fetch), it's a tree walk.
+        :param tree: A cdp.dom.Node or an Element
+        """
+        root = getattr(tree, "node", tree)  # (An Element has a .node)
+        if root is not None and self.nodes.get(root.node_id) is root:
+            if node_id is not None:
+                return self.nodes.get(node_id)
+            return self.backend_nodes.get(backend_node_id)
+        if node_id is not None:
+            return util.filter_recurse(tree, lambda n: n.node_id == node_id)
+        return util.filter_recurse(
+            tree, lambda n: n.backend_node_id == backend_node_id
+        )
+
+    def on_command(self, tx):
+        """Called for every command sent by the tab.
+        Commands that reset node ids make the mirror out-of-date."""
+        if tx.method not in RESET_METHODS:
+            return
+        if (
+            self._fetching
+            and self._fetch_tx is None
+            and tx.method == "DOM.getDocument"
+        ):
+            self._fetch_tx = tx  # The command sent by __fetch_document()
+            return
+        self.invalidate()
+
+    async def __fetch_document(self):
+        self.__add_handlers()
+        self.invalidate()
+        self._fetching = True
+        self._fetch_tx = None
+        self._pending_events = []
+        try:
+            doc = await self.tab.send(cdp.dom.get_document(-1, True))
+        finally:
+            self._fetching = False
+            self._fetch_tx = None
+            pending_events = self._pending_events
+            self._pending_events = []
+        if not doc:
+            return doc
+        self.fetch_count += 1
+        self.document = doc
+        self.__index(doc)
+        # Apply the events that arrived after the response of getDocument,
+        # but before this coroutine resumed.
+        for apply, event in pending_events:
+            if self.document is None:
+                break
+            self.__apply(apply, event)
+        return doc
+
+    async def __request_incomplete_nodes(self):
+        for _ in range(3):
+            if not self.incomplete or self.document is None:
+                return
+            node_ids = list(self.incomplete)
+            for node_id in node_ids:
+                node = self.nodes.get(node_id)
+                if node and node.node_name in FRAME_OWNERS:
+                    self.invalidate()  # A frame was replaced. Start over.
+                    return
+            # The children arrive as DOM.setChildNodes events,
+            # which are applied before the responses of the commands.
+            await self.tab.send_many(
+                *[
+                    cdp.dom.request_child_nodes(node_id, -1, True)
+                    for node_id in node_ids
+                ]
+            )
+            self.incomplete.difference_update(
+                [node_id for node_id in node_ids if node_id not in self.nodes]
+            )
+        if self.incomplete:
+            self.invalidate()
+
+    def __add_handlers(self):
+        if self._handlers_added:
+            return
+        self._handlers_added = True
+        for event_type, apply in (
+            (cdp.dom.DocumentUpdated, self.__on_document_updated),
+            (cdp.dom.SetChildNodes, self.__on_set_child_nodes),
+            (cdp.dom.ChildNodeInserted, self.__on_child_node_inserted),
+            (cdp.dom.ChildNodeRemoved, self.__on_child_node_removed),
+            (cdp.dom.ChildNodeCountUpdated, self.__on_child_count_updated),
+            (cdp.dom.AttributeModified, self.__on_attribute_modified),
+            (cdp.dom.AttributeRemoved, self.__on_attribute_removed),
+            (cdp.dom.CharacterDataModified, self.__on_character_data),
+            (cdp.dom.ShadowRootPushed, self.__on_shadow_root_pushed),
+            (cdp.dom.ShadowRootPopped, self.__on_shadow_root_popped),
+            (cdp.dom.PseudoElementAdded, self.__on_pseudo_element_added),
+            (cdp.dom.PseudoElementRemoved, self.__on_pseudo_element_removed),
+        ):
+            self.tab.add_handler(event_type, self.__make_handler(apply))
+
+    def __make_handler(self, apply):
+        def handler(event):
+            if self._fetching:
+                # Events from before the getDocument response are already
+                # part of the fetched document. Events from after it are
+                # applied once the document has been received.
+                if self._fetch_tx is not None and self._fetch_tx.done():
+                    self._pending_events.append((apply, event))
+                return
+            if self.document is not None:
+                self.__apply(apply, event)
+
+        return handler
+
+    def __apply(self, apply, event):
+        try:
+            apply(event)
+        except Exception:
+            logger.debug("Couldn't apply %s to the DOM mirror", event)
+            self.invalidate()
+
+    def __index(self, node):
+        for sub_node in iter_subtree(node):
+            self.nodes[sub_node.node_id] = sub_node
+            self.backend_nodes[sub_node.backend_node_id] = sub_node
+            if (
+                sub_node.child_node_count
+                and sub_node.children is None
+            ) or (
+                sub_node.node_name in FRAME_OWNERS
+                and not sub_node.content_document
+            ):
+                self.incomplete.add(sub_node.node_id)
+
+    def __unindex(self, node):
+        for sub_node in iter_subtree(node):
+            if self.nodes.get(sub_node.node_id) is sub_node:
+                self.nodes.pop(sub_node.node_id)
+            if self.backend_nodes.get(sub_node.backend_node_id) is sub_node:
+                self.backend_nodes.pop(sub_node.backend_node_id)
+            self.incomplete.discard(sub_node.node_id)
+
+    def __on_document_updated(self, event):
+        self.invalidate()
+
+    def __on_set_child_nodes(self, event):
+        parent = self.nodes.get(event.parent_id)
+        if not parent:
+            return
+        for child in parent.children or []:
+            self.__unindex(child)
+        parent.children = list(event.nodes)
+        parent.child_node_count = len(parent.children)
+        self.incomplete.discard(parent.node_id)
+        for child in parent.children:
+            self.__index(child)
+
+    def __on_child_node_inserted(self, event):
+        parent = self.nodes.get(event.parent_node_id)
+        if not parent:
+            return
+        if parent.children is None:
+            parent.children = []
+        index = 0
+        if event.previous_node_id:
+            for i, child in enumerate(parent.children):
+                if child.node_id == event.previous_node_id:
+                    index = i + 1
+                    break
+        parent.children.insert(index, event.node)
+        parent.child_node_count = len(parent.children)
+        self.__index(event.node)
+
+    def __on_child_node_removed(self, event):
+        parent = self.nodes.get(event.parent_node_id)
+        if not parent or not parent.children:
+            return
+        for i, child in enumerate(parent.children):
+            if child.node_id == event.node_id:
+                parent.children.pop(i)
+                self.__unindex(child)
+                break
+        parent.child_node_count = len(parent.children)
+
+    def __on_child_count_updated(self, event):
+        node = self.nodes.get(event.node_id)
+        if not node:
+            return
+        node.child_node_count = event.child_node_count
+        if event.child_node_count:
+            self.incomplete.add(node.node_id)
+        else:
+            node.children = []
+            self.incomplete.discard(node.node_id)
+
+    def __on_attribute_modified(self, event):
+        node = self.nodes.get(event.node_id)
+        if not node:
+            return
+        if node.attributes is None:
+            node.attributes = []
+        attributes = node.attributes
+        for i in range(0, len(attributes) - 1, 2):
+            if attributes[i] == event.name:
+                attributes[i + 1] = event.value
+                return
+        attributes.extend([event.name, event.value])
+
+    def __on_attribute_removed(self, event):
+        node = self.nodes.get(event.node_id)
+        if not node or not node.attributes:
+            return
+        attributes = node.attributes
+        for i in range(0, len(attributes) - 1, 2):
+            if attributes[i] == event.name:
+                del attributes[i:i + 2]
+                return
+
+    def __on_character_data(self, event):
+        node = self.nodes.get(event.node_id)
+        if node:
+            node.node_value = event.character_data
+
+    def __on_shadow_root_pushed(self, event):
+        host = self.nodes.get(event.host_id)
+        if not host:
+            return
+        host.shadow_roots = (host.shadow_roots or []) + [event.root]
+        self.__index(event.root)
+
+    def __on_shadow_root_popped(self, event):
+        host = self.nodes.get(event.host_id)
+        if not host or not host.shadow_roots:
+            return
+        for root in host.shadow_roots:
+            if root.node_id == event.root_id:
+                self.__unindex(root)
+        host.shadow_roots = [
+            root for root in host.shadow_roots
+            if root.node_id != event.root_id
+        ]
+
+    def __on_pseudo_element_added(self, event):
+        parent = self.nodes.get(event.parent_id)
+        if not parent:
+            return
+        parent.pseudo_elements = (
+            (parent.pseudo_elements or []) + [event.pseudo_element]
+        )
+        self.__index(event.pseudo_element)
+
+    def __on_pseudo_element_removed(self, event):
+        parent = self.nodes.get(event.parent_id)
+        if not parent or not parent.pseudo_elements:
+            return
+        for pseudo_element in parent.pseudo_elements:
+            if pseudo_element.node_id == event.pseudo_element_id:
+                self.__unindex(pseudo_element)
+        parent.pseudo_elements = [
+            pseudo_element for pseudo_element in parent.pseudo_elements
+            if pseudo_element.node_id != event.pseudo_element_id
+        ]
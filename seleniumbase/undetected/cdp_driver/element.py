@@ -233,9 +233,8 @@ class Element:
     async def remove_from_dom_async(self):
         """Removes element from DOM."""
         await self.update()  # Ensure we have latest node_id
-        node = util.filter_recurse(
-            self._tree,
-            lambda node: node.backend_node_id == self.backend_node_id
+        node = self._tab._dom.find_node(
+            self._tree, backend_node_id=self.backend_node_id
         )
         if node:
             await self.tab.send(cdp.dom.remove_node(node.node_id))
@@ -260,11 +259,11 @@ class Element:
             # self._children.clear()
             self._parent = None
         else:
-            doc = await self._tab.send(cdp.dom.get_document(-1, True))
+            doc = await self._tab._dom.get_document(complete=True)
             self._parent = None
         # if self.node_name != "IFRAME":
-        updated_node = util.filter_recurse(
-            doc, lambda n: n.backend_node_id == self._node.backend_node_id
+        updated_node = self._tab._dom.find_node(
+            doc, backend_node_id=self._node.backend_node_id
         )
         if updated_node:
             logger.debug("Node changed, and has now been updated.")
@@ -276,8 +275,8 @@ class Element:
         # self.attrs.clear()
         self._make_attrs()
         if self.node_name != "IFRAME":
-            parent_node = util.filter_recurse(
-                doc, lambda n: n.node_id == self.node.parent_id
+            parent_node = self._tab._dom.find_node(
+                doc, node_id=self.node.parent_id
             )
             if not parent_node:
                 # Could happen if node is for example <html>
@@ -312,8 +311,8 @@ class Element:
             raise RuntimeError(
                 "Could not get parent since the element has no tree set."
             )
-        parent_node = util.filter_recurse(
-            self.tree, lambda n: n.node_id == self.parent_id
+        parent_node = self._tab._dom.find_node(
+            self.tree, node_id=self.parent_id
         )
         if not parent_node:
             return None
@@ -364,16 +363,18 @@ class Element:
 
     async def click_async(self):
         """Click the element."""
-        self._remote_object = await self._tab.send(
-            cdp.dom.resolve_node(
-                backend_node_id=self.backend_node_id
-            )
+        script = 'sessionStorage.getItem("pxsid") !== null;'
+        self._remote_object, using_px = await asyncio.gather(
+            self._tab.send(
+                cdp.dom.resolve_node(
+                    backend_node_id=self.backend_node_id
+                )
+            ),
+            self.tab.evaluate(script),
         )
         arguments = [cdp.runtime.CallArgument(
             object_id=self._remote_object.object_id
         )]
-        script = 'sessionStorage.getItem("pxsid") !== null;'
-        using_px = await self.tab.evaluate(script)
         if not using_px:
             await self.flash_async(0.25)
         await self._tab.send(
@@ -496,16 +497,18 @@ class Element:
                 Bit field representing pressed modifier keys.
                 Alt=1, Ctrl=2, Meta/Command=4, Shift=8 (default: 0).
         """
+        script = 'sessionStorage.getItem("pxsid") !== null;'
+        position, using_px = await asyncio.gather(
+            self.get_position_async(), self.tab.evaluate(script)
+        )
         try:
-            center = (await self.get_position_async()).center
+            center = position.center
         except AttributeError:
             return
         if not center:
             logger.warning("Could not calculate box model for %s", self)
             return
         logger.debug("Clicking on location: %.2f, %.2f" % center)
-        script = 'sessionStorage.getItem("pxsid") !== null;'
-        using_px = await self.tab.evaluate(script)
         if not using_px:
             asyncio.create_task(self.flash_async(0.25))
         asyncio.create_task(
@@ -699,15 +702,16 @@ class Element:
                 )
                 for i in range(steps + 1)
             ]
-            for point in pathway:
-                await self._tab.send(
+            await self._tab.send_many(
+                *[
                     cdp.input_.dispatch_mouse_event(
                         "mouseMoved",
                         x=point[0],
                         y=point[1],
                     )
-                )
-                await asyncio.sleep(0)
+                    for point in pathway
+                ]
+            )
         await self._tab.send(
             cdp.input_.dispatch_mouse_event(
                 type_="mouseReleased",
@@ -748,12 +752,12 @@ class Element:
         :return: None
         """
         await self.apply("(elem) => elem.focus()")
-        [
-            await self._tab.send(
+        await self._tab.send_many(
+            *[
                 cdp.input_.dispatch_key_event("char", text=char)
-            )
-            for char in list(text)
-        ]
+                for char in list(text)
+            ]
+        )
 
     async def send_file_async(self, *file_paths: PathLike):
         """
@@ -1044,19 +1048,21 @@ class Element:
         """
         if getattr(self, "_is_highlighted", False):
             del self._is_highlighted
-            await self.tab.send(cdp.overlay.hide_highlight())
-            await self.tab.send(cdp.dom.disable())
-            await self.tab.send(cdp.overlay.disable())
+            await self.tab.send_many(
+                cdp.overlay.hide_highlight(),
+                cdp.dom.disable(),
+                cdp.overlay.disable(),
+            )
             return
-        await self.tab.send(cdp.dom.enable())
-        await self.tab.send(cdp.overlay.enable())
         conf = cdp.overlay.HighlightConfig(
             show_info=True, show_extension_lines=True, show_styles=True
         )
-        await self.tab.send(
+        await self.tab.send_many(
+            cdp.dom.enable(),
+            cdp.overlay.enable(),
             cdp.overlay.highlight_node(
                 highlight_config=conf, backend_node_id=self.backend_node_id
-            )
+            ),
         )
         setattr(self, "_is_highlighted", 1)
 
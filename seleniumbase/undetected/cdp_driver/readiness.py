@@ -0,0 +1,184 @@
+"""
+Readiness signals for navigation in CDP Mode.
+Instead of sleeping for a fixed time after a page is opened, wait for
+Page.loadEventFired (or Page.frameStoppedLoading of the main frame),
+with the old fixed pause used as the upper bound of the wait.
+The Page domain is enabled once per tab (on the first navigation),
+and the events are recorded as they arrive, so a signal that fires
+before the wait starts isn't missed.
+Each navigation also gets a NavigationTiming, which shows where the
+time went. (Eg. sb.cdp.get_navigation_timing() after sb.cdp.open(url))
+"""
+from __future__ import annotations
+import asyncio
+import logging
+import time
+import mycdp as cdp
+
+logger = logging.getLogger(__name__)
+
+
+class NavigationTiming:
+    """
+    The time breakdown of one navigation. (All values are seconds)
+    steps: How long each step took, in order. (They add up to the total)
+    events: When each browser signal arrived (since the start).
+    """
+
+    def __init__(self, url=None):
+        self.url = url
+        self.start_time = time.perf_counter()
+        self._last_time = self.start_time
+        self.steps = {}
+        self.events = {}
+
+    def mark_step(self, name):
+        """Ends a step. (The step started when the last one ended)"""
+        now = time.perf_counter()
+        self.steps[name] = self.steps.get(name, 0) + now - self._last_time
+        self._last_time = now
+
+    def mark_event(self, name):
+        """Records the first time that a browser signal arrived."""
+        if name not in self.events:
+            self.events[name] = time.perf_counter() - self.start_time
+
+    def add_events(self, other):
+        """Copies the browser signals of another NavigationTiming.
+        (The times are changed so that they're relative to this one)"""
+        offset = other.start_time - self.start_time
+        for name, when in other.events.items():
+            self.events.setdefault(name, when + offset)
+
+    @property
+    def total(self):
+        return self._last_time - self.start_time
+
+    def as_dict(self):
+        return {
+            "url": self.url,
+            "steps": {k: round(v, 4) for k, v in self.steps.items()},
+            "events": {k: round(v, 4) for k, v in self.events.items()},
+            "total": round(self.total, 4),
+        }
+
+    def __repr__(self):
+        steps = " ".join("%s=%.3fs" % kv for kv in self.steps.items())
+        return "<NavigationTiming %s total=%.3fs>" % (steps, self.total)
+
+
+class PageReadiness:
+    def __init__(self, connection):
+        self.connection = connection
+        self.timing = None  # The NavigationTiming of the last navigation
+        self._frame_id = None
+        self._loaded = asyncio.Event()
+        self._loaded.set()  # (Nothing is loading yet)
+        self._handlers_added = False
+
+    async def enable(self):
+        """Adds the Page event handlers, and enables the Page domain."""
+        connection = self.connection
+        if not self._handlers_added:
+            self._handlers_added = True
+            connection.add_handler(
+                cdp.page.DomContentEventFired, self.__on_dom_content_loaded
+            )
+            connection.add_handler(
+                cdp.page.LoadEventFired, self.__on_load_event_fired
+            )
+            connection.add_handler(
+                cdp.page.FrameStoppedLoading, self.__on_frame_stopped_loading
+            )
+        if cdp.page not in connection.enabled_domains:
+            connection.enabled_domains.append(cdp.page)
+            await connection.send(cdp.page.enable())
+
+    def expect_load(self, url=None):
+        """Called right before a navigation starts."""
+        self.timing = NavigationTiming(url)
+        self._frame_id = None
+        self._loaded.clear()
+
+    def set_loaded(self, event_name="load"):
+        if self.timing:
+            self.timing.mark_event(event_name)
+        self._loaded.set()
+
+    def is_loaded(self):
+        return self._loaded.is_set()
+
+    async def wait_for_load(self, timeout):
+        """Waits for the page to load, for at most timeout seconds.
+        Returns True if the page loaded, or False if the time ran out."""
+        if self._loaded.is_set():
+            return True
+        try:
+            await asyncio.wait_for(self._loaded.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def __is_main_frame(self, frame_id):
+        target_id = getattr(self.connection, "target_id", None)
+        return frame_id in (self._frame_id, target_id)
+
+    def __on_dom_content_loaded(self, event):
+        if self.timing and not self._loaded.is_set():
+            self.timing.mark_event("dom_content_loaded")
+
+    def __on_load_event_fired(self, event):
+        if not self._loaded.is_set():
+            self.set_loaded("load_event")
+
+    def __on_frame_stopped_loading(self, event):
+        if not self._loaded.is_set() and self.__is_main_frame(event.frame_id):
+            self.set_loaded("frame_stopped_loading")
+
+
+def get_readiness(connection) -> PageReadiness:
+    """Returns the PageReadiness of a tab (or any page connection)."""
+    readiness = getattr(connection, "_readiness", None)
+    if readiness is None:
+        readiness = PageReadiness(connection)
+        connection._readiness = readiness
+    return readiness
+
+
+async def navigate(connection, url):
+    """
+    Sends Page.navigate and starts watching for the load signals.
+    Returns the result of Page.navigate:
+        (frame_id, loader_id, error_text, is_download)
+    """
+    readiness = get_readiness(connection)
+    try:
+        await readiness.enable()
+    except Exception:
+        logger.debug("Couldn't enable the Page domain", exc_info=True)
+    readiness.expect_load(url)
+    result = await connection.send(cdp.page.navigate(url))
+    readiness.timing.mark_event("navigate_response")
+    if result:
+        frame_id, loader_id, _, is_download = (list(result) + [None] * 4)[:4]
+        readiness._frame_id = frame_id
+        if not loader_id or is_download:
+            # A same-document navigation (Eg. "#anchor") or a download
+            # doesn't load a new page, so there's nothing to wait for.
+            readiness.set_loaded("no_load_needed")
+    else:
+        readiness.set_loaded("navigate_failed")
+    return result
+
+
+async def wait_for_idle(connection, timeout):
+    """Waits until the connection has no new messages (for a moment),
+    for at most timeout seconds. Returns True if it became idle."""
+    listener = getattr(connection, "listener", None)
+    if not listener:
+        return False
+    try:
+        await asyncio.wait_for(listener.idle.wait(), timeout)
+        return True
+    except asyncio.TimeoutError:
+        return False
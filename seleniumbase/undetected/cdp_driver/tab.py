@@ -2,6 +2,7 @@ from __future__ import annotations
 import asyncio
 import base64
 import datetime
+import json
 import logging
 import pathlib
 import re
@@ -16,9 +17,10 @@ from seleniumbase.fixtures import shared_utils
 from typing import Dict, List, Union, Optional, Tuple
 from . import browser as cdp_browser
 from . import element
-from . import cdp_util as util
 from .config import PathLike
 from .connection import Connection, ProtocolException
+from .dom_mirror import DomMirror
+from . import readiness
 import mycdp as cdp
 
 logger = logging.getLogger(__name__)
@@ -141,9 +143,20 @@ class Tab(Connection):
     ):
         super().__init__(websocket_url, target, browser, **kwargs)
         self.browser = browser
-        self._dom = None
+        self._dom = DomMirror(self)
         self._window_id = None
 
+    def _new_transaction(self, cdp_obj):
+        tx = super()._new_transaction(cdp_obj)
+        if getattr(self, "_dom", None):
+            self._dom.on_command(tx)
+        return tx
+
+    async def aclose(self):
+        if getattr(self, "_dom", None):
+            self._dom.invalidate()  # Node ids don't survive reconnecting
+        await super().aclose()
+
     async def __aenter__(self):
         return self
 
@@ -364,9 +377,7 @@ class Tab(Connection):
                 )
         else:
             if not kwargs:
-                frame_id, loader_id, *_ = await self.send(
-                    cdp.page.navigate(url)
-                )
+                await readiness.navigate(self, url)
                 await self
                 return self
             else:
@@ -391,8 +402,9 @@ class Tab(Connection):
         :type selector: str
         :param _node: internal use
         """
+        fetch_count = self._dom.fetch_count
         if not _node:
-            doc: cdp.dom.Node = await self.send(cdp.dom.get_document(-1, True))
+            doc: cdp.dom.Node = await self._dom.get_document()
         else:
             doc = _node
             if _node.node_name == "IFRAME":
@@ -423,9 +435,13 @@ class Tab(Connection):
             return []
         items = []
         for nid in node_ids:
-            node = util.filter_recurse(doc, lambda n: n.node_id == nid)
+            node = self._dom.find_node(doc, node_id=nid)
             # Pass along the retrieved document tree to improve performance.
             if not node:
+                if not _node and fetch_count == self._dom.fetch_count:
+                    # The DOM mirror is missing a node. Fetch it again.
+                    self._dom.invalidate()
+                    return await self.query_selector_all(selector)
                 continue
             elem = element.create(node, self, doc)
             items.append(elem)
@@ -442,8 +458,9 @@ class Tab(Connection):
         :type selector: str
         """
         selector = selector.strip()
+        fetch_count = self._dom.fetch_count
         if not _node:
-            doc: cdp.dom.Node = await self.send(cdp.dom.get_document(-1, True))
+            doc: cdp.dom.Node = await self._dom.get_document()
         else:
             doc = _node
             if _node.node_name == "IFRAME":
@@ -472,96 +489,203 @@ class Tab(Connection):
                 raise
         if not node_id:
             return
-        node = util.filter_recurse(doc, lambda n: n.node_id == node_id)
+        node = self._dom.find_node(doc, node_id=node_id)
         if not node:
+            if not _node and fetch_count == self._dom.fetch_count:
+                # The DOM mirror is missing a node. Fetch it again.
+                self._dom.invalidate()
+                return await self.query_selector(selector)
             return
         return element.create(node, self, doc)
 
+    async def __search_text(
+        self, text: str, best_match=False, limit=0, _retried=False
+    ):
+        """
+        Searches the page for text, in the page itself. (Like the plain text,
+        XPath, and CSS Selector searches of DOM.performSearch, including
+        open shadow roots and same-origin iframes.) Only the matching nodes
+        are sent back, so the cost depends on the number of matches instead
+        of the size of the document. Text nodes are replaced by their
+        enclosing elements, and the results are unique.
+        :param best_match: Sort the results by how close the length of
+            their text is to the length of the text searched for.
+        :param limit: The maximum number of results. (0 for no limit.)
+        """
+        js_code = """(function(query, bestMatch, limit) {
+            var textQuery = query.toLowerCase();
+            var tagQuery = query.toLowerCase();
+            var startTag = tagQuery.charAt(0) === "<";
+            var endTag = tagQuery.length > 1 && tagQuery.slice(-1) === ">";
+            tagQuery = tagQuery.slice(startTag ? 1 : 0,
+                                      tagQuery.length - (endTag ? 1 : 0));
+            var attrQuery = query;
+            var exactAttr = attrQuery.length > 1
+                && attrQuery.charAt(0) === '"' && attrQuery.slice(-1) === '"';
+            if (exactAttr) { attrQuery = attrQuery.slice(1, -1); }
+            var results = [];
+            var docs = [];
+            function add(node) {
+                var el = node;
+                if (!node || [1, 3, 4, 8].indexOf(node.nodeType) < 0) {
+                    return false;  // (Eg. An Attr from "//a/@href")
+                }
+                if (node.nodeType !== 1) { el = node.parentNode; }
+                if (!el) { return false; }
+                if (results.indexOf(el) < 0) { results.push(el); }
+                return limit && !bestMatch && results.length >= limit;
+            }
+            function isMatch(node) {
+                if (node.nodeType !== 1) {
+                    return (node.nodeValue || "").toLowerCase().indexOf(
+                        textQuery) >= 0;
+                }
+                var name = node.nodeName.toLowerCase();
+                if (tagQuery && (startTag ? (endTag ? name === tagQuery
+                        : name.indexOf(tagQuery) === 0)
+                        : (endTag ? name.slice(-tagQuery.length) === tagQuery
+                        : name.indexOf(tagQuery) >= 0))) {
+                    return true;
+                }
+                var attrs = node.attributes || [];
+                for (var i = 0; i < attrs.length; i++) {
+                    if (attrs[i].localName.indexOf(query) >= 0) {
+                        return true;
+                    }
+                    var pos = attrs[i].value.indexOf(attrQuery);
+                    if (pos >= 0 && (!exactAttr || (pos === 0
+                            && attrs[i].value.length === attrQuery.length))) {
+                        return true;
+                    }
+                }
+                return false;
+            }
+            function walk(root) {
+                var walker = document.createTreeWalker(root, 1 | 4 | 8 | 128);
+                var node = walker.currentNode;
+                while (node) {
+                    if (node.nodeType !== 9 && node.nodeType !== 11
+                            && isMatch(node) && add(node)) {
+                        return true;
+                    }
+                    if (node.nodeType === 9) { docs.push(node); }
+                    if (node.shadowRoot && walk(node.shadowRoot)) {
+                        return true;
+                    }
+                    if (/^i?frame$/i.test(node.nodeName)) {
+                        var frameDoc = null;
+                        try { frameDoc = node.contentDocument; } catch (e) {}
+                        if (frameDoc && walk(frameDoc)) { return true; }
+                    }
+                    node = walker.nextNode();
+                }
+                return false;
+            }
+            if (walk(document)) { return results; }
+            for (var d = 0; d < docs.length; d++) {
+                try {
+                    var snapshot = docs[d].evaluate(query, docs[d], null,
+                        XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+                    for (var i = 0; i < snapshot.snapshotLength; i++) {
+                        if (add(snapshot.snapshotItem(i))) { return results; }
+                    }
+                } catch (e) {}
+                try {
+                    var found = docs[d].querySelectorAll(query);
+                    for (var i = 0; i < found.length; i++) {
+                        if (add(found[i])) { return results; }
+                    }
+                } catch (e) {}
+            }
+            if (bestMatch) {
+                var textLength = function(el) {
+                    var tag = (el.nodeName || "").toUpperCase();
+                    if ((tag === "INPUT" || tag === "TEXTAREA")
+                            && typeof el.value === "string") {
+                        return el.value.length;
+                    }
+                    return (el.textContent || "").trim().length;
+                };
+                var ranked = results.map(function(el, i) {
+                    return [Math.abs(textLength(el) - query.length), i, el];
+                });
+                ranked.sort(function(a, b) {
+                    return a[0] - b[0] || a[1] - b[1];
+                });
+                results = ranked.map(function(r) { return r[2]; });
+            }
+            return limit ? results.slice(0, limit) : results;
+        })(%s, %s, %s)""" % (
+            json.dumps(text),
+            json.dumps(bool(best_match)),
+            int(limit or 0),
+        )
+        fetch_count = self._dom.fetch_count
+        doc = await self._dom.get_document()
+        if not doc:
+            return []
+        object_group = "sb_text_search"
+        try:
+            remote_object, errors = await self.send(
+                cdp.runtime.evaluate(
+                    expression=js_code,
+                    object_group=object_group,
+                    return_by_value=False,
+                    allow_unsafe_eval_blocked_by_csp=True,
+                )
+            )
+            if errors or not remote_object or not remote_object.object_id:
+                return []
+            properties = (
+                await self.send(
+                    cdp.runtime.get_properties(
+                        remote_object.object_id, own_properties=True
+                    )
+                )
+            )[0]
+            object_ids = [
+                prop.value.object_id
+                for prop in sorted(
+                    [p for p in properties if p.name.isdigit()],
+                    key=lambda p: int(p.name),
+                )
+                if prop.value and prop.value.object_id
+            ]
+            if not object_ids:
+                return []
+            # The paths to the nodes arrive as DOM.setChildNodes events,
+            # which the DOM mirror applies before the responses.
+            node_ids = await self.send_many(
+                *[cdp.dom.request_node(oid) for oid in object_ids]
+            )
+        finally:
+            await self.send(cdp.runtime.release_object_group(object_group))
+        items = []
+        for node_id in node_ids:
+            node = self._dom.nodes.get(node_id) if node_id else None
+            if not node:
+                if not _retried and fetch_count == self._dom.fetch_count:
+                    # The DOM mirror is missing a node. Fetch it again (once).
+                    # (Nodes that are still missing after that are skipped.)
+                    self._dom.invalidate()
+                    return await self.__search_text(
+                        text, best_match, limit, _retried=True
+                    )
+                continue
+            items.append(element.create(node, self, self._dom.document))
+        return items
+
     async def find_elements_by_text(
         self,
         text: str,
     ) -> List[element.Element]:
         """
-        Returns element which match the given text.
+        Returns elements which match the given text.
         Note: This may (or will) also return any other element
         (like inline scripts), which happen to contain that text.
         :param text:
         """
-        text = text.strip()
-        doc = await self.send(cdp.dom.get_document(-1, True))
-        search_id, nresult = await self.send(
-            cdp.dom.perform_search(text, True)
-        )
-        if not nresult:
-            return []
-        if nresult:
-            node_ids = await self.send(
-                cdp.dom.get_search_results(search_id, 0, nresult)
-            )
-        else:
-            node_ids = []
-        await self.send(cdp.dom.discard_search_results(search_id))
-        items = []
-        for nid in node_ids:
-            node = util.filter_recurse(doc, lambda n: n.node_id == nid)
-            if not node:
-                node = await self.send(cdp.dom.resolve_node(node_id=nid))
-                if not node:
-                    continue
-                # remote_object = await self.send(
-                #    cdp.dom.resolve_node(backend_node_id=node.backend_node_id)
-                # )
-                # node_id = await self.send(
-                #    cdp.dom.request_node(object_id=remote_object.object_id)
-                # )
-            try:
-                elem = element.create(node, self, doc)
-            except BaseException:
-                continue
-            if elem.node_type == 3:
-                # If found element is a text node (which is plain text,
-                # and useless for our purpose), we return the parent element
-                # of the node (which is often a tag which can have text
-                # between their opening and closing tags (that is most tags,
-                # except for example "img" and "video", "br").
-                if not elem.parent:
-                    # Check if parent actually has a parent
-                    # and update it to be absolutely sure.
-                    await elem.update()
-                items.append(
-                    elem.parent or elem
-                )  # When there's no parent, use the text node itself.
-                continue
-            else:
-                # Add the element itself.
-                items.append(elem)
-        # Since we already fetched the entire doc, including shadow and frames,
-        # let's also search through the iframes.
-        iframes = util.filter_recurse_all(
-            doc, lambda node: node.node_name == "IFRAME"
-        )
-        if iframes:
-            iframes_elems = [
-                element.create(iframe, self, iframe.content_document)
-                for iframe in iframes
-            ]
-            for iframe_elem in iframes_elems:
-                if iframe_elem.content_document:
-                    iframe_text_nodes = util.filter_recurse_all(
-                        iframe_elem,
-                        lambda node: node.node_type == 3  # noqa
-                        and text.lower() in node.node_value.lower(),
-                    )
-                    if iframe_text_nodes:
-                        iframe_text_elems = [
-                            element.create(text_node, self, iframe_elem.tree)
-                            for text_node in iframe_text_nodes
-                        ]
-                        items.extend(
-                            text_node.parent for text_node in iframe_text_elems
-                        )
-        await self.send(cdp.dom.disable())
-        return items or []
+        return await self.__search_text(text.strip())
 
     async def find_element_by_text(
         self,
@@ -573,90 +697,15 @@ class Tab(Connection):
         Finds and returns the first element containing <text>, or best match.
         :param text:
         :param best_match:
-            When True, which is MUCH more expensive (thus much slower),
-            will find the closest match based on length.
+            When True, will find the closest match based on length.
             When searching for "login", you probably want the button element,
             and not thousands of tags/scripts containing the "login" string.
         :type best_match: bool
         :param return_enclosing_element:
         """
-        doc = await self.send(cdp.dom.get_document(-1, True))
-        text = text.strip()
-        search_id, nresult = await self.send(
-            cdp.dom.perform_search(text, True)
-        )
-        if not nresult:
-            return
-        node_ids = await self.send(
-            cdp.dom.get_search_results(search_id, 0, nresult)
-        )
-        await self.send(cdp.dom.discard_search_results(search_id))
-        if not node_ids:
-            node_ids = []
-        items = []
-        for nid in node_ids:
-            node = util.filter_recurse(doc, lambda n: n.node_id == nid)
-            try:
-                elem = element.create(node, self, doc)
-            except BaseException:
-                continue
-            if elem.node_type == 3:
-                # If found element is a text node
-                # (which is plain text, and useless for our purpose),
-                # then return the parent element of the node
-                # (which is often a tag which can have text between their
-                # opening and closing tags (that is most tags,
-                # except for example "img" and "video", "br").
-                if not elem.parent:
-                    # Check if parent has a parent, and update it to be sure.
-                    await elem.update()
-                items.append(
-                    elem.parent or elem
-                )  # When it really has no parent, use the text node itself
-                continue
-            else:
-                # Add the element itself
-                items.append(elem)
-        # Since the entire doc is already fetched, including shadow and frames,
-        # also search through the iframes.
-        iframes = util.filter_recurse_all(
-            doc, lambda node: node.node_name == "IFRAME"
-        )
-        if iframes:
-            iframes_elems = [
-                element.create(iframe, self, iframe.content_document)
-                for iframe in iframes
-            ]
-            for iframe_elem in iframes_elems:
-                iframe_text_nodes = util.filter_recurse_all(
-                    iframe_elem,
-                    lambda node: node.node_type == 3  # noqa
-                    and text.lower() in node.node_value.lower(),
-                )
-                if iframe_text_nodes:
-                    iframe_text_elems = [
-                        element.create(text_node, self, iframe_elem.tree)
-                        for text_node in iframe_text_nodes
-                    ]
-                    items.extend(
-                        text_node.parent for text_node in iframe_text_elems
-                    )
-        try:
-            if not items:
-                return
-            if best_match:
-                closest_by_length = min(
-                    items, key=lambda el: abs(len(text) - len(el.text_all))
-                )
-                elem = closest_by_length or items[0]
-                return elem
-            else:
-                # Return the first result
-                for elem in items:
-                    if elem:
-                        return elem
-        finally:
-            await self.send(cdp.dom.disable())
+        items = await self.__search_text(text.strip(), best_match, limit=1)
+        if items:
+            return items[0]
 
     async def back(self):
         """History back"""
@@ -898,7 +947,7 @@ class Tab(Connection):
 
     async def get_content(self):
         """Gets the current page source content (html)"""
-        doc: cdp.dom.Node = await self.send(cdp.dom.get_document(-1, True))
+        doc: cdp.dom.Node = await self._dom.get_document()
         return await self.send(
             cdp.dom.get_outer_html(
                 backend_node_id=doc.backend_node_id,